@@ -0,0 +1,739 @@
+# SPDX-License-Identifier: MIT
+"""Micro-benchmarks for hot paths."""
+
+import argparse
+import pprint
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import types
+import warnings
+
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import NamedTuple
+
+from fnattr.extra import tellico_sqlite3_rename as tellico
+from fnattr.util import checksum, escape, fearmat
+from fnattr.util.multimap import MultiMap
+from fnattr.vlju.types.doi import DOI
+from fnattr.vlju.types.doi.org import OrgData, organization
+from fnattr.vlju import Vlju
+from fnattr.vlju.types.all import VLJU_TYPES
+from fnattr.vlju.types.site import SiteBase, SiteMatcher, site_class
+from fnattr.vlju.types.uri import URI
+from fnattr.vlju.types.ean import (
+    is_valid_ean13,
+    is_valid_ean13_many,
+)
+from fnattr.vlju.types.ean.isbn import (
+    ISBN,
+    PrefixRanges,
+    RangeData,
+    Ranges,
+    is_valid_isbn10,
+    is_valid_isbn13,
+    map_ranges,
+)
+from fnattr.vljum.m import M
+from fnattr.vljumap import VljuMap, enc
+from fnattr.vljumap.batch import VljuBatch
+from fnattr.vljumap.factory import (
+    InterningFactory,
+    LazyFactory,
+    LooseMappedFactory,
+    VljuFactory,
+)
+
+Case = Mapping[str, Callable[[], object]]
+
+WORDS = ('the', 'art', 'of', 'computer', 'programming', 'structure',
+         'interpretation', 'programs', 'Ærø', 'naïve', 'systems', 'design',
+         'data', 'notes', 'volume', 'introduction', 'café', 'guide')
+AUTHORS = ('Donald Knuth', 'Harold Abelson', 'Gerald Jay Sussman',
+           'Paul Penman', 'Ada Lovelace', 'Grace Hopper', 'Édith Piaf')
+
+def corpus(n: int = 10_000, seed: int = 1) -> list[str]:
+    """Return `n` v3 file name stems resembling a document library."""
+    rng = random.Random(seed)
+    return [_stem(rng) for _ in range(n)]
+
+def _stem(rng: random.Random) -> str:
+    parts = []
+    if rng.random() < 0.2:
+        parts.append('.'.join(
+            str(rng.randint(1, 20)) for _ in range(rng.randint(1, 3))) + '.')
+    titles = [
+        ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 6))).title()
+        for _ in range(rng.choice((1, 1, 1, 2)))
+    ]
+    if rng.random() < 0.05:
+        titles[0] += '%3F'
+    parts.append(' - '.join(titles))
+    attrs = [f'a={a}' for a in rng.sample(AUTHORS, rng.randint(0, 3))]
+    if rng.random() < 0.7:
+        attrs.append(f'isbn=978{rng.randrange(10**10):010}')
+    if rng.random() < 0.4:
+        attrs.append(f'date={rng.randint(1950, 2025)}')
+    if rng.random() < 0.2:
+        attrs.append(f'edition={rng.randint(2, 9)}')
+    if rng.random() < 0.1:
+        attrs.append('doi=10.1234/abc%3Bdef')
+    if attrs:
+        parts.append('[' + '; '.join(attrs) + ']')
+    return ' '.join(parts)
+
+# Original multi-pass v3 decoder, kept as a reference for comparison.
+
+def reference_v3_dec_iter(config: enc.V3Config,
+                          s: str) -> Iterable[tuple[str, str]]:
+    if config.attr_start in s:
+        s, _, attr = s.partition(config.attr_start)
+    else:
+        attr = ''
+    if s:
+        sequence, title = _reference_v3_dec_seq(config, s)
+        for v in sequence:
+            yield ('n', v)
+        if title:
+            for i in title.split(config.title_join):
+                yield ('title', escape.winfile.decode(i.strip()))
+    if attr:
+        for k, v in _reference_v3_dec_attr(config, attr):
+            yield (k, v)
+
+def _reference_v3_dec_attr(config: enc.V3Config,
+                           s: str) -> Iterable[tuple[str, str]]:
+    if s.endswith(config.attr_end):
+        s = s[:-1]
+    else:
+        warnings.warn(f"Expected '{config.attr_end}' after '{s}'", stacklevel=0)
+    for kv in s.split(config.attr_join.strip()):
+        if config.attr_kv in kv:
+            k, v = kv.split(config.attr_kv, 1)
+        else:
+            k = kv
+            v = ''
+        k = escape.winfile.decode(k.strip())
+        v = escape.winfile.decode(v.strip())
+        if not k:
+            continue
+        yield (k, v)
+
+def _reference_v3_dec_seq(config: enc.V3Config,
+                          s: str) -> tuple[Iterable[str], str]:
+    if config.seq_end not in s:
+        return ([], s)
+    seq: list[str] = []
+    t = s
+    lj = len(config.seq_join)
+    while (((i := t.find(config.seq_join)) > 0) and t[: i].isalnum()
+           and t[i + lj].isalnum() and t[0].isdigit()):
+        seq.append(t[: i])
+        t = t[(i + lj):]
+    if ((i := t.find(config.seq_end)) > 0 and t[: i].isalnum()
+            and t[0].isdigit()):
+        seq.append(t[: i])
+        t = t[(i + len(config.seq_end)):]
+        return (seq, t.strip())
+    return ([], s)
+
+# Original v3 encoder, materializing a string MultiMap, kept as a reference.
+
+def reference_v3_enc(config: enc.V3Config, n: VljuMap,
+                     mode: str | None) -> str:
+    m = n.to_strings(mode)
+
+    sequence = config.seq_join.join(m['n'])
+    sequence = sequence and f'{config.seq_start}{sequence}{config.seq_end}'
+    title_qjoin = config.title_join.translate(
+        escape.mktrans_urlish(config.title_join.strip()))
+    title = config.title_join.join(
+        config.quote.encode(i).replace(config.title_join, title_qjoin)
+        for i in m['title'])
+    attrs = config.attr_join.join(
+        enc.kv_fmt(k, v, config.attr_kv, config.quote)
+        for k, v in m.pairs()
+        if k not in ('title', 'n'))
+    attrs = attrs and f'{config.attr_start}{attrs}{config.attr_end}'
+    return enc.join_non_empty(' ', sequence, title, attrs)
+
+# Original regular expression tail parsing for v0 and sfc, kept as a reference.
+
+REFERENCE_V0_RE = re.compile(
+    r"""
+        (?P<rest>.*)
+        \b(?:
+            (?P<isbn> (?: [0-9]{13} | [0-9]{9}[0-9xX] ) )
+        | lccn=(?P<lccn> \S+ )
+        )$
+        """, re.VERBOSE)
+
+def reference_v0_dec_tail(s: str) -> tuple[int, str, str] | None:
+    if m := REFERENCE_V0_RE.fullmatch(s):
+        k = 'isbn' if m.group('isbn') else 'lccn'
+        return (m.end('rest'), k, m.group(k))
+    return None
+
+REFERENCE_SFC_TAIL_RE = re.compile(
+    r"""
+        (?P<prefix> .*)
+        (?:
+            (?P<date> [12]\d\d\d ) |
+            (?: (?P<edition> \d+ ) \w*\s+edition )
+        )$
+        """, re.X)
+
+def reference_sfc_dec_tail(s: str) -> tuple[list[tuple[str, str]], str]:
+    tail = []
+    while True:
+        if m := REFERENCE_SFC_TAIL_RE.fullmatch(s):
+            for k in ('date', 'edition'):
+                if v := m.group(k):
+                    tail.append((k, v))
+            s = m.group('prefix').strip()
+        elif is_valid_isbn10(s[-10 :]):
+            tail.append(('isbn', s[-10 :]))
+            s = s[:-10].strip()
+        elif is_valid_isbn13(s[-13 :]):
+            tail.append(('isbn', s[-13 :]))
+            s = s[:-13].strip()
+        else:
+            break
+    return tail, s
+
+def sfc_adversarial(n: int) -> str:
+    """Return an sfc name with `n` trailing dates and editions."""
+    tokens = ('1999', '2nd edition', '0123456789', '2007')
+    return 'Title by Author ' + ' '.join(tokens[i % 4] for i in range(n))
+
+# Original list-scan MultiMap.add, kept as a reference.
+
+def reference_multimap_add(m: MultiMap, k: object, v: object) -> None:
+    if v not in m.data[k]:
+        m.data[k].append(v)
+
+# Before copy-on-write, a caller that needed its map intact afterwards had to
+# copy every value list before handing the map to a mutating consumer.
+
+def reference_eager_copy(m: M) -> M:
+    r = M()
+    for k, vlist in m.lists():
+        r.data[k] = vlist.copy()
+    return r
+
+# Benchmarks.
+
+def bench_v3_decode(n: int) -> Case:
+    stems = corpus(n)
+    config = enc.V3_CONFIG
+
+    def reference() -> None:
+        for s in stems:
+            for _ in reference_v3_dec_iter(config, s):
+                pass
+
+    def current() -> None:
+        for s in stems:
+            for _ in enc._v3_dec_iter(config, s):   # noqa: SLF001
+                pass
+
+    return {'reference': reference, 'current': current}
+
+def bench_v3_encode(n: int) -> Case:
+    maps = [M().decode(s) for s in corpus(n)]
+    config = enc.V3_CONFIG
+
+    def reference() -> None:
+        for m in maps:
+            reference_v3_enc(config, m, None)
+
+    def current() -> None:
+        for _ in enc.v3.encode_many(maps):
+            pass
+
+    return {'reference': reference, 'current': current}
+
+def bench_sfc_tail(n: int) -> Case:
+    s = sfc_adversarial(n)
+    return {
+        'reference': lambda: reference_sfc_dec_tail(s),
+        'current': lambda: enc._sfc_dec_tail(s),    # noqa: SLF001
+    }
+
+def bench_multimap_add(n: int) -> Case:
+    values = [f'v{i % (n // 2 or 1)}' for i in range(n)]
+
+    def reference() -> None:
+        m: MultiMap[str, str] = MultiMap()
+        for v in values:
+            reference_multimap_add(m, 'k', v)
+
+    def current() -> None:
+        m: MultiMap[str, str] = MultiMap()
+        for v in values:
+            m.add('k', v)
+
+    return {'reference': reference, 'current': current}
+
+def bench_tellico_shorten(n: int) -> Case:
+    maps = [M().decode(s) for s in corpus(n)]
+    for i, m in enumerate(maps):
+        for j in range(i % 5):
+            m.add('title', f'Part {j}').add('a', f'Author {j}')
+
+    def reference() -> None:
+        for m in maps:
+            tellico.destination_file(reference_eager_copy(m), 64)
+
+    def current() -> None:
+        for m in maps:
+            tellico.destination_file(m, 64)
+
+    return {'reference': reference, 'current': current}
+
+def bench_isbn_split(n: int) -> Case:
+    rng = random.Random(1)
+    isbns = [f'978{rng.randrange(10**10):010}' for _ in range(n)]
+    data = map_ranges()
+    reference = Ranges(data.start, data.split)
+    current = PrefixRanges(data.start, data.split)
+    return {
+        'reference': lambda: [reference.split(s) for s in isbns],
+        'current': lambda: current.split_many(isbns),
+    }
+
+# Original M.from_site_url, trying every site's patterns in turn.
+
+def reference_from_site_url(
+        sites: Mapping[str, type[SiteBase]],
+        url: str) -> tuple[str | None, SiteBase | None]:
+    for k, scls in sites.items():
+        if (v := scls.match_url(url)):
+            return k, scls(v)
+    return None, None
+
+def synthetic_sites(n: int) -> dict[str, type[SiteBase]]:
+    """Return `n` site classes, each with a few URL patterns."""
+    return {
+        f's{i}': site_class(
+            f'S{i}',
+            host=f'site{i}.com',
+            path='post/{id}',
+            url=[
+                rf'https?://(?:www\.)?site{i}\.com/post/(\d+)',
+                rf'https?://site{i}\.com/p\?.*\bid=(\d+)\b.*',
+                rf'https?://img\d*\.site{i}cdn\.net/.*/(\d+)_\w+\.\w+',
+            ])
+        for i in range(n)
+    }
+
+def bench_site_url(n: int) -> Case:
+    sites = synthetic_sites(300)
+    rng = random.Random(1)
+    urls = []
+    for _ in range(n):
+        i = rng.randrange(400)  # Some hosts are not configured sites.
+        urls.append(
+            rng.choice((f'https://www.site{i}.com/post/{i}',
+                        f'https://site{i}.com/p?x=1&id={i}&y=2',
+                        f'https://img2.site{i}cdn.net/a/b/{i}_x.jpg',
+                        f'https://site{i}.com/about')))
+    matcher = SiteMatcher(sites)
+    return {
+        'reference': lambda: [reference_from_site_url(sites, u) for u in urls],
+        'current': lambda: matcher.match_urls(urls),
+    }
+
+# Original fearmat, compiling the template source on every call.
+
+def reference_fearmat(template: str, values: Mapping[str, object]) -> str:
+    return str(fearmat.evaluate('f"""' + template + '"""', values,
+                                fearmat.BUILTINS))
+
+def bench_site_format(n: int) -> Case:
+    site = site_class(
+        'Pixiv',
+        host='www.pixiv.net',
+        path="en/artworks/{x.split('_')[0]}",
+        fragment="{x.split('_p')[1] if '_p' in x else ''}")
+    rng = random.Random(1)
+    items = [site(f'{rng.randrange(10**8)}_p{rng.randrange(4)}')
+             for _ in range(n)]
+
+    def reference() -> None:
+        for v in items:
+            values = {'id': v._value, 'x': v._value}   # noqa: SLF001
+            reference_fearmat(site.path_template or '', values)
+            reference_fearmat(site.fragment_template or '', values)
+
+    def current() -> None:
+        for v in items:
+            v.path()
+            v.fragment()
+
+    return {'reference': reference, 'current': current}
+
+# URI-family string forms used to be rebuilt on every call. Clearing the
+# cached forms before each use reproduces that (plus the cost of clearing).
+
+STRING_CACHES = ('_uri', '_str', '_lv')
+
+def reference_uncache(v: object) -> None:
+    for name in STRING_CACHES:
+        d = getattr(type(v), name, None)
+        if isinstance(d, types.MemberDescriptorType) and hasattr(v, name):
+            d.__delete__(v)
+    if isinstance(v, URI) and (a := v.authority()) is not None:
+        reference_uncache(a)
+
+def uri_maps(n: int) -> list[M]:
+    """Return `n` decoded maps, with a DOI or LCCN in some."""
+    maps = [M().decode(s) for s in corpus(n)]
+    for i, m in enumerate(maps):
+        if i % 3 == 0:
+            m.add('doi', f'10.{1000 + i % 97}/x{i}')
+        if i % 5 == 0:
+            m.add('lccn', f'{i % 100:02}-{i:06}')
+    return maps
+
+def bench_uri_long(n: int) -> Case:
+    maps = uri_maps(n)
+    values: list[Vlju] = [v for m in maps for _, v in m.pairs()]
+
+    def reference() -> None:
+        for m in maps:
+            for _, v in m.pairs():
+                reference_uncache(v)
+            enc.v3.encode(m, 'long')
+
+    def current() -> None:
+        for m in maps:
+            enc.v3.encode(m, 'long')
+
+    for v in values:
+        v.lv()
+    return {'reference': reference, 'current': current}
+
+def bench_uri_url(n: int) -> Case:
+    maps = uri_maps(n)
+
+    def reference() -> None:
+        for m in maps:
+            for _, v in m.pairs():
+                reference_uncache(v)
+            m.url()
+
+    def current() -> None:
+        for m in maps:
+            m.url()
+
+    return {'reference': reference, 'current': current}
+
+def bench_lazy_filter(n: int) -> Case:
+    stems = corpus(n)
+    # Each run starts with nothing remembered, as one command would.
+    loose = LooseMappedFactory(VLJU_TYPES)
+    lazy_loose = LooseMappedFactory(VLJU_TYPES)
+    lazy = LazyFactory(lazy_loose)
+
+    def reference() -> None:
+        loose.clear()
+        for s in stems:
+            _ = 'doi' in enc.v3.decode(VljuMap(), s, loose)
+
+    def current() -> None:
+        lazy.clear()
+        lazy_loose.clear()
+        for s in stems:
+            _ = 'doi' in enc.v3.decode(VljuMap(), s, lazy)
+
+    return {'reference': reference, 'current': current}
+
+def bench_lazy_roundtrip(n: int) -> Case:
+    stems = corpus(n)
+    # Each run starts with nothing remembered, as one command would.
+    loose = LooseMappedFactory(VLJU_TYPES)
+    lazy_loose = LooseMappedFactory(VLJU_TYPES)
+    lazy = LazyFactory(lazy_loose)
+
+    def reference() -> None:
+        loose.clear()
+        for s in stems:
+            enc.v3.encode(enc.v3.decode(VljuMap(), s, loose))
+
+    def current() -> None:
+        lazy.clear()
+        lazy_loose.clear()
+        for s in stems:
+            enc.v3.encode(enc.v3.decode(VljuMap(), s, lazy))
+
+    return {'reference': reference, 'current': current}
+
+# Original LooseMappedFactory, catching constructor exceptions.
+
+def reference_loose_factory(kmap: Mapping[str, type[Vlju]],
+                            k: str, v: str) -> tuple[str, Vlju]:
+    try:
+        value = kmap.get(k, Vlju)(v)
+    except Exception:   # noqa: blind-except
+        value = Vlju(v)
+    return (k, value)
+
+def dirty_corpus(n: int) -> list[str]:
+    """Return `n` stems, many with malformed ISBNs and DOIs."""
+    rng = random.Random(2)
+    stems = corpus(n)
+    for i, s in enumerate(stems):
+        bad = rng.choice(('isbn=unknown', f'isbn={rng.randrange(10**6)}',
+                          'doi=n/a', f'doi=doi {i}', 'issn=none', ''))
+        if not bad:
+            continue
+        if s.endswith(']'):
+            stems[i] = f'{s[:-1]}; {bad}]'
+        else:
+            stems[i] = f'{s} [{bad}]'
+    return stems
+
+def bench_dirty_values(n: int) -> Case:
+    config = enc.V3_CONFIG
+    pairs = [
+        kv for s in dirty_corpus(n)
+        for kv in enc._v3_dec_iter(config, s)   # noqa: SLF001
+    ]
+    factory = LooseMappedFactory(VLJU_TYPES)
+    kmap = VLJU_TYPES
+
+    def reference() -> None:
+        for k, v in pairs:
+            reference_loose_factory(kmap, k, v)
+
+    def current() -> None:
+        factory.clear()
+        for k, v in pairs:
+            factory(k, v)
+
+    return {'reference': reference, 'current': current}
+
+def bench_checksum(n: int) -> Case:
+    rng = random.Random(1)
+    eans = [f'978{rng.randrange(10**10):010}' for _ in range(n)]
+    return {
+        'reference': lambda: [is_valid_ean13(s) for s in eans],
+        'current': lambda: is_valid_ean13_many(eans),
+    }
+
+def bench_construct(n: int) -> Case:
+    # Costs of making typed values, relative to a plain Vlju.
+    rng = random.Random(1)
+    isbns = [f'978{rng.randrange(10**9):09}' for _ in range(n)]
+    isbns = [s + checksum.alt13(s) for s in isbns]
+    uris = [f'https://example.com/p/{i}?q={i}' for i in range(n)]
+    dois = [f'10.{1000 + i % 9000}/abc.{i}' for i in range(n)]
+    return {
+        'vlju': lambda: [Vlju(s) for s in uris],
+        'uri': lambda: [URI(s) for s in uris],
+        'isbn': lambda: [ISBN(s) for s in isbns],
+        'doi': lambda: [DOI(s) for s in dois],
+    }
+
+BENCHMARKS: dict[str, Callable[[int], Case]] = {
+    'v3_decode': bench_v3_decode,
+    'v3_encode': bench_v3_encode,
+    'sfc_tail': bench_sfc_tail,
+    'multimap_add': bench_multimap_add,
+    'tellico_shorten': bench_tellico_shorten,
+    'isbn_split': bench_isbn_split,
+    'checksum': bench_checksum,
+    'construct': bench_construct,
+    'site_url': bench_site_url,
+    'site_format': bench_site_format,
+    'uri_long': bench_uri_long,
+    'uri_url': bench_uri_url,
+    'lazy_filter': bench_lazy_filter,
+    'lazy_roundtrip': bench_lazy_roundtrip,
+    'dirty_values': bench_dirty_values,
+}
+
+# ISBN range data used to be a generated Python module, `isbn_ranges.py`.
+
+def reference_ranges_module(data: RangeData) -> str:
+    """Return the source of the generated module for `data`."""
+    return ''.join(('from array import array\n\nAGENCY = ',
+                    pprint.pformat(data.agencies()),
+                    f"\n\nSTART = array('Q', {list(data.start)!r})\n",
+                    f"\nSPLIT = array('I', {list(data.split)!r})\n"))
+
+# DOI organization data used to be a Python module with a nested dict.
+
+def reference_org_module(data: OrgData) -> str:
+    """Return the source of the dict module for `data`."""
+    return f'ORGANIZATION = {pprint.pformat(data.get(()))}\n'
+
+class Startup(NamedTuple):
+    module: str                     # Reference module name.
+    source: Callable[[], str]       # Reference module source.
+    setup: str                      # Untimed statements.
+    load: Mapping[str, str]         # Timed statements for each variant.
+
+STARTUP: dict[str, Startup] = {
+    'isbn_startup': Startup(
+        'isbn_ranges',
+        lambda: reference_ranges_module(map_ranges()),
+        'from fnattr.vlju.types.ean.isbn import ISBN, PrefixRanges',
+        {
+            'reference': ('from isbn_ranges import SPLIT, START\n'
+                          'PrefixRanges(START, SPLIT).split("9780804429573")'),
+            'current': 'ISBN.ranges().split("9780804429573")',
+        }),
+    'org_startup': Startup(
+        'doi_org',
+        lambda: reference_org_module(organization()),
+        'from fnattr.vlju.types.doi import org',
+        {
+            'reference': ('from doi_org import ORGANIZATION\n'
+                          'org.org((10, 1002), ORGANIZATION)'),
+            'current': 'org.org((10, 1002))',
+        }),
+}
+
+STARTUP_PROBE = """
+import re, sys, time
+from pathlib import Path
+{setup}
+sys.path.insert(0, {path!r})
+t = time.perf_counter()
+{load}
+t = time.perf_counter() - t
+status = Path('/proc/self/status').read_text()
+print(t, re.search(r'VmHWM:\\s*(\\d+)', status).group(1))
+"""
+
+def startup(name: str, repeat: int) -> list[tuple[str, float, int]]:
+    """
+    Return (variant, seconds, KiB) for loading bundled data.
+
+    Each run is a fresh interpreter, which reports the time to load the
+    data and make one lookup, and its peak resident set size (so this
+    needs Linux `/proc`). The best of `repeat` runs is reported. The
+    reference variant imports the data as a Python module from a warm
+    bytecode cache.
+    """
+    case = STARTUP[name]
+    src = str(Path(__file__).parents[2])
+    r = []
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, f'{case.module}.py').write_text(case.source(),
+                                                 encoding='utf-8')
+        for label, load in case.load.items():
+            probe = STARTUP_PROBE.format(setup=case.setup, path=tmp, load=load)
+            runs = []
+            for _ in range(repeat + 1):
+                p = subprocess.run([sys.executable, '-c', probe],
+                                   capture_output=True,
+                                   check=True,
+                                   text=True,
+                                   env={'PYTHONPATH': src})
+                t, rss = p.stdout.split()
+                runs.append((float(t), int(rss)))
+            # The first run may have compiled the module.
+            t, rss = min(runs[1 :])
+            r.append((label, t, rss))
+    return r
+
+def memory(n: int,
+           factory: VljuFactory = M.loose_factory,
+           *,
+           batch: bool = False) -> float:
+    """Return the bytes allocated per file name for decoded maps."""
+    stems = corpus(n)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        if batch:
+            held: object = VljuBatch.from_names(
+                stems, factory=factory, keep_names=False)
+        else:
+            held = [enc.v3.decode(VljuMap(), s, factory) for s in stems]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del held
+    return (after - before) / n
+
+def run(name: str, n: int, repeat: int) -> list[tuple[str, float]]:
+    """Return the best time per item, in microseconds, for each variant."""
+    return [(label, min(timeit.repeat(fn, number=1, repeat=repeat)) * 1e6 / n)
+            for label, fn in BENCHMARKS[name](n).items()]
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv
+    cmd = Path(argv[0]).stem
+    parser = argparse.ArgumentParser(
+        prog=cmd, description='Run micro-benchmarks')
+    parser.add_argument(
+        '--items',
+        '-n',
+        metavar='N',
+        type=int,
+        default=10_000,
+        help='Corpus size.')
+    parser.add_argument(
+        '--repeat',
+        '-r',
+        metavar='N',
+        type=int,
+        default=5,
+        help='Repetitions; the best is reported.')
+    parser.add_argument(
+        '--memory',
+        '-m',
+        action='store_true',
+        help='Also report memory held by decoded maps.')
+    parser.add_argument(
+        '--startup',
+        '-s',
+        action='store_true',
+        help='Also report the cost of loading bundled data.')
+    parser.add_argument(
+        'benchmark',
+        metavar='NAME',
+        type=str,
+        nargs='*',
+        help=f'Benchmark(s) to run: {", ".join(BENCHMARKS)} (default: all).')
+    args = parser.parse_args(argv[1 :])
+    if unknown := [i for i in args.benchmark if i not in BENCHMARKS]:
+        parser.error(f'unknown benchmark: {", ".join(unknown)}')
+
+    for name in args.benchmark or BENCHMARKS:
+        results = run(name, args.items, args.repeat)
+        base = results[0][1]
+        for label, t in results:
+            print(f'{name:16} {label:12} {t:9.2f} µs/item {base / t:6.2f}×')
+    if args.memory:
+        interning = InterningFactory(M.loose_factory)
+        for label, factory in (('loose', M.loose_factory),
+                               ('lazy', M.lazy_factory),
+                               ('interned', interning)):
+            b = memory(args.items, factory)
+            print(f'{"memory":16} {label:12} {b:9.0f} B/file')
+        print(f'{"memory":16} {"hit rate":12} '
+              f'{interning.stats().hit_rate():9.2%}')
+        b = memory(args.items, M.loose_factory, batch=True)
+        print(f'{"memory":16} {"batch":12} {b:9.0f} B/file')
+    if args.startup:
+        for name in STARTUP:
+            results = startup(name, args.repeat)
+            base = results[0][1]
+            for label, t, rss in results:
+                print(f'{name:16} {label:12} {t * 1e3:9.2f} ms'
+                      f'      {base / t:6.2f}× {rss:9} KiB max RSS')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -19,9 +19,12 @@ from collections.abc import (
 from pathlib import Path
 from typing import Any, Generic, Self, TypeVar
 
-from fnattr.util import log, nested
+from fnattr.util import log, nested, scan
 from fnattr.util.config import read_cmd_configs_and_merge_options
+from fnattr.util.error import Error
+from fnattr.util.parallel import ordered_map
 from fnattr.util.typecheck import needtype
+from fnattr.vljum import rename_file
 from fnattr.vljum.m import M
 from fnattr.vljumap import enc
 
@@ -207,14 +210,38 @@ def mget(m: M, msets: FrozenSets, key: str) -> frozenset:
         msets[key] = frozenset(str(a) for a in m.get(key, []))
     return msets[key]
 
-def rename(m: M, *, dryrun: bool = False) -> bool:
+def rename(file: str, modified: Path, *, dryrun: bool = False) -> bool:
     try:
-        m.rename(dryrun=dryrun, dedup=True)
+        rename_file(Path(file), modified, dedup=True, dryrun=dryrun)
     except FileExistsError:
-        logging.error('file exists: %s', m.filename())
+        logging.error('file exists: %s', modified)
         return False
     return True
 
+# Destinations used by `plan()`. This is set by `plan_init()` in each worker
+# process, since the destinations refer to `os.environ` and are not picklable.
+_destinations: Destinations | None = None
+
+def plan_init(d: Destinations) -> None:
+    global _destinations  # noqa: PLW0603
+    _destinations = d
+
+def plan(file: str) -> tuple[str, Path | None]:
+    """Return the new path for `file`, if it has a destination."""
+    if _destinations is None:
+        message = 'plan() called before plan_init()'
+        raise Error(message)
+    m = M().file(file)
+    if (dst := _destinations.match(m)) is None:
+        return file, None
+    return file, m.with_dir(dst).filename()
+
+def files(args: argparse.Namespace) -> Generator[str, None, None]:
+    yield from args.file
+    for d in args.recursive or []:
+        for e in scan.scan(d, args.include, args.exclude, args.symlinks):
+            yield e.path
+
 def main(argv: list[str] | None = None) -> int:
     if argv is None:
         argv = sys.argv
@@ -228,6 +255,12 @@ def main(argv: list[str] | None = None) -> int:
         type=str,
         action='append',
         help='Configuration file.')
+    parser.add_argument(
+        '--no-config-cache',
+        dest='config_cache',
+        action='store_false',
+        default=True,
+        help='Do not use cached configuration.')
     parser.add_argument(
         '--decoder',
         '-d',
@@ -248,6 +281,41 @@ def main(argv: list[str] | None = None) -> int:
         type=str,
         action='append',
         help='Renaming map file.')
+    parser.add_argument(
+        '--recursive',
+        '-r',
+        metavar='DIR',
+        type=str,
+        action='append',
+        help='Process files in the directory tree DIR.')
+    parser.add_argument(
+        '--include',
+        metavar='GLOB',
+        type=str,
+        action='append',
+        default=[],
+        help='With --recursive, process only file names matching GLOB.')
+    parser.add_argument(
+        '--exclude',
+        metavar='GLOB',
+        type=str,
+        action='append',
+        default=[],
+        help='With --recursive, skip file and directory names matching GLOB.')
+    parser.add_argument(
+        '--symlinks',
+        metavar='POLICY',
+        type=str,
+        choices=scan.SYMLINK_POLICIES,
+        default='files',
+        help='With --recursive, symbolic link policy.')
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        metavar='N',
+        type=int,
+        default=1,
+        help='Use N worker processes to match files.')
     parser.add_argument(
         '--log-level',
         '-L',
@@ -271,12 +339,16 @@ def main(argv: list[str] | None = None) -> int:
 
     try:
         d = Destinations.from_config(config)
-        for file in args.file:
-            m = M().file(file)
-            if not (dst := d.match(m)):
+        # Matching runs in workers; renaming stays here, in input order.
+        for file, modified in ordered_map(plan,
+                                          files(args),
+                                          args.jobs,
+                                          initializer=plan_init,
+                                          initargs=(d, )):
+            if not modified:
                 logging.info('no match: %s', file)
                 continue
-            rename(m.with_dir(dst), dryrun=args.dryrun)
+            rename(file, modified, dryrun=args.dryrun)
 
     except Exception as e:
         logging.error('Unhandled exception: %s%s', type(e).__name__, e.args)
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: MIT
+"""Generate doi/org.bin."""
+
+import argparse
+import pathlib
+import sys
+
+from collections.abc import Iterable
+
+from fnattr.vlju.types.doi import Prefix
+from fnattr.vlju.types.doi.org import OrgData
+
+def read_tsv(lines: Iterable[str]) -> Iterable[tuple[Prefix, str]]:
+    """Yield (prefix, name) from lines of ‘prefix<TAB>name’."""
+    for line in lines:
+        if line := line.rstrip('\n'):
+            prefix, name = line.split('\t', 1)
+            yield (Prefix(prefix), name)
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv
+    cmd = pathlib.Path(argv[0]).stem
+    parser = argparse.ArgumentParser(
+        prog=cmd, description='Generate DOI organization data')
+    parser.add_argument(
+        '--input',
+        '-i',
+        metavar='FILE',
+        default='third_party/data/doi_org.tsv',
+        help='Input file.')
+    parser.add_argument(
+        '--output',
+        '-o',
+        metavar='FILE',
+        default='src/fnattr/vlju/types/doi/org.bin',
+        help='Output file.')
+    args = parser.parse_args(argv[1 :])
+
+    with pathlib.Path(args.input).open(encoding='utf-8') as f:
+        data = OrgData.from_items(read_tsv(f))
+    pathlib.Path(args.output).write_bytes(data.to_bytes())
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
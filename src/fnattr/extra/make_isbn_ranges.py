@@ -1,37 +1,60 @@
 # SPDX-License-Identifier: MIT
-"""Generate isbn_ranges.py."""
+"""Generate isbn_ranges.bin, and report changes from the installed data."""
 
 # ruff: noqa: S101
 
 import argparse
 import array
-import datetime
 import logging
 import pathlib
-import pprint
 import sys
+import warnings
 import xml.etree.ElementTree as ElT
 
-from collections.abc import MutableSequence
+from collections.abc import Iterable, MutableSequence
 from pathlib import Path
-from typing import TextIO
+from typing import BinaryIO
 
-from fnattr.vlju.types.ean.isbn import RangeAgencies, Ranges
+from fnattr.util import scan
+from fnattr.vlju.types.ean import as13
+from fnattr.vlju.types.ean.isbn import (
+    RANGE_FILE,
+    RangeAgencies,
+    RangeData,
+    Ranges,
+    map_ranges,
+)
+from fnattr.vljumap import VljuMap, enc
+from fnattr.vljumap.factory import default_factory
 
 class RangesFromXml(Ranges):
     """Load ranges from an XML file."""
 
-    def __init__(self, xmlfile: Path) -> None:
-        """Load ISBN ranges from a file."""
-        root = ElT.parse(xmlfile).getroot()
-        assert root.tag == 'ISBNRangeMessage'
+    def __init__(self, xmlfile: Path | str | BinaryIO) -> None:
+        """
+        Load ISBN ranges from a file.
 
+        The file is parsed incrementally, and each registration group is
+        discarded once loaded, so memory use does not grow with the file.
+        """
         starts: list[int] = []
         lengths: list[int] = []
         self.agencies: RangeAgencies = {}
-        for rg in root.iter('RegistrationGroups'):
-            for g in rg.iter('Group'):
-                self._load_group(g, starts, lengths, self.agencies)
+        groups: ElT.Element | None = None
+        for event, e in ElT.iterparse(xmlfile, events=('start', 'end')):
+            if event == 'start':
+                if e.tag == 'RegistrationGroups':
+                    groups = e
+            elif e.tag == 'Group' and groups is not None:
+                self._load_group(e, starts, lengths, self.agencies)
+                groups.clear()
+            elif e.tag == 'RegistrationGroups':
+                groups = None
+            elif e.tag == 'ISBNRangeMessage':
+                break
+        else:
+            message = f'{xmlfile}: not an ISBNRangeMessage'
+            raise ValueError(message)
         super().__init__(array.array('Q', starts), array.array('I', lengths))
 
     def _load_group(self,
@@ -92,11 +115,82 @@ class RangesFromXml(Ranges):
             starts.append(i_first)
             lengths.append(i_lengths)
 
-    def write(self, f: TextIO) -> None:
-        f.write('\nAGENCY = ')
-        pprint.pprint(self.agencies, stream=f)
-        f.write(f'\nSTART = {self._start!r}\n')
-        f.write(f'\nSPLIT = {self._split!r}\n')
+    def data(self) -> RangeData:
+        return RangeData.from_agencies(self._start, self._split,
+                                       self.agencies)
+
+AgencyChange = tuple[str | None, str | None]
+
+class RangesDiff:
+    """
+    Differences between two sets of ISBN range data.
+
+    `added` and `removed` list (start, split) for ranges whose start
+    occurs in only the new or old data respectively; `resplit` lists
+    (start, old split, new split) for ranges whose start occurs in both
+    with different splits; `agencies` maps each group whose agency has
+    changed to (old, new), with None for absent.
+    """
+
+    def __init__(self, old: RangeData, new: RangeData) -> None:
+        o = dict(zip(old.start, old.split, strict=True))
+        n = dict(zip(new.start, new.split, strict=True))
+        self.added = [(k, v) for k, v in n.items() if k not in o]
+        self.removed = [(k, v) for k, v in o.items() if k not in n]
+        self.resplit = [(k, o[k], v)
+                        for k, v in n.items()
+                        if k in o and o[k] != v]
+        oa = old.agencies()
+        na = new.agencies()
+        self.agencies: dict[tuple[str, str], AgencyChange] = {
+            k: (oa.get(k), na.get(k))
+            for k in sorted(oa.keys() | na.keys())
+            if oa.get(k) != na.get(k)
+        }
+        self._old = Ranges(old.start, old.split)
+        self._new = Ranges(new.start, new.split)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.resplit
+                    or self.agencies)
+
+    def affects(self, isbn: str) -> bool:
+        """Return whether an unsplit ISBN-13 splits differently."""
+        if not self.added and not self.removed and not self.resplit:
+            return False
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return self._old.split(isbn) != self._new.split(isbn)
+
+    def lines(self) -> Iterable[str]:
+        """Yield a readable report."""
+        for start, split in self.added:
+            yield f'+ {self._show(start, split)}'
+        for start, split in self.removed:
+            yield f'- {self._show(start, split)}'
+        for start, old, new in self.resplit:
+            yield f'~ {self._show(start, old)} → {self._show(start, new)}'
+        for (prefix, group), (old, new) in self.agencies.items():
+            yield f'agency {prefix}-{group}: {old!r} → {new!r}'
+
+    @staticmethod
+    def _show(start: int, split: int) -> str:
+        return '-'.join(Ranges._isplit(f'{start:013}', split))  # noqa: SLF001
+
+def isbns(m: VljuMap) -> Iterable[str]:
+    """Yield the unsplit ISBN-13 of each ISBN in `m`."""
+    for k, v in m.pairs():
+        if k == 'isbn' and (s := as13(str(v), 'isbn')):
+            yield s
+
+def affected_files(diff: RangesDiff, files: Iterable[str],
+                   decoder: enc.Encoder) -> Iterable[str]:
+    """Yield the files with an ISBN that `diff` splits differently."""
+    for file in files:
+        m = VljuMap()
+        decoder.decode_file(m, Path(file), default_factory)
+        if any(diff.affects(s) for s in isbns(m)):
+            yield file
 
 def main(argv: list[str] | None = None) -> int:
     if argv is None:
@@ -114,19 +208,59 @@ def main(argv: list[str] | None = None) -> int:
         '--output',
         '-o',
         metavar='FILE',
-        default='src/vlju/types/ean/isbn_ranges.py',
+        default='src/fnattr/vlju/types/ean/isbn_ranges.bin',
         help='Output file.')
+    parser.add_argument(
+        '--diff',
+        '-d',
+        action='store_true',
+        help='Report changes from the installed data.')
+    parser.add_argument(
+        '--against',
+        metavar='FILE',
+        type=Path,
+        default=RANGE_FILE,
+        help='With --diff or files, the installed data to compare.')
+    parser.add_argument(
+        '--dryrun',
+        '-n',
+        action='store_true',
+        help='Do not write the output file.')
+    parser.add_argument(
+        '--recursive',
+        '-r',
+        metavar='DIR',
+        type=str,
+        action='append',
+        help='Check files in the directory tree DIR.')
+    parser.add_argument(
+        '--decoder',
+        metavar='DECODER',
+        type=str,
+        choices=enc.decoder.keys(),
+        default='v3',
+        help='File name decoder.')
+    parser.add_argument(
+        'file',
+        metavar='FILENAME',
+        type=str,
+        nargs='*',
+        help='Report whether the ISBNs in FILENAME would split differently.')
     args = parser.parse_args(argv[1 :])
 
-    ranges = RangesFromXml(args.input)
-    with pathlib.Path(args.output).open('w', encoding='utf-8') as f:
-        f.write('"""Generated ISBN range data."""\n\n')
-        f.write('# DO NOT EDIT!\n')
-        f.write(f'# Generated from {args.input}\n')
-        f.write(
-            f'# at {datetime.datetime.now(tz=datetime.UTC).isoformat()}\n\n')
-        f.write('from array import array\n')
-        ranges.write(f)
+    data = RangesFromXml(args.input).data()
+    if args.diff or args.file or args.recursive:
+        diff = RangesDiff(map_ranges(args.against), data)
+        if args.diff:
+            for line in diff.lines():
+                print(line)
+        files = [*args.file]
+        for d in args.recursive or []:
+            files.extend(e.path for e in scan.scan(d))
+        for file in affected_files(diff, files, enc.decoder[args.decoder]):
+            print(file)
+    if not args.dryrun:
+        pathlib.Path(args.output).write_bytes(data.to_bytes())
 
     return 0
 
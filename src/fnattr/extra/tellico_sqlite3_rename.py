@@ -108,7 +108,7 @@ def destination_dir(m: M) -> str:
         return f'isbn/{(int(t[:6]) - 978000):03}'
 
     if 'doi' in m:
-        t = m['doi'][0]
+        t = m['doi'][0].typed()
         assert isinstance(t, DOI)
         return f'doi/{t.prefix()}'
 
@@ -2,18 +2,24 @@
 """`fna` command."""
 
 import argparse
+import contextlib
 import logging
 import pathlib
 import sys
 
+from collections.abc import Generator
+
 import fnattr.util.config
 import fnattr.util.error
 import fnattr.util.io
 import fnattr.util.log
-import fnattr.vljum.m
-import fnattr.vljum.runner
+import fnattr.util.scan
 import fnattr.vljumap.enc
 
+# Modules needed only after option parsing, or only by some modes,
+# are imported where they are used, so that start-up pays only for
+# what a given invocation touches.
+
 def main(argv: list[str] | None = None) -> int:
     if argv is None:        # pragma: no branch
         argv = sys.argv     # pragma: no cover
@@ -37,6 +43,12 @@ def main(argv: list[str] | None = None) -> int:
         action='store_false',
         default=True,
         help='Read default configuration files.')
+    parser.add_argument(
+        '--no-config-cache',
+        dest='config_cache',
+        action='store_false',
+        default=True,
+        help='Do not use cached configuration.')
     parser.add_argument(
         '--decoder',
         '-d',
@@ -67,6 +79,14 @@ def main(argv: list[str] | None = None) -> int:
         const='dsl',
         action='store_const',
         help='Positional arguments are subcommands (default).')
+    mode.add_argument(
+        '--batch',
+        '-b',
+        dest='mode',
+        const='batch',
+        action='store_const',
+        help=('Positional arguments are subcommands, applied to each file '
+              'named after ‘--’ or read from --files-from.'))
     mode.add_argument(
         '--evaluate',
         '-E',
@@ -88,6 +108,72 @@ def main(argv: list[str] | None = None) -> int:
         const='file',
         action='store_const',
         help='Positional arguments are program files.')
+    mode.add_argument(
+        '--serve',
+        dest='mode',
+        const='serve',
+        action='store_const',
+        help='Run a persistent server for --client requests.')
+    mode.add_argument(
+        '--client',
+        dest='mode',
+        const='client',
+        action='store_const',
+        help='Positional arguments are subcommands, sent to a server.')
+    parser.add_argument(
+        '--files-from',
+        '-F',
+        metavar='FILE',
+        type=str,
+        help='In batch mode, read file names from FILE (‘-’ for stdin).')
+    parser.add_argument(
+        '--null',
+        '-0',
+        default=False,
+        action='store_true',
+        help='File names read in batch mode are terminated by NUL.')
+    parser.add_argument(
+        '--recursive',
+        '-r',
+        metavar='DIR',
+        type=str,
+        action='append',
+        help='In batch mode, process files in the directory tree DIR.')
+    parser.add_argument(
+        '--include',
+        metavar='GLOB',
+        type=str,
+        action='append',
+        default=[],
+        help='With --recursive, process only file names matching GLOB.')
+    parser.add_argument(
+        '--exclude',
+        metavar='GLOB',
+        type=str,
+        action='append',
+        default=[],
+        help='With --recursive, skip file and directory names matching GLOB.')
+    parser.add_argument(
+        '--symlinks',
+        metavar='POLICY',
+        type=str,
+        choices=fnattr.util.scan.SYMLINK_POLICIES,
+        default='files',
+        help=('With --recursive, symbolic links are skipped (‘skip’), '
+              'followed only to files (‘files’, the default), '
+              'or followed (‘follow’).'))
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        metavar='N',
+        type=int,
+        help=('Use N worker processes: in batch mode (default 1), '
+              'or for --serve (default one per CPU).'))
+    parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        type=str,
+        help='Server socket for --serve and --client.')
     parser.add_argument(
         'argument',
         metavar='ARGUMENT',
@@ -98,6 +184,12 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv[1 :])
 
     log_level = fnattr.util.log.config(cmd, args)
+    if args.recursive and args.mode == 'dsl':
+        args.mode = 'batch'
+
+    if args.mode == 'client':
+        # The server has its own configuration.
+        return run_client(args.socket, args.argument)
 
     config, options = fnattr.util.config.read_cmd_configs_and_merge_options(
         cmd,
@@ -106,25 +198,36 @@ def main(argv: list[str] | None = None) -> int:
         decoder='v3',
         encoder='v3',
     )
-    fnattr.vljum.m.M.configure_options(options)
-    fnattr.vljum.m.M.configure_sites(config.get('site', {}))
+    from fnattr.vljum.m import M
+    from fnattr.vljum.runner import Runner, run_batch
+
+    M.configure_options(options)
+    M.configure_sites(config.get('site', {}))
 
     try:
         match args.mode:
             case 'dsl':
-                fnattr.vljum.runner.Runner().run(args.argument)
+                Runner().run(args.argument)
+            case 'batch':
+                program, files = split_batch_arguments(args.argument)
+                if run_batch(program,
+                             batch_files(args, files),
+                             jobs=args.jobs or 1):
+                    return 1
+            case 'serve':
+                serve(args.socket, args.jobs)
             case 'evaluate':
                 for i in args.argument:
-                    r = fnattr.vljum.m.M.evaluate(i)
+                    r = M.evaluate(i)
                     if r is not None:
                         print(r)
             case 'execute':
                 for i in args.argument:
-                    fnattr.vljum.m.M.execute(i)
+                    M.execute(i)
             case 'file':
                 for i in args.argument:
                     with fnattr.util.io.open_input(i) as f:
-                        fnattr.vljum.m.M.execute(f.read())
+                        M.execute(f.read())
             case _:  # pragma: no cover
                 logging.error('Unknown mode: %s', args.mode)
     except fnattr.util.error.Error as e:
@@ -138,5 +241,58 @@ def main(argv: list[str] | None = None) -> int:
 
     return 0
 
+def serve(socket: str | None, jobs: int | None = None) -> None:
+    import asyncio
+
+    import fnattr.fna.client
+    import fnattr.fna.server
+
+    if socket is None:
+        socket = str(fnattr.fna.client.default_socket_path())
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(fnattr.fna.server.serve(socket, jobs))
+
+def run_client(socket: str | None, argv: list[str]) -> int:
+    import fnattr.fna.client
+
+    if socket is None:
+        socket = str(fnattr.fna.client.default_socket_path())
+    try:
+        r = fnattr.fna.client.run(socket, argv)
+    except OSError as e:
+        logging.error('server: %s', e)
+        return 1
+    sys.stdout.write(r['stdout'])
+    sys.stderr.write(r['stderr'])
+    return r['status']
+
+def split_batch_arguments(a: list[str]) -> tuple[list[str], list[str]]:
+    """Split batch mode arguments into the program and file names."""
+    if '--' in a:
+        i = a.index('--')
+        return a[: i], a[i + 1 :]
+    return a, []
+
+def batch_files(args: argparse.Namespace,
+                files: list[str]) -> Generator[str, None, None]:
+    """
+    Yield batch mode file names.
+
+    Names given on the command line come first, followed by those found
+    under `--recursive` directories, followed by any read from
+    `--files-from`. If none of these is given, names are read from
+    standard input.
+    """
+    yield from files
+    for d in args.recursive or []:
+        for e in fnattr.util.scan.scan(d, args.include, args.exclude,
+                                       args.symlinks):
+            yield e.path
+    if (files or args.recursive) and args.files_from is None:
+        return
+    with fnattr.util.io.open_input(args.files_from, sys.stdin) as f:
+        yield from fnattr.util.io.read_records(f,
+                                               '\0' if args.null else '\n')
+
 if __name__ == '__main__':  # pramga: no branch
     sys.exit(main())        # pragma: no cover
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MIT
+"""Client for a persistent `fna` server."""
+
+import asyncio
+import json
+import os
+import tempfile
+
+from pathlib import Path
+from typing import Any
+
+# Protocol: each request and each response is a single line of JSON.
+# A request is `{"argv": [token, ...], "cwd": str}`, where `cwd` is the
+# client's working directory, against which the server resolves relative
+# file names; a response is `{"stdout": str, "stderr": str, "status": int}`.
+
+def default_socket_path() -> Path:
+    """Return the default server socket path, following XDG conventions."""
+    if d := os.environ.get('XDG_RUNTIME_DIR'):
+        return Path(d) / 'fnattr' / 'fna.sock'
+    return Path(tempfile.gettempdir()) / f'fnattr-{os.getuid()}' / 'fna.sock'
+
+def encode_message(d: dict[str, Any]) -> bytes:
+    return json.dumps(d).encode('utf-8') + b'\n'
+
+def decode_message(b: bytes) -> dict[str, Any]:
+    return json.loads(b.decode('utf-8'))
+
+async def request(path: Path | str,
+                  argv: list[str],
+                  cwd: Path | str | None = None) -> dict[str, Any]:
+    """
+    Send one DSL token list to a server and return its response.
+
+    The request runs in the directory `cwd`, by default the current one.
+    """
+    if cwd is None:
+        cwd = Path.cwd()
+    reader, writer = await asyncio.open_unix_connection(path)
+    try:
+        writer.write(encode_message({'argv': argv, 'cwd': str(cwd)}))
+        await writer.drain()
+        line = await reader.readline()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    if not line:
+        message = 'server closed connection'
+        raise ConnectionError(message)
+    return decode_message(line)
+
+def run(path: Path | str,
+        argv: list[str],
+        cwd: Path | str | None = None) -> dict[str, Any]:
+    return asyncio.run(request(path, argv, cwd))
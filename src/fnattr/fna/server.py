@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: MIT
+"""Persistent `fna` server on a Unix domain socket."""
+
+import asyncio
+import contextlib
+import functools
+import io
+import logging
+import os
+import stat
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from fnattr.fna.client import decode_message, encode_message
+from fnattr.util.error import Error
+from fnattr.vljum.runner import Runner
+
+# Requests run in worker processes, so that a slow request does not hold
+# up others, and so that each can change to its client's directory.
+
+def execute(argv: list[str], cwd: str | None = None) -> dict[str, Any]:
+    """Run a DSL token list in directory `cwd`, capturing its output."""
+    out = io.StringIO()
+    err = ''
+    status = 0
+    try:
+        with contextlib.chdir(cwd) if cwd else contextlib.nullcontext():
+            Runner(output=out).run(argv)
+    except Error as e:
+        err = f'{e}\n'
+        status = 1
+    except Exception as e:  # noqa: blind-except
+        err = f'Unhandled exception: {type(e).__name__}{e.args}\n'
+        status = 2
+    return {'stdout': out.getvalue(), 'stderr': err, 'status': status}
+
+def respond(line: bytes) -> dict[str, Any]:
+    try:
+        request = decode_message(line)
+        argv = request['argv']
+        if not (isinstance(argv, list) and all(
+                isinstance(i, str) for i in argv)):
+            raise TypeError(argv)
+        cwd = request.get('cwd')
+        if not (cwd is None or (isinstance(cwd, str) and os.path.isabs(cwd))):
+            raise TypeError(cwd)
+    except (ValueError, KeyError, TypeError) as e:
+        return {'stdout': '', 'stderr': f'bad request: {e!r}\n', 'status': 2}
+    logging.debug('request: %s in %s', argv, cwd)
+    return execute(argv, cwd)
+
+async def handle(reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter,
+                 executor: Executor | None = None) -> None:
+    """Serve requests on one connection until the client closes it."""
+    loop = asyncio.get_running_loop()
+    try:
+        while line := await reader.readline():
+            r = await loop.run_in_executor(executor, respond, line)
+            writer.write(encode_message(r))
+            await writer.drain()
+    except ConnectionError as e:
+        logging.info('connection: %s', e)
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+def private_directory(path: Path) -> None:
+    """Create directory `path` if necessary, and check that it is private."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = path.lstat()
+    if not stat.S_ISDIR(st.st_mode):
+        message = f'{path}: not a directory'
+        raise Error(message)
+    if st.st_uid != os.getuid():
+        message = f'{path}: not owned by the current user'
+        raise Error(message)
+    if stat.S_IMODE(st.st_mode) != 0o700:
+        message = f'{path}: mode is {stat.S_IMODE(st.st_mode):o}, not 700'
+        raise Error(message)
+
+async def start(path: Path | str, executor: Executor) -> asyncio.Server:
+    """
+    Start a server listening on the Unix domain socket `path`.
+
+    Requests run in `executor`, which should be a process pool, since
+    they change the working directory.
+    """
+    path = Path(path)
+    private_directory(path.parent)
+    path.unlink(missing_ok=True)
+    server = await asyncio.start_unix_server(
+        functools.partial(handle, executor=executor), path=path)
+    logging.info('listening on %s', path)
+    return server
+
+async def serve(path: Path | str, jobs: int | None = None) -> None:
+    """Run a server, with `jobs` worker processes, until cancelled."""
+    with ProcessPoolExecutor(jobs) as executor:
+        server = await start(path, executor)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            Path(path).unlink(missing_ok=True)
@@ -1,6 +1,11 @@
 # SPDX-License-Identifier: MIT
 """Checksums."""
 
+import functools
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
 def alt13_checksum(s: str) -> int:
     """Calculate an EAN checksum."""
     r = -10
@@ -21,11 +26,141 @@ def mod11_checksum(s: str) -> int:
     r = 0
     for n in range(1, 1 + len(s)):
         r += (n + 1) * int(s[-n])
-    r = 11 - r % 11
-    return r
+    return (11 - r % 11) % 11
 
 def mod11_checksum_to_check_digit(n: int) -> str:
     return '0123456789X'[n]
 
 def mod11(s: str) -> str:
     return mod11_checksum_to_check_digit(mod11_checksum(s))
+
+# Batch forms.
+#
+# These take a sequence of strings and return a list with one result per
+# string, equal to that of the corresponding scalar function. If NumPy is
+# available, strings are converted to a matrix of digits and the results
+# computed together; otherwise, or for input that is not uniform ASCII,
+# the scalar functions are applied to each string. NumPy is imported on
+# first use, since importing it takes longer than most runs spend here.
+
+@functools.cache
+def numpy() -> Any:
+    """Return the NumPy module, or None if it is not installed."""
+    try:
+        import numpy as np
+    except ImportError:     # pragma: no cover
+        return None
+    return np
+
+def alt13_checksum_many(strings: Sequence[str]) -> list[int]:
+    """Calculate EAN checksums of equal-length digit strings."""
+    if (d := _digits(strings)) is None:
+        return [alt13_checksum(s) for s in strings]
+    return ((10 - _alt13_sum(d) % 10) % 10).tolist()
+
+def alt13_many(strings: Sequence[str]) -> list[str]:
+    """Calculate EAN check digits of equal-length digit strings."""
+    return [str(n) for n in alt13_checksum_many(strings)]
+
+def mod11_checksum_many(strings: Sequence[str]) -> list[int]:
+    """Calculate ISBN-10 checksums of equal-length digit strings."""
+    if (d := _digits(strings)) is None:
+        return [mod11_checksum(s) for s in strings]
+    return ((11 - _mod11_sum(d) % 11) % 11).tolist()
+
+def mod11_many(strings: Sequence[str]) -> list[str]:
+    """Calculate ISBN-10 check characters of equal-length digit strings."""
+    return ['0123456789X'[n] for n in mod11_checksum_many(strings)]
+
+def is_valid_alt13_many(strings: Sequence[str], width: int,
+                        scalar: Callable[[str], bool]) -> list[bool]:
+    """
+    Check `width`-digit strings with a final EAN check digit.
+
+    `scalar` is the equivalent single-string test, used without NumPy
+    and for non-ASCII strings.
+    """
+    if numpy() is None:
+        return [scalar(s) for s in strings]
+    d, ok, other = _check_matrix(strings, width, check_x=False)
+    ok &= (10 - _alt13_sum(d[:, :-1]) % 10) % 10 == d[:, -1]
+    return _patch(ok.tolist(), other, strings, scalar)
+
+def is_valid_mod11_many(strings: Sequence[str], width: int,
+                        scalar: Callable[[str], bool]) -> list[bool]:
+    """
+    Check strings of `width - 1` digits and a final ISBN-10 check character.
+
+    `scalar` is the equivalent single-string test, used without NumPy
+    and for non-ASCII strings.
+    """
+    if numpy() is None:
+        return [scalar(s) for s in strings]
+    d, ok, other = _check_matrix(strings, width, check_x=True)
+    ok &= (11 - _mod11_sum(d[:, :-1]) % 11) % 11 == d[:, -1]
+    return _patch(ok.tolist(), other, strings, scalar)
+
+def digit_matrix(strings: Sequence[str], width: int) -> tuple[Any, Any]:
+    """
+    Return a matrix of the code points of `strings`, and their lengths.
+
+    The matrix has one row per string and `width` columns; longer strings
+    are truncated and shorter ones padded with zeros. Requires NumPy.
+    """
+    np = numpy()
+    a = np.asarray(strings, dtype=str)
+    n = len(a)
+    lengths = np.char.str_len(a) if n else np.zeros(0, dtype=int)
+    size = a.dtype.itemsize // 4
+    codes = a.view(np.uint32).reshape(n, size) if size else np.zeros(
+        (n, 0), dtype=np.uint32)
+    if size < width:
+        codes = np.pad(codes, ((0, 0), (0, width - size)))
+    return codes[:, : width], lengths
+
+def _digits(strings: Sequence[str]) -> Any:
+    """Return a digit matrix if `strings` are equal-length ASCII digits."""
+    if (np := numpy()) is None or not strings:
+        return None
+    width = len(strings[0])
+    codes, lengths = digit_matrix(strings, width)
+    d = codes - ord('0')
+    if (lengths != width).any() or (d > 9).any():
+        return None
+    return d.astype(np.int64)
+
+def _check_matrix(strings: Sequence[str], width: int, *,
+                  check_x: bool) -> tuple[Any, Any, list[int]]:
+    """
+    Return (digits, ok, other) for strings checked against `width`.
+
+    `ok` marks rows of `width` ASCII digits, optionally with a final ‘X’
+    having value 10; `other` lists rows containing non-ASCII characters.
+    """
+    np = numpy()
+    codes, lengths = digit_matrix(strings, width)
+    d = codes.astype(np.int64) - ord('0')
+    valid = (d >= 0) & (d <= 9)
+    if check_x:
+        x = codes[:, -1] == ord('X')
+        d[:, -1] = np.where(x, 10, d[:, -1])
+        valid[:, -1] |= x
+    ok = (lengths == width) & valid.all(axis=1)
+    other = np.flatnonzero((codes > 127).any(axis=1)).tolist()
+    return d, ok, other
+
+def _patch(r: list[bool], rows: list[int], strings: Sequence[str],
+           scalar: Callable[[str], bool]) -> list[bool]:
+    for i in rows:
+        r[i] = scalar(strings[i])
+    return r
+
+def _alt13_sum(d: Any) -> Any:
+    np = numpy()
+    weights = np.resize(np.array([1, 3], dtype=np.int64), d.shape[1])
+    return d @ weights
+
+def _mod11_sum(d: Any) -> Any:
+    np = numpy()
+    weights = np.arange(d.shape[1] + 1, 1, -1, dtype=np.int64)
+    return d @ weights
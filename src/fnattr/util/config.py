@@ -5,6 +5,7 @@ import argparse
 import contextlib
 import logging
 import os
+import pickle
 import tomllib
 
 from collections.abc import Generator, Iterable, Mapping
@@ -68,6 +69,13 @@ class Dirs(list[Path]):
 def xdg_config_dirs() -> Dirs:
     return Dirs().add_xdg_dirs('CONFIG', '.config', [Path('/etc/xdg')])
 
+def xdg_cache_dir() -> Path | None:
+    if d := os.environ.get('XDG_CACHE_HOME'):
+        return Path(d)
+    with contextlib.suppress(RuntimeError):
+        return Path.home() / '.cache'
+    return None
+
 def find_file_in_dirs(file: Path | str,
                       dirs: Iterable[Path]) -> Generator[Path, None, None]:
     for i in dirs:
@@ -93,6 +101,72 @@ def read_configs(args: Iterable[Path | str]) -> dict:
             nested.nupdate(config, c)
     return config
 
+# Bump this when the structure of cached configuration changes.
+CONFIG_CACHE_VERSION = 1
+
+ConfigCacheKey = tuple[tuple[str, int, int], ...]
+
+def config_cache_key(files: Iterable[Path | str]) -> ConfigCacheKey | None:
+    """Identify configuration files by path, modification time, and size."""
+    key = []
+    for file in files:
+        try:
+            st = Path(file).stat()
+        except OSError:
+            return None
+        key.append((str(file), st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+def read_configs_cached(files: Iterable[Path | str], cache: Path) -> dict:
+    """
+    Read and merge configuration files, using a cache file if valid.
+
+    The cache holds the merged configuration, and is valid only if the list
+    of files and their paths, modification times and sizes are unchanged.
+    A configuration with a file that fails to parse is not cached, so that
+    the error continues to be reported.
+    """
+    files = list(files)
+    key = config_cache_key(files)
+    if key is not None:
+        try:
+            with cache.open('rb') as f:
+                version, cached_key, config = pickle.load(f)  # noqa: S301
+        except (OSError, EOFError, ValueError, TypeError, pickle.PickleError):
+            pass
+        else:
+            if version == CONFIG_CACHE_VERSION and cached_key == key:
+                logging.debug('config cache hit: %s', cache)
+                return config
+    logging.debug('config cache miss: %s', cache)
+    config: dict[str, Any] = {}
+    complete = key is not None
+    for p in files:
+        if c := read_toml_config(p):
+            nested.nupdate(config, c)
+        elif c is None:
+            complete = False
+    if complete:
+        write_config_cache(cache, (CONFIG_CACHE_VERSION, key, config))
+    return config
+
+def write_config_cache(cache: Path, value: object) -> None:
+    tmp = cache.with_name(f'{cache.name}.{os.getpid()}')
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open('wb') as f:
+            pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache)
+    except OSError as e:
+        logging.debug('config cache not written: %s', e)
+        tmp.unlink(missing_ok=True)
+
+def config_cache_file(cmds: str | Iterable[str]) -> Path | None:
+    if (d := xdg_cache_dir()) is None:
+        return None
+    name = cmds if isinstance(cmds, str) else '-'.join(cmds)
+    return d / 'fnattr' / f'{name}.config.pickle'
+
 def cmd_config_files(cmds: str | Iterable[str]) -> list[Path]:
     files = []
     dirs = xdg_config_dirs()
@@ -119,10 +193,18 @@ def read_cmd_configs_and_merge_options(cmds: str | Iterable[str],
                                        config_files: Iterable[Path | str],
                                        args: argparse.Namespace,
                                        **kwargs) -> tuple[dict, dict]:
+    files: list[Path | str] = []
     if getattr(args, 'default_config', True):
-        files = cmd_config_files(cmds)
+        files += cmd_config_files(cmds)
+    files += list(config_files or [])
+    # The configuration cache is used only by commands that offer a
+    # `--no-config-cache` option, setting `args.config_cache`.
+    cache = None
+    if files and getattr(args, 'config_cache', False):
+        cache = config_cache_file(cmds)
+    if cache:
+        config = read_configs_cached(files, cache)
     else:
-        files = []
-    config = read_configs(files + list(config_files or []))
+        config = read_configs(files)
     options = merge_options(config.get('option'), args, **kwargs)
     return config, options
@@ -2,9 +2,11 @@
 """Like format, but scary."""
 
 import builtins
+import functools
 import operator
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from types import CodeType
 from typing import Any
 
 from fnattr.util.error import Error
@@ -46,18 +48,40 @@ BUILTINS = {
     for k in ALLOWED_OPERATORS
 }
 
+# Compiled templates are kept for ad-hoc `fearmat()` calls, since callers
+# typically format many values with each of a few templates.
+CACHE_SIZE = 256
+
+Formatter = Callable[[Mapping[str, Any]], str]
+
 def fearmat(template: str,
             values: Mapping[str, Any],
             builtins: Mapping[str, Any] | None = None) -> str:
+    if builtins is None:
+        builtins = BUILTINS
+    return str(evaluate(code(template), values, builtins))
+
+def compiled(template: str,
+             builtins: Mapping[str, Any] | None = None) -> Formatter:
+    """Return a function formatting `template` with a mapping of values."""
+    c = code(template)
+    if builtins is None:
+        builtins = BUILTINS
+
+    def formatter(values: Mapping[str, Any]) -> str:
+        return str(evaluate(c, values, builtins))
+
+    return formatter
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def code(template: str) -> CodeType:
+    """Return `template` compiled as an f-string expression."""
     if '"""' in template:
         msg = '‘"""’ in ‘template’'
         raise Error(msg)
-    template = 'f"""' + template + '"""'
-    if builtins is None:
-        builtins = BUILTINS
-    return str(evaluate(template, values, builtins))
+    return compile('f"""' + template + '"""', '<fearmat>', 'eval')
 
-def evaluate(s: str,
+def evaluate(s: str | CodeType,
              values: Mapping[str, Any],
              builtins: Mapping[str, Any]) -> Any:
     g = dict(values) | {'__builtins__': builtins}
@@ -6,6 +6,7 @@ import io
 import os
 import sys
 
+from collections.abc import Generator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import IO, cast
@@ -61,3 +62,23 @@ def open_input(file: PathLike | None,
                encoding: str = 'utf-8',
                **kwargs) -> contextlib.AbstractContextManager:
     return open_context(file, 'r', default, encoding, **kwargs)
+
+def read_records(f: IO,
+                 separator: str = '\n',
+                 size: int = 1 << 16) -> Generator[str, None, None]:
+    """
+    Yield `separator`-terminated records from an open file.
+
+    The file is read in chunks of at most `size`, so memory use is bounded
+    by the chunk size and the longest record. A final unterminated record
+    is also returned. Empty records are skipped.
+    """
+    pending = ''
+    while chunk := f.read(size):
+        records = (pending + chunk).split(separator)
+        pending = records.pop()
+        for r in records:
+            if r:
+                yield r
+    if pending:
+        yield pending
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: MIT
+"""Deferred imports."""
+
+import importlib
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any, NamedTuple, Self, TypeVar
+
+T = TypeVar('T')
+
+class Import(NamedTuple):
+    """Reference to a module attribute, imported when loaded."""
+
+    module: str
+    name: str
+
+    def load(self) -> Any:  # noqa: any-type
+        return getattr(importlib.import_module(self.module), self.name)
+
+class ImportMap(MutableMapping[str, T]):
+    """
+    Mapping whose `Import` values are loaded on first access.
+
+    Membership tests, iteration over keys, and copying do not load values.
+    """
+
+    def __init__(self, m: Mapping[str, T | Import] | None = None) -> None:
+        self._data: dict[str, T | Import] = {}
+        if isinstance(m, ImportMap):
+            self._data.update(m._data)  # noqa: SLF001
+        elif m:
+            self._data.update(m)
+
+    def __getitem__(self, k: str) -> T:
+        v = self._data[k]
+        if isinstance(v, Import):
+            v = v.load()
+            self._data[k] = v
+        return v
+
+    def __setitem__(self, k: str, v: T | Import) -> None:
+        self._data[k] = v
+
+    def __delitem__(self, k: str) -> None:
+        del self._data[k]
+
+    def __contains__(self, k: object) -> bool:
+        return k in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._data!r})'
+
+    def copy(self) -> Self:
+        return type(self)(self)
+
+    def is_loaded(self, k: str) -> bool:
+        return not isinstance(self._data[k], Import)
@@ -19,10 +19,28 @@ T = TypeVar('T')
 W = TypeVar('W')
 
 class MultiMap(Generic[K, V]):
-    """Multi-valued dictionary."""
+    """
+    Multi-valued dictionary.
+
+    Values for each key are kept in order, without duplicates. For keys
+    with many values, a set of the values is kept alongside the list so
+    that membership tests do not scan it; this requires hashable values.
+
+    Copies share value lists with the original until either side
+    modifies them (copy on write), so `copy()` and `submap()` cost
+    time proportional to the number of keys, not values. Lists obtained
+    through `m[k]` or `get()` are private to `m` and may be modified in
+    place; lists seen through `data` or `lists()` must not be.
+    """
+
+    # Keys with at least this many values get a membership index.
+    index_threshold = 8
 
     def __init__(self) -> None:
         self.data: defaultdict[K, list[V]] = defaultdict(list[V])
+        self._index: dict[K, set[V]] = {}
+        # Keys whose list and index may be shared with another map.
+        self._shared: set[K] = set()
 
     def __eq__(self, other: object) -> bool:
         # pylint:disable=unidiomatic-typecheck
@@ -31,11 +49,13 @@ class MultiMap(Generic[K, V]):
         return False
 
     def __getitem__(self, k: K) -> list[V]:
-        return self.data[k]
+        return self._own(k)
 
     def __delitem__(self, k: K) -> None:
         if k in self.data:
             del self.data[k]
+            self._index.pop(k, None)
+            self._shared.discard(k)
 
     def __contains__(self, k: K) -> bool:
         return (k in self.data) and (self.data[k] != [])
@@ -52,11 +72,20 @@ class MultiMap(Generic[K, V]):
     def copy(self) -> Self:
         r = type(self)()
         r.data = self.data.copy()
+        r._index = self._index.copy()       # noqa: SLF001
+        r._shared = set(self.data)          # noqa: SLF001
+        self._shared.update(self.data)
         return r
 
+    def has(self, k: K, v: V) -> bool:
+        """Test whether `v` is a value for `k`."""
+        if (vset := self._index.get(k)) is not None:
+            return v in vset
+        return v in self.data.get(k, ())
+
     def get(self, k: K, default: list[V] | None = None) -> list[V]:
         if k in self.data:
-            return self.data[k]
+            return self._own(k)
         if default is None:
             return []
         return default
@@ -75,19 +104,52 @@ class MultiMap(Generic[K, V]):
         return self.data.items()
 
     def add(self, k: K, v: V) -> Self:
-        if v not in self.data[k]:
-            self.data[k].append(v)
+        vlist = self._own(k)
+        if (vset := self._index.get(k)) is not None:
+            try:
+                if v not in vset:
+                    vset.add(v)
+                    vlist.append(v)
+                return self
+            except TypeError:
+                # Unhashable value; drop the index for this key.
+                del self._index[k]
+        if v not in vlist:
+            vlist.append(v)
+            if len(vlist) >= self.index_threshold:
+                self._make_index(k, vlist)
         return self
 
     def remove(self, k: K, v: V) -> Self:
-        self.data[k].remove(v)
+        self._own(k).remove(v)
+        if (vset := self._index.get(k)) is not None:
+            vset.discard(v)
         return self
 
     def pop(self, key: K, default: T | None = None) -> V | T | None:
         if self.data[key]:
-            return self.data[key].pop()
+            v = self._own(key).pop()
+            if (vset := self._index.get(key)) is not None:
+                vset.discard(v)
+            return v
         return default
 
+    def _own(self, k: K) -> list[V]:
+        """Return the value list for `k`, first unsharing it if necessary."""
+        if k in self._shared:
+            self._shared.discard(k)
+            self.data[k] = self.data[k].copy()
+            if (vset := self._index.get(k)) is not None:
+                self._index[k] = vset.copy()
+        return self.data[k]
+
+    def _make_index(self, k: K, vlist: list[V]) -> None:
+        try:
+            self._index[k] = set(vlist)
+        except TypeError:
+            # Unhashable values; stay with linear search.
+            pass
+
     def top(self, k: K) -> V | None:
         if self.data[k]:
             return self.data[k][-1]
@@ -117,14 +179,18 @@ class MultiMap(Generic[K, V]):
         if keys is None:
             keys = self.data.keys()
         for k in keys:
-            self.data[k].sort(key=key)  # type: ignore[reportGeneralTypeIssues]
+            self._own(k).sort(key=key)  # type: ignore[reportGeneralTypeIssues]
         return self
 
     def submap(self, keys: Iterable[K] | None = None) -> Self:
         if not keys:
             return self
         r = type(self)()
-        for k in keys or []:
+        for k in keys:
             if k in self.data:
                 r.data[k] = self.data[k]
+                r._shared.add(k)                # noqa: SLF001
+                self._shared.add(k)
+                if (vset := self._index.get(k)) is not None:
+                    r._index[k] = vset          # noqa: SLF001
         return r
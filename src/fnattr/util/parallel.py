@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: MIT
+"""Order-preserving parallel map."""
+
+import concurrent.futures
+import multiprocessing
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+def ordered_map(fn: Callable[[T], R],
+                iterable: Iterable[T],
+                jobs: int = 1,
+                chunksize: int = 64,
+                initializer: Callable[..., Any] | None = None,
+                initargs: tuple = ()) -> Iterator[R]:
+    """
+    Map `fn` over `iterable` using `jobs` worker processes.
+
+    Results are yielded in input order. Items are sent to workers in chunks
+    of `chunksize`, and at most two chunks per worker are outstanding at any
+    time, so `iterable` is consumed incrementally and memory is bounded.
+
+    Where available, workers are forked, so that they inherit module state
+    (such as configured site classes) from the calling process; `initializer`
+    is called with `initargs` in each worker.
+
+    With `jobs` ≤ 1, this runs in the calling process.
+    """
+    if jobs <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(fn, iterable)
+        return
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+    else:   # pragma: no cover
+        context = multiprocessing.get_context()
+    it = iter(iterable)
+    with concurrent.futures.ProcessPoolExecutor(
+            jobs,
+            mp_context=context,
+            initializer=initializer,
+            initargs=initargs) as executor:
+        pending: deque[concurrent.futures.Future[list[R]]] = deque()
+        while True:
+            while len(pending) < 2 * jobs and (chunk := list(
+                    islice(it, chunksize))):
+                pending.append(executor.submit(_map_chunk, fn, chunk))
+            if not pending:
+                break
+            yield from pending.popleft().result()
+
+def _map_chunk(fn: Callable[[T], R], chunk: list[T]) -> list[R]:
+    return [fn(i) for i in chunk]
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MIT
+"""Directory tree scanning."""
+
+import fnmatch
+import logging
+import os
+
+from collections.abc import Generator, Iterable
+
+# How symbolic links are treated:
+# - 'skip':   ignore all symbolic links;
+# - 'files':  report links to files, but do not descend into linked
+#             directories;
+# - 'follow': report links to files, and descend into linked directories.
+SYMLINK_POLICIES = ('skip', 'files', 'follow')
+
+def scan(root: os.PathLike | str,
+         include: Iterable[str] = (),
+         exclude: Iterable[str] = (),
+         symlinks: str = 'files') -> Generator[os.DirEntry, None, None]:
+    """
+    Yield entries for files in a directory tree.
+
+    Entries within each directory are sorted by name, and subdirectories
+    are visited in place, so the order is deterministic. File names must
+    match at least one `include` glob, if any are given, and must not
+    match any `exclude` glob; `exclude` also prunes directories.
+
+    Type tests use the `os.DirEntry` cache, so in the common case no
+    `stat` call is made for any entry.
+    """
+    if symlinks not in SYMLINK_POLICIES:
+        raise ValueError(symlinks)
+    include = list(include)
+    exclude = list(exclude)
+    follow = symlinks == 'follow'
+    visited: set[tuple[int, int]] = set()
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            if follow:
+                # Guard against cycles through linked directories.
+                st = os.stat(directory)
+                if (st.st_dev, st.st_ino) in visited:
+                    continue
+                visited.add((st.st_dev, st.st_ino))
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            logging.error('%s', e)
+            continue
+        subdirectories = []
+        for e in entries:
+            if _matches(e.name, exclude):
+                continue
+            if e.is_symlink():
+                if symlinks == 'skip':
+                    continue
+                is_dir = follow and e.is_dir()
+            else:
+                is_dir = e.is_dir(follow_symlinks=False)
+            if is_dir:
+                subdirectories.append(e.path)
+            elif e.is_file() and (not include or _matches(e.name, include)):
+                yield e
+        # Reversed, so that the stack pops them in sorted order.
+        stack.extend(reversed(subdirectories))
+
+def _matches(name: str, patterns: list[str]) -> bool:
+    return any(fnmatch.fnmatchcase(name, p) for p in patterns)
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: MIT
+"""Objects whose attributes can be assigned only once."""
+
+import functools
+import types
+
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+class WriteOnce:
+    """
+    Base for objects whose attributes can each be set only once.
+
+    Works for attributes stored in `__slots__` and in `__dict__`. A class
+    attribute of the same name serves as a default, and does not count
+    as having been set.
+
+    The check costs more than the assignment itself, so constructors, and
+    caches that have just found their attribute unset, assign through
+    `init_attr()` instead.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in instance_slots(type(self)):
+            is_set = hasattr(self, name)
+        else:
+            is_set = name in getattr(self, '__dict__', ())
+        if is_set:
+            message = f'{type(self).__name__}.{name} is read-only'
+            raise AttributeError(message)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        message = f'{type(self).__name__}.{name} is read-only'
+        raise AttributeError(message)
+
+# Sets an attribute of a WriteOnce object that is known not to be set yet,
+# without the check: `init_attr(obj, name, value)`.
+init_attr = object.__setattr__
+
+_instance_slots: dict[type, frozenset[str]] = {}
+
+def instance_slots(cls: type) -> frozenset[str]:
+    """Return the names that instances of `cls` store in slots."""
+    if (r := _instance_slots.get(cls)) is None:
+        names = {
+            name
+            for c in cls.__mro__
+            for name in c.__dict__.get('__slots__', ())
+        }
+        # A class attribute in a subclass hides a base class slot.
+        r = frozenset(
+            name for name in names
+            if isinstance(getattr(cls, name, None), types.MemberDescriptorType))
+        _instance_slots[cls] = r
+    return r
+
+def cached(name: str) -> Callable[[Callable[[T], R]], Callable[[T], R]]:
+    """
+    Decorate a method without arguments to keep its result in `name`.
+
+    The result is computed on the first call and stored in the attribute
+    `name` (normally a slot), which later calls return. This relies on
+    the object being immutable, so it suits WriteOnce objects, where the
+    attribute itself can then be set only once. Each cached method needs
+    its own attribute, including overrides that call the base method.
+    """
+
+    def decorator(f: Callable[[T], R]) -> Callable[[T], R]:
+
+        @functools.wraps(f)
+        def method(self: T) -> R:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                r = f(self)
+                init_attr(self, name, r)
+                return r
+
+        return method
+
+    return decorator
@@ -1,9 +1,13 @@
 # SPDX-License-Identifier: MIT
 """Vlju - top-level of the Vlju hierarchy."""
 
+from collections.abc import Hashable
+from typing import Self
+
 from fnattr.util.repr import mkrepr
+from fnattr.util.writeonce import WriteOnce, init_attr
 
-class Vlju:
+class Vlju(WriteOnce):
     """
     Vlju - Top level of the Vlju hierarchy.
 
@@ -19,18 +23,58 @@ class Vlju:
     long:   value
     where:
         value → `_value`
+
+    Vlju values are immutable, and hashable consistently with equality.
+    Each attribute can be set only once, either by a constructor or as a
+    lazily computed cache. Subclasses that override `__eq__()` must also
+    override `_hash_key()` and restore `__hash__ = Vlju.__hash__`.
+    Likewise, string forms depend only on what the constructor set, so
+    subclasses may compute them once (see `writeonce.cached`).
+
+    Vlju classes declare `__slots__`, so that instances do not carry a
+    `__dict__`; subclasses adding attributes should do the same.
     """
 
+    __slots__ = ('_value', '_hash', '__weakref__')
+
+    _value: str
+
     def __init__(self, s: str) -> None:
         if not isinstance(s, str):
             raise TypeError(s)
-        self._value = s
+        init_attr(self, '_value', s)
+
+    @classmethod
+    def try_parse(cls, s: str) -> Self | None:
+        """
+        Return an instance for the string `s`, or None if `s` is unsuitable.
+
+        This calls the constructor and treats any exception as unsuitable.
+        Subclasses whose constructors reject common input override it to
+        check first, so that rejection does not cost an exception.
+        """
+        try:
+            return cls(s)
+        except Exception:   # noqa: blind-except
+            return None
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Vlju):
-            return self._value == other._value  # noqa: SLF001
+            return self._value == other.typed()._value  # noqa: SLF001
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            h = hash(self._hash_key())
+            init_attr(self, '_hash', h)
+            return h
+
+    def _hash_key(self) -> Hashable:
+        """Return the value(s) compared by `__eq__()`."""
+        return self._value
+
     def __repr__(self) -> str:
         return mkrepr(self, ['_value'])
 
@@ -60,5 +104,9 @@ class Vlju:
                 return repr(self)
         raise KeyError(key)
 
+    def typed(self) -> 'Vlju':
+        """Return this value with its type resolved; see `LazyVlju`."""
+        return self
+
     def cast_param_error(self, t: object) -> TypeError:
         return TypeError((self, t))
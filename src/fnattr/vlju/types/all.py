@@ -1,33 +1,54 @@
 # SPDX-License-Identifier: MIT
-"""Known Vlju subtypes."""
+"""
+Known Vlju subtypes.
 
+Subtype modules are imported on first use, either through `VLJU_TYPES`
+or as attributes of this module.
+"""
+
+from typing import Any
+
+from fnattr.util.lazy import Import, ImportMap
 from fnattr.vlju import Vlju
-from fnattr.vlju.types.doi import DOI
-from fnattr.vlju.types.ean import EAN13
-from fnattr.vlju.types.ean.isbn import ISBN
-from fnattr.vlju.types.ean.ismn import ISMN
-from fnattr.vlju.types.ean.issn import ISSN
-from fnattr.vlju.types.file import File
-from fnattr.vlju.types.info import Info
-from fnattr.vlju.types.lccn import LCCN
-from fnattr.vlju.types.timestamp import Timestamp
-from fnattr.vlju.types.uri import URI
-from fnattr.vlju.types.url import URL
-from fnattr.vlju.types.urn import URN
 
 # fmt: off
-VLJU_TYPES: dict[str, type[Vlju]] = {
-    'doi':      DOI,
-    'ean':      EAN13,
-    'file':     File,
-    'info':     Info,
-    'isbn':     ISBN,
-    'ismn':     ISMN,
-    'issn':     ISSN,
-    'lccn':     LCCN,
-    't':        Timestamp,
-    'uri':      URI,
-    'url':      URL,
-    'urn':      URN,
+TYPES: dict[str, Import] = {
+    'DOI':          Import('fnattr.vlju.types.doi', 'DOI'),
+    'EAN13':        Import('fnattr.vlju.types.ean', 'EAN13'),
+    'File':         Import('fnattr.vlju.types.file', 'File'),
+    'Info':         Import('fnattr.vlju.types.info', 'Info'),
+    'ISBN':         Import('fnattr.vlju.types.ean.isbn', 'ISBN'),
+    'ISMN':         Import('fnattr.vlju.types.ean.ismn', 'ISMN'),
+    'ISSN':         Import('fnattr.vlju.types.ean.issn', 'ISSN'),
+    'LCCN':         Import('fnattr.vlju.types.lccn', 'LCCN'),
+    'Timestamp':    Import('fnattr.vlju.types.timestamp', 'Timestamp'),
+    'URI':          Import('fnattr.vlju.types.uri', 'URI'),
+    'URL':          Import('fnattr.vlju.types.url', 'URL'),
+    'URN':          Import('fnattr.vlju.types.urn', 'URN'),
 }
+
+VLJU_TYPES: ImportMap[type[Vlju]] = ImportMap({
+    'doi':      TYPES['DOI'],
+    'ean':      TYPES['EAN13'],
+    'file':     TYPES['File'],
+    'info':     TYPES['Info'],
+    'isbn':     TYPES['ISBN'],
+    'ismn':     TYPES['ISMN'],
+    'issn':     TYPES['ISSN'],
+    'lccn':     TYPES['LCCN'],
+    't':        TYPES['Timestamp'],
+    'uri':      TYPES['URI'],
+    'url':      TYPES['URL'],
+    'urn':      TYPES['URN'],
+})
 # fmt: on
+
+__all__ = ['VLJU_TYPES', 'Vlju', *TYPES]
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in TYPES:
+        value = TYPES[name].load()
+        globals()[name] = value
+        return value
+    message = f'module {__name__!r} has no attribute {name!r}'
+    raise AttributeError(message)
@@ -4,11 +4,13 @@
 import re
 import urllib.parse
 
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 from typing import Self
 
 from fnattr.util import escape
 from fnattr.util.typecheck import needtype
+from fnattr.util.writeonce import cached, init_attr
+from fnattr.vlju import Vlju
 from fnattr.vlju.types.info import Info
 from fnattr.vlju.types.uri import URI, Authority
 from fnattr.vlju.types.url import URL
@@ -43,6 +45,12 @@ class DOI(Info):
         doi     → ‘doi:’ `_prefix` ‘/’ `_suffix`ᵖ
     """
 
+    __slots__ = ('_prefix', '_suffix', '_kind', '_lv')
+
+    _prefix: Prefix
+    _suffix: str
+    _kind: str
+
     _i = {'doi': Authority('doi'), 'hdl': Authority('hdl')}
     _u = {'doi': Authority('doi.org'), 'hdl': Authority('hdl.handle.net')}
 
@@ -53,7 +61,7 @@ class DOI(Info):
             |(info:)?(hdl|doi)/
             |doi:/*
             )
-            (?P<prefix>\d[\d.]*)
+            (?P<prefix>\d+(?:\.\d+)*)
             [/,]
             (?P<suffix>.+)
             """,
@@ -63,20 +71,31 @@ class DOI(Info):
         if s is None:
             prefix = Prefix(kwargs['prefix'])
             suffix = needtype(kwargs['suffix'], str)
+        elif (parts := self._parse(s)) is None:
+            message = f'Not a DOI: {s}'
+            raise ValueError(message)
         else:
-            m = self._matcher.fullmatch(s)
-            if not m:
-                message = f'Not a DOI: {s}'
-                raise ValueError(message)
-            scheme, p, suffix = m.group('scheme', 'prefix', 'suffix')
-            prefix = Prefix(p)
-            if scheme.startswith(('http', 'info')):
-                suffix = urllib.parse.unquote(suffix)
+            prefix, suffix = parts
         # Note that DOI does not use Info path or authority.
         super().__init__('')
-        self._prefix = prefix
-        self._suffix = suffix.lower()
-        self._kind = 'doi' if self._prefix.is_doi() else 'hdl'
+        init_attr(self, '_prefix', prefix)
+        init_attr(self, '_suffix', suffix.lower())
+        init_attr(self, '_kind', 'doi' if prefix.is_doi() else 'hdl')
+
+    @classmethod
+    def try_parse(cls, s: str) -> Self | None:
+        if not isinstance(s, str) or (parts := cls._parse(s)) is None:
+            return None
+        return cls(prefix=parts[0], suffix=parts[1])
+
+    @classmethod
+    def _parse(cls, s: str) -> tuple[Prefix, str] | None:
+        if not (m := cls._matcher.fullmatch(s)):
+            return None
+        scheme, p, suffix = m.group('scheme', 'prefix', 'suffix')
+        if scheme.startswith(('http', 'info')):
+            suffix = urllib.parse.unquote(suffix)
+        return Prefix(p), suffix
 
     def prefix(self) -> Prefix:
         return self._prefix
@@ -115,11 +134,18 @@ class DOI(Info):
     # URI overrides:
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, Vlju):
+            other = other.typed()
         if isinstance(other, DOI):
             return (self._prefix == other._prefix       # noqa: SLF001
                     and self._suffix == other._suffix)  # noqa: SLF001
         return False
 
+    __hash__ = Info.__hash__
+
+    def _hash_key(self) -> Hashable:
+        return (tuple(self._prefix), self._suffix)
+
     def authority(self) -> Authority:
         return self._i[self._kind]
 
@@ -131,9 +157,11 @@ class DOI(Info):
 
     # Vlju overrides:
 
+    @cached('_str')
     def __str__(self) -> str:
         return f'{self._prefix},{self._suffix}'
 
+    @cached('_lv')
     def lv(self) -> str:
         return self.doi()
 
@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: MIT
 """EAN13 - Vlju representing a EAN13."""
 
+from collections.abc import Sequence
+from typing import Self
+
 from fnattr.util import checksum
 from fnattr.vlju.types.urn import URN
 
@@ -8,8 +11,18 @@ def is_valid_ean13(s: str) -> bool:
     """Check for 13-digit-only form."""
     return (len(s) == 13 and s.isdigit() and checksum.alt13(s[0 : 12]) == s[12])
 
+def is_valid_ean13_many(strings: Sequence[str]) -> list[bool]:
+    """Check each of `strings` as by `is_valid_ean13()`."""
+    return checksum.is_valid_alt13_many(strings, 13, is_valid_ean13)
+
 def to13(s: str) -> str | None:
     """Convert other forms to E-13."""
+    if (b := body13(s)) is None:
+        return None
+    return b + checksum.alt13(b)
+
+def body13(s: str) -> str | None:
+    """Return the E-13 form of `s` without its check digit, or None."""
     s = s.replace('-', '')
     s = s.replace('.', '')
     if len(s) == 8:
@@ -24,7 +37,7 @@ def to13(s: str) -> str | None:
     if len(s) == 12:
         s = '0' + s                 # UPC-A → EAN13
     if len(s) == 13 and s[0 : 12].isdigit():
-        return s[0 : 12] + checksum.alt13(s[0 : 12])
+        return s[0 : 12]
     return None
 
 def key13(s: str) -> str:
@@ -40,6 +53,10 @@ def key13(s: str) -> str:
         return 'isbn'
     return 'ean13'
 
+def is13(s: str, key: str) -> bool:
+    """Test whether `as13()` would succeed, without computing a checksum."""
+    return (b := body13(s)) is not None and key13(b) == key
+
 def as13(s: str, key: str) -> str | None:
     if (e := to13(s)) and (key13(e) == key):
         return e
@@ -48,12 +65,18 @@ def as13(s: str, key: str) -> str | None:
 class EAN13(URN):
     """Represents an EAN-13 article number."""
 
+    __slots__ = ()
+
     def __init__(self, v: str, k: str = 'ean13') -> None:
         u = to13(v)
         if u is None:
             raise ValueError(v)
         super().__init__(u, k)
 
+    @classmethod
+    def try_parse(cls, s: str) -> Self | None:
+        return cls(s) if isinstance(s, str) and body13(s) else None
+
     def __str__(self) -> str:
         return self._value
 
@@ -3,10 +3,24 @@
 
 import array
 import bisect
+import operator
+import struct
+import sys
 import warnings
 
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import NamedTuple, Self
+
 from fnattr.util import checksum
-from fnattr.vlju.types.ean import EAN13, as13, is_valid_ean13, isbn_ranges
+from fnattr.util.writeonce import init_attr
+from fnattr.vlju.types.ean import (
+    EAN13,
+    as13,
+    is13,
+    is_valid_ean13,
+    is_valid_ean13_many,
+)
 
 def constraint(t: object, s: str) -> None:
     if not t:                   # pragma: no branch
@@ -17,7 +31,7 @@ RangeAgencies = dict[tuple[str, str], str]
 class Ranges:
     """Provides ISBN splitting."""
 
-    def __init__(self, start: array.array, split: array.array) -> None:
+    def __init__(self, start: Sequence[int], split: Sequence[int]) -> None:
         # SoA: _start is sorted lower bounds, _split is corresponding split.
         self._start = start
         self._split = split
@@ -32,6 +46,10 @@ class Ranges:
             return (s, )
         return self._isplit(s, self._split[i - 1])
 
+    def split_many(self, isbns: Iterable[str]) -> list[tuple[str, ...]]:
+        """Split each string isbn1, with no separators."""
+        return [self.split(s) for s in isbns]
+
     @staticmethod
     def _isplit(s: str, i: int) -> tuple[str, ...]:
         """Split a string according to the integer pattern."""
@@ -45,10 +63,196 @@ class Ranges:
         r.append(s)
         return tuple(reversed(r))
 
+Splitter = Callable[[str], tuple[str, ...]]
+
+class PrefixRanges(Ranges):
+    """
+    Provides ISBN splitting by table lookup on ISBN prefixes.
+
+    A dense table over the 7-digit prefixes 978xxxx and 979xxxx gives
+    the split for every block that lies within a single range. Blocks
+    that straddle a range boundary are refined by 9-digit prefix, and
+    the few 9-digit blocks that still straddle one fall back to `Ranges`.
+
+    Building the tables costs about as much as a few thousand `Ranges`
+    splits, so single splits use `Ranges` until there have been
+    `build_after` of them; `split_many()` builds the tables at once.
+    """
+
+    COARSE = 7
+    FINE = 9
+    FIRST = 978 * 10**(COARSE - 3)
+    LAST = 980 * 10**(COARSE - 3)
+
+    build_after = 64
+
+    def __init__(self, start: Sequence[int], split: Sequence[int]) -> None:
+        super().__init__(start, split)
+        self._pending = self.build_after
+        self._built = False
+
+    def build(self) -> None:
+        """Build the lookup tables, if not already built."""
+        if self._built:
+            return
+        start = self._start
+        split = self._split
+        # Entries in _coarse and _fine index _splitters; 0 means ‘unknown’.
+        self._splitters: list[Splitter] = [super().split]
+        self._coarse = array.array('H', bytes(2 * (self.LAST - self.FIRST)))
+        self._fine: dict[int, int] = {}
+        cscale = 10**(13 - self.COARSE)
+        fscale = 10**(13 - self.FINE)
+        codes: dict[int, int] = {}
+        for i, lo in enumerate(start):
+            hi = start[i + 1] if i + 1 < len(start) else self.LAST * cscale
+            if (code := codes.get(split[i])) is None:
+                code = len(self._splitters)
+                codes[split[i]] = code
+                self._splitters.append(self._splitter(split[i]))
+            # Coarse blocks wholly within [lo, hi).
+            a = max(-(-lo // cscale), self.FIRST)
+            b = min(hi // cscale, self.LAST)
+            if a < b:
+                self._coarse[a - self.FIRST : b - self.FIRST] = array.array(
+                    'H', [code]) * (b - a)
+            # Fine blocks wholly within [lo, hi), in coarse blocks that
+            # contain a boundary.
+            for p in {x // cscale for x in (lo, hi) if x % cscale}:
+                if self.FIRST <= p < self.LAST:
+                    base = p * (cscale // fscale)
+                    for f in range(max(-(-lo // fscale), base),
+                                   min(hi // fscale, base + cscale // fscale)):
+                        self._fine[f] = code
+        self._built = True
+
+    @staticmethod
+    def _splitter(i: int) -> Splitter:
+        """Return a function splitting according to the integer pattern."""
+        ends = [13]
+        while i:
+            d = int(i % 10)
+            i = i // 10
+            constraint(d != 0, 'zero segment')
+            ends.append(ends[-1] - d)
+        ends.append(0)
+        ends.reverse()
+        return operator.itemgetter(
+            *(slice(a, b) for a, b in zip(ends, ends[1 :], strict=False)))
+
+    def _code(self, s: str) -> int:
+        block = int(s[: self.COARSE]) - self.FIRST
+        if 0 <= block < len(self._coarse) and (code := self._coarse[block]):
+            return code
+        return self._fine.get(int(s[: self.FINE]), 0)
+
+    def split(self, s: str) -> tuple[str, ...]:
+        """Split a string isbn1, with no separators."""
+        if not self._built:
+            self._pending -= 1
+            if self._pending >= 0:
+                return super().split(s)
+            self.build()
+        constraint(len(s) == 13, 'length not 13')
+        constraint(s.isdigit(), 'non-digit')
+        return self._splitters[self._code(s)](s)
+
+    def split_many(self, isbns: Iterable[str]) -> list[tuple[str, ...]]:
+        """Split each string isbn1, with no separators."""
+        self.build()
+        coarse = self._coarse
+        fine = self._fine
+        cdigits = self.COARSE
+        fdigits = self.FINE
+        first = self.FIRST
+        n = len(coarse)
+        splitters = self._splitters
+        r = []
+        for s in isbns:
+            constraint(len(s) == 13, 'length not 13')
+            constraint(s.isdigit(), 'non-digit')
+            block = int(s[: cdigits]) - first
+            if not (0 <= block < n and (code := coarse[block])):
+                code = fine.get(int(s[: fdigits]), 0)
+            r.append(splitters[code](s))
+        return r
+
+# Binary range data, as written by `extra/make_isbn_ranges.py`.
+#
+# All integers are little-endian. A header (RANGE_HEADER) holds
+# RANGE_MAGIC, the number of ranges N, and the size of the agency table.
+# Then follow N uint64 range starts in ascending order, N uint32 splits,
+# and the agency table as UTF-8 lines of ‘prefix-group<TAB>agency’.
+
+RANGE_FILE = Path(__file__).with_name('isbn_ranges.bin')
+RANGE_MAGIC = b'fnaISBN1'
+RANGE_HEADER = struct.Struct('<8sII')
+
+class RangeData(NamedTuple):
+    start: Sequence[int]
+    split: Sequence[int]
+    agency: bytes
+
+    def agencies(self) -> RangeAgencies:
+        """Return the agency table."""
+        r: RangeAgencies = {}
+        for line in self.agency.decode('utf-8').splitlines():
+            key, agency = line.split('\t')
+            prefix, group = key.split('-', 1)
+            r[(prefix, group)] = agency
+        return r
+
+    def to_bytes(self) -> bytes:
+        """Return the binary form."""
+        start = array.array('Q', self.start)
+        split = array.array('I', self.split)
+        if sys.byteorder != 'little':   # pragma: no cover
+            start.byteswap()
+            split.byteswap()
+        return b''.join((RANGE_HEADER.pack(RANGE_MAGIC, len(start),
+                                           len(self.agency)),
+                         start.tobytes(), split.tobytes(), self.agency))
+
+    @classmethod
+    def from_agencies(cls, start: Sequence[int], split: Sequence[int],
+                      agencies: RangeAgencies) -> Self:
+        table = ''.join(f'{p}-{g}\t{a}\n' for (p, g), a in agencies.items())
+        return cls(start, split, table.encode('utf-8'))
+
+def map_ranges(path: Path = RANGE_FILE) -> RangeData:
+    """
+    Return the binary range data in `path`.
+
+    The file is memory-mapped, and the start and split sequences are
+    views of it, so only the pages actually looked at are read.
+    """
+    import mmap
+    with path.open('rb') as f:
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    magic, n, m = RANGE_HEADER.unpack_from(buffer)
+    i = RANGE_HEADER.size
+    j = i + 8 * n
+    k = j + 4 * n
+    if magic != RANGE_MAGIC or len(buffer) != k + m:
+        message = f'{path}: not ISBN range data'
+        raise ValueError(message)
+    start: Sequence[int] = buffer[i : j].cast('Q')
+    split: Sequence[int] = buffer[j : k].cast('I')
+    if sys.byteorder != 'little':   # pragma: no cover
+        start = array.array('Q', start)
+        split = array.array('I', split)
+        start.byteswap()
+        split.byteswap()
+    return RangeData(start, split, bytes(buffer[k :]))
+
 class ISBN(EAN13):
     """Represents an ISBN (International Standard Book Number)."""
 
-    _ranges = Ranges(isbn_ranges.START, isbn_ranges.SPLIT)
+    __slots__ = ('_parts', )   # Set on first split().
+
+    _parts: tuple[str, ...]
+
+    _ranges: Ranges | None = None
     split_all = False
 
     def __init__(self, s: str, *, split: bool = False) -> None:
@@ -57,10 +261,21 @@ class ISBN(EAN13):
         if v is None:
             raise ValueError(s)
         super().__init__(v, 'isbn')
-        self._parts: tuple[str, ...] | None = None
         if split or self.split_all:
             self.split()
 
+    @classmethod
+    def try_parse(cls, s: str) -> Self | None:
+        return cls(s) if isinstance(s, str) and is13(s, 'isbn') else None
+
+    @classmethod
+    def ranges(cls) -> Ranges:
+        """Return the split table, mapping the range data on first use."""
+        if cls._ranges is None:
+            data = map_ranges()
+            cls._ranges = PrefixRanges(data.start, data.split)
+        return cls._ranges
+
     def isbn13(self) -> str:
         """Return an unsplit ISBN-13."""
         return self._value
@@ -73,9 +288,11 @@ class ISBN(EAN13):
         return None
 
     def split(self) -> tuple[str, ...]:
-        if self._parts is None:
-            self._parts = self._ranges.split(self._value)
-        return self._parts
+        try:
+            return self._parts
+        except AttributeError:
+            init_attr(self, '_parts', self.ranges().split(self._value))
+            return self._parts
 
     def split13(self) -> str:
         """Return a canonically split ISBN-13."""
@@ -91,9 +308,17 @@ class ISBN(EAN13):
 
 def is_valid_isbn10(s: str) -> bool:
     """Check for 10-character-only form."""
-    return (len(s) == 10 and s[0 : 8].isdigit()
-            and checksum.mod11(s[0 : 8]) == s[9])
+    return (len(s) == 10 and s[0 : 9].isdigit()
+            and checksum.mod11(s[0 : 9]) == s[9])
 
 def is_valid_isbn13(s: str) -> bool:
     """Check for 13-digit-only form."""
     return is_valid_ean13(s)
+
+def is_valid_isbn10_many(strings: Sequence[str]) -> list[bool]:
+    """Check each of `strings` as by `is_valid_isbn10()`."""
+    return checksum.is_valid_mod11_many(strings, 10, is_valid_isbn10)
+
+def is_valid_isbn13_many(strings: Sequence[str]) -> list[bool]:
+    """Check each of `strings` as by `is_valid_isbn13()`."""
+    return is_valid_ean13_many(strings)
@@ -1,279 +0,0 @@
-"""Generated ISBN range data."""
-
-# DO NOT EDIT!
-# Generated from third_party/data/RangeMessage.xml
-# at 2023-05-22T15:22:32.685466+00:00
-
-from array import array
-
-AGENCY = {('978', '0'): 'English language',
- ('978', '1'): 'English language',
- ('978', '2'): 'French language',
- ('978', '3'): 'German language',
- ('978', '4'): 'Japan',
- ('978', '5'): 'former U.S.S.R',
- ('978', '600'): 'Iran',
- ('978', '601'): 'Kazakhstan',
- ('978', '602'): 'Indonesia',
- ('978', '603'): 'Saudi Arabia',
- ('978', '604'): 'Vietnam',
- ('978', '605'): 'Turkey',
- ('978', '606'): 'Romania',
- ('978', '607'): 'Mexico',
- ('978', '608'): 'North Macedonia',
- ('978', '609'): 'Lithuania',
- ('978', '611'): 'Thailand',
- ('978', '612'): 'Peru',
- ('978', '613'): 'Mauritius',
- ('978', '614'): 'Lebanon',
- ('978', '615'): 'Hungary',
- ('978', '616'): 'Thailand',
- ('978', '617'): 'Ukraine',
- ('978', '618'): 'Greece',
- ('978', '619'): 'Bulgaria',
- ('978', '620'): 'Mauritius',
- ('978', '621'): 'Philippines',
- ('978', '622'): 'Iran',
- ('978', '623'): 'Indonesia',
- ('978', '624'): 'Sri Lanka',
- ('978', '625'): 'Turkey',
- ('978', '626'): 'Taiwan',
- ('978', '627'): 'Pakistan',
- ('978', '628'): 'Colombia',
- ('978', '629'): 'Malaysia',
- ('978', '630'): 'Romania',
- ('978', '631'): 'Argentina',
- ('978', '65'): 'Brazil',
- ('978', '7'): "China, People's Republic",
- ('978', '80'): 'former Czechoslovakia',
- ('978', '81'): 'India',
- ('978', '82'): 'Norway',
- ('978', '83'): 'Poland',
- ('978', '84'): 'Spain',
- ('978', '85'): 'Brazil',
- ('978', '86'): 'former Yugoslavia',
- ('978', '87'): 'Denmark',
- ('978', '88'): 'Italy',
- ('978', '89'): 'Korea, Republic',
- ('978', '90'): 'Netherlands',
- ('978', '91'): 'Sweden',
- ('978', '92'): 'International NGO Publishers and EU Organizations',
- ('978', '93'): 'India',
- ('978', '94'): 'Netherlands',
- ('978', '950'): 'Argentina',
- ('978', '951'): 'Finland',
- ('978', '952'): 'Finland',
- ('978', '953'): 'Croatia',
- ('978', '954'): 'Bulgaria',
- ('978', '955'): 'Sri Lanka',
- ('978', '956'): 'Chile',
- ('978', '957'): 'Taiwan',
- ('978', '958'): 'Colombia',
- ('978', '959'): 'Cuba',
- ('978', '960'): 'Greece',
- ('978', '961'): 'Slovenia',
- ('978', '962'): 'Hong Kong, China',
- ('978', '963'): 'Hungary',
- ('978', '964'): 'Iran',
- ('978', '965'): 'Israel',
- ('978', '966'): 'Ukraine',
- ('978', '967'): 'Malaysia',
- ('978', '968'): 'Mexico',
- ('978', '969'): 'Pakistan',
- ('978', '970'): 'Mexico',
- ('978', '971'): 'Philippines',
- ('978', '972'): 'Portugal',
- ('978', '973'): 'Romania',
- ('978', '974'): 'Thailand',
- ('978', '975'): 'Turkey',
- ('978', '976'): 'Caribbean Community',
- ('978', '977'): 'Egypt',
- ('978', '978'): 'Nigeria',
- ('978', '979'): 'Indonesia',
- ('978', '980'): 'Venezuela',
- ('978', '981'): 'Singapore',
- ('978', '982'): 'South Pacific',
- ('978', '983'): 'Malaysia',
- ('978', '984'): 'Bangladesh',
- ('978', '985'): 'Belarus',
- ('978', '986'): 'Taiwan',
- ('978', '987'): 'Argentina',
- ('978', '988'): 'Hong Kong, China',
- ('978', '989'): 'Portugal',
- ('978', '9911'): 'Montenegro',
- ('978', '9912'): 'Tanzania',
- ('978', '9913'): 'Uganda',
- ('978', '9914'): 'Kenya',
- ('978', '9915'): 'Uruguay',
- ('978', '9916'): 'Estonia',
- ('978', '9917'): 'Bolivia',
- ('978', '9918'): 'Malta',
- ('978', '9919'): 'Mongolia',
- ('978', '9920'): 'Morocco',
- ('978', '9921'): 'Kuwait',
- ('978', '9922'): 'Iraq',
- ('978', '9923'): 'Jordan',
- ('978', '9924'): 'Cambodia',
- ('978', '9925'): 'Cyprus',
- ('978', '9926'): 'Bosnia and Herzegovina',
- ('978', '9927'): 'Qatar',
- ('978', '9928'): 'Albania',
- ('978', '9929'): 'Guatemala',
- ('978', '9930'): 'Costa Rica',
- ('978', '9931'): 'Algeria',
- ('978', '9932'): "Lao People's Democratic Republic",
- ('978', '9933'): 'Syria',
- ('978', '9934'): 'Latvia',
- ('978', '9935'): 'Iceland',
- ('978', '9936'): 'Afghanistan',
- ('978', '9937'): 'Nepal',
- ('978', '9938'): 'Tunisia',
- ('978', '9939'): 'Armenia',
- ('978', '9940'): 'Montenegro',
- ('978', '9941'): 'Georgia',
- ('978', '9942'): 'Ecuador',
- ('978', '9943'): 'Uzbekistan',
- ('978', '9944'): 'Turkey',
- ('978', '9945'): 'Dominican Republic',
- ('978', '9946'): 'Korea, P.D.R.',
- ('978', '9947'): 'Algeria',
- ('978', '9948'): 'United Arab Emirates',
- ('978', '9949'): 'Estonia',
- ('978', '9950'): 'Palestine',
- ('978', '9951'): 'Kosova',
- ('978', '9952'): 'Azerbaijan',
- ('978', '9953'): 'Lebanon',
- ('978', '9954'): 'Morocco',
- ('978', '9955'): 'Lithuania',
- ('978', '9956'): 'Cameroon',
- ('978', '9957'): 'Jordan',
- ('978', '9958'): 'Bosnia and Herzegovina',
- ('978', '9959'): 'Libya',
- ('978', '9960'): 'Saudi Arabia',
- ('978', '9961'): 'Algeria',
- ('978', '9962'): 'Panama',
- ('978', '9963'): 'Cyprus',
- ('978', '9964'): 'Ghana',
- ('978', '9965'): 'Kazakhstan',
- ('978', '9966'): 'Kenya',
- ('978', '9967'): 'Kyrgyz Republic',
- ('978', '9968'): 'Costa Rica',
- ('978', '9969'): 'Algeria',
- ('978', '9970'): 'Uganda',
- ('978', '9971'): 'Singapore',
- ('978', '9972'): 'Peru',
- ('978', '9973'): 'Tunisia',
- ('978', '9974'): 'Uruguay',
- ('978', '9975'): 'Moldova',
- ('978', '9976'): 'Tanzania',
- ('978', '9977'): 'Costa Rica',
- ('978', '9978'): 'Ecuador',
- ('978', '9979'): 'Iceland',
- ('978', '9980'): 'Papua New Guinea',
- ('978', '9981'): 'Morocco',
- ('978', '9982'): 'Zambia',
- ('978', '9983'): 'Gambia',
- ('978', '9984'): 'Latvia',
- ('978', '9985'): 'Estonia',
- ('978', '9986'): 'Lithuania',
- ('978', '9987'): 'Tanzania',
- ('978', '9988'): 'Ghana',
- ('978', '9989'): 'North Macedonia',
- ('978', '99901'): 'Bahrain',
- ('978', '99902'): 'Reserved Agency',
- ('978', '99903'): 'Mauritius',
- ('978', '99904'): 'Curaçao',
- ('978', '99905'): 'Bolivia',
- ('978', '99906'): 'Kuwait',
- ('978', '99908'): 'Malawi',
- ('978', '99909'): 'Malta',
- ('978', '99910'): 'Sierra Leone',
- ('978', '99911'): 'Lesotho',
- ('978', '99912'): 'Botswana',
- ('978', '99913'): 'Andorra',
- ('978', '99914'): 'International NGO Publishers',
- ('978', '99915'): 'Maldives',
- ('978', '99916'): 'Namibia',
- ('978', '99917'): 'Brunei Darussalam',
- ('978', '99918'): 'Faroe Islands',
- ('978', '99919'): 'Benin',
- ('978', '99920'): 'Andorra',
- ('978', '99921'): 'Qatar',
- ('978', '99922'): 'Guatemala',
- ('978', '99923'): 'El Salvador',
- ('978', '99924'): 'Nicaragua',
- ('978', '99925'): 'Paraguay',
- ('978', '99926'): 'Honduras',
- ('978', '99927'): 'Albania',
- ('978', '99928'): 'Georgia',
- ('978', '99929'): 'Mongolia',
- ('978', '99930'): 'Armenia',
- ('978', '99931'): 'Seychelles',
- ('978', '99932'): 'Malta',
- ('978', '99933'): 'Nepal',
- ('978', '99934'): 'Dominican Republic',
- ('978', '99935'): 'Haiti',
- ('978', '99936'): 'Bhutan',
- ('978', '99937'): 'Macau',
- ('978', '99938'): 'Srpska, Republic of',
- ('978', '99939'): 'Guatemala',
- ('978', '99940'): 'Georgia',
- ('978', '99941'): 'Armenia',
- ('978', '99942'): 'Sudan',
- ('978', '99943'): 'Albania',
- ('978', '99944'): 'Ethiopia',
- ('978', '99945'): 'Namibia',
- ('978', '99946'): 'Nepal',
- ('978', '99947'): 'Tajikistan',
- ('978', '99948'): 'Eritrea',
- ('978', '99949'): 'Mauritius',
- ('978', '99950'): 'Cambodia',
- ('978', '99951'): 'Reserved Agency',
- ('978', '99952'): 'Mali',
- ('978', '99953'): 'Paraguay',
- ('978', '99954'): 'Bolivia',
- ('978', '99955'): 'Srpska, Republic of',
- ('978', '99956'): 'Albania',
- ('978', '99957'): 'Malta',
- ('978', '99958'): 'Bahrain',
- ('978', '99959'): 'Luxembourg',
- ('978', '99960'): 'Malawi',
- ('978', '99961'): 'El Salvador',
- ('978', '99962'): 'Mongolia',
- ('978', '99963'): 'Cambodia',
- ('978', '99964'): 'Nicaragua',
- ('978', '99965'): 'Macau',
- ('978', '99966'): 'Kuwait',
- ('978', '99967'): 'Paraguay',
- ('978', '99968'): 'Botswana',
- ('978', '99969'): 'Oman',
- ('978', '99970'): 'Haiti',
- ('978', '99971'): 'Myanmar',
- ('978', '99972'): 'Faroe Islands',
- ('978', '99973'): 'Mongolia',
- ('978', '99974'): 'Bolivia',
- ('978', '99975'): 'Tajikistan',
- ('978', '99976'): 'Srpska, Republic of',
- ('978', '99977'): 'Rwanda',
- ('978', '99978'): 'Mongolia',
- ('978', '99979'): 'Honduras',
- ('978', '99980'): 'Bhutan',
- ('978', '99981'): 'Macau',
- ('978', '99982'): 'Benin',
- ('978', '99983'): 'El Salvador',
- ('978', '99984'): 'Brunei Darussalam',
- ('978', '99985'): 'Tajikistan',
- ('978', '99986'): 'Myanmar',
- ('978', '99987'): 'Luxembourg',
- ('978', '99988'): 'Sudan',
- ('978', '99989'): 'Paraguay',
- ('978', '99990'): 'Ethiopia',
- ('978', '99992'): 'Oman',
- ('979', '10'): 'France',
- ('979', '11'): 'Korea, Republic',
- ('979', '12'): 'Italy',
- ('979', '8'): 'United States'}
-
-START = array('Q', [9780000000000, 9780200000000, 9780228000000, 9780229000000, 9780369000000, 9780370000000, 9780639000000, 9780639800000, 9780640000000, 9780645000000, 9780646000000, 9780648000000, 9780649000000, 9780655000000, 9780656000000, 9780700000000, 9780850000000, 9780900000000, 9780950000000, 9781000000000, 9781010000000, 9781030000000, 9781035000000, 9781040000000, 9781050000000, 9781070000000, 9781100000000, 9781398000000, 9781550000000, 9781650000000, 9781680000000, 9781686000000, 9781714000000, 9781717000000, 9781732000000, 9781740000000, 9781775000000, 9781775400000, 9781776400000, 9781776500000, 9781777000000, 9781778300000, 9781790000000, 9781800000000, 9781800500000, 9781805000000, 9781838000000, 9781838500000, 9781867200000, 9781867600000, 9781869800000, 9781916000000, 9781916506000, 9781916870000, 9781916908000, 9781919600000, 9781919655000, 9781973000000, 9781987800000, 9781991150000, 9781991200000, 9781998990000, 9782000000000, 9782200000000, 9782350000000, 9782400000000, 9782487000000, 9782495000000, 9782496000000, 9782496700000, 9782497000000, 9782700000000, 9782840000000, 9782900000000, 9782919800000, 9782919810000, 9782919943000, 9782919969000, 9782950000000, 9783000000000, 9783030000000, 9783034000000, 9783037000000, 9783040000000, 9783200000000, 9783700000000, 9783850000000, 9783900000000, 9783950000000, 9783954000000, 9783970000000, 9783985000000, 9784000000000, 9784200000000, 9784700000000, 9784850000000, 9784900000000, 9784950000000, 9785000000000, 9785005000000, 9785010000000, 9785200000000, 9785362000000, 9785362400000, 9785363000000, 9785421000000, 9785430000000, 9785431000000, 9785440000000, 9785441000000, 9785450000000, 9785604000000, 9785605000000, 9785700000000, 9785850000000, 9785900000000, 9785910000000, 9785920000000, 9785930000000, 9785950000000, 9785950100000, 9785980000000, 9785990000000, 9785991000000, 9786000000000, 9786001000000, 9786005000000, 9786009000000, 9786009868000, 9786009930000, 9786009960000, 9786010000000, 9786012000000, 9786017000000, 9786018000000, 9786018500000, 9786020000000, 9786020700000, 9786021400000, 9786021500000, 9786021700000, 9786022000000, 9786025000000, 9786025400000, 9786026000000, 9786026200000, 9786027000000, 9786027500000, 9786029500000, 9786030000000, 9786030500000, 9786035000000, 9786038000000, 9786039000000, 9786040000000, 9786043000000, 9786044000000, 9786044700000, 9786044980000, 9786045000000, 9786049000000, 9786049800000, 9786050000000, 9786050300000, 9786050400000, 9786050600000, 9786050700000, 9786051000000, 9786052000000, 9786052400000, 9786054000000, 9786056000000, 9786057500000, 9786058000000, 9786059000000, 9786060000000, 9786061000000, 9786065000000, 9786068000000, 9786069100000, 9786069200000, 9786069600000, 9786069750000, 9786070000000, 9786074000000, 9786075930000, 9786076000000, 9786077500000, 9786079500000, 9786080000000, 9786081000000, 9786082000000, 9786084500000, 9786086500000, 9786087000000, 9786090000000, 9786094000000, 9786098000000, 9786099500000, 9786110000000, 9786120000000, 9786123000000, 9786124000000, 9786124500000, 9786125000000, 9786125150000, 9786130000000, 9786140000000, 9786144000000, 9786148000000, 9786149500000, 9786150000000, 9786151000000, 9786155000000, 9786158000000, 9786159000000, 9786160000000, 9786162000000, 9786167000000, 9786169000000, 9786170000000, 9786175000000, 9786177000000, 9786179000000, 9786180000000, 9786182000000, 9786185000000, 9786188000000, 9786190000000, 9786191500000, 9786197000000, 9786199000000, 9786200000000, 9786210000000, 9786213000000, 9786214000000, 9786216000000, 9786218000000, 9786219000000, 9786219500000, 9786220000000, 9786221100000, 9786222000000, 9786224250000, 9786225200000, 9786228500000, 9786229000000, 9786230000000, 9786231000000, 9786231300000, 9786235000000, 9786235250000, 9786238800000, 9786240000000, 9786240500000, 9786242000000, 9786242500000, 9786245000000, 9786246450000, 9786249450000, 9786250000000, 9786250100000, 9786253650000, 9786254430000, 9786254450000, 9786254500000, 9786256350000, 9786257794000, 9786257795000, 9786258500000, 9786259900000, 9786260000000, 9786260500000, 9786263000000, 9786265000000, 9786267000000, 9786268000000, 9786269500000, 9786270000000, 9786273000000, 9786273200000, 9786275000000, 9786275250000, 9786277500000, 9786278000000, 9786280000000, 9786281000000, 9786285000000, 9786285500000, 9786287500000, 9786288500000, 9786289500000, 9786290000000, 9786290300000, 9786294700000, 9786295000000, 9786297500000, 9786298000000, 9786299650000, 9786300000000, 9786303000000, 9786303500000, 9786306500000, 9786306850000, 9786310000000, 9786311000000, 9786313000000, 9786314000000, 9786316500000, 9786317500000, 9786319000000, 9786500000000, 9786502000000, 9786525000000, 9786530000000, 9786530300000, 9786550000000, 9786551300000, 9786553500000, 9786561500000, 9786580000000, 9786581825000, 9786584500000, 9786590000000, 9786590245000, 9786598000000, 9787000000000, 9787100000000, 9787500000000, 9787800000000, 9787900000000, 9788000000000, 9788020000000, 9788053000000, 9788055000000, 9788069000000, 9788070000000, 9788085000000, 9788090000000, 9788099900000, 9788100000000, 9788119000000, 9788120000000, 9788170000000, 9788185000000, 9788190000000, 9788200000000, 9788220000000, 9788269000000, 9788270000000, 9788290000000, 9788299000000, 9788300000000, 9788320000000, 9788360000000, 9788370000000, 9788385000000, 9788390000000, 9788400000000, 9788410000000, 9788410500000, 9788412000000, 9788413000000, 9788414000000, 9788415000000, 9788420000000, 9788470000000, 9788485000000, 9788490000000, 9788492000000, 9788492400000, 9788493000000, 9788495000000, 9788497000000, 9788500000000, 9788520000000, 9788545500000, 9788545530000, 9788545600000, 9788552900000, 9788553200000, 9788553400000, 9788554000000, 9788554030000, 9788554040000, 9788554050000, 9788554090000, 9788554100000, 9788554400000, 9788554800000, 9788555000000, 9788560000000, 9788570000000, 9788585000000, 9788590000000, 9788592500000, 9788594500000, 9788596000000, 9788598000000, 9788600000000, 9788630000000, 9788660000000, 9788680000000, 9788690000000, 9788700000000, 9788730000000, 9788740000000, 9788765000000, 9788770000000, 9788780000000, 9788785000000, 9788795000000, 9788797000000, 9788800000000, 9788820000000, 9788831200000, 9788831500000, 9788831900000, 9788832300000, 9788832700000, 9788833900000, 9788836100000, 9788836300000, 9788854900000, 9788855500000, 9788860000000, 9788885000000, 9788890000000, 9788891000000, 9788892700000, 9788894000000, 9788894800000, 9788900000000, 9788925000000, 9788955000000, 9788985000000, 9788995000000, 9788997000000, 9788999000000, 9789000000000, 9789020000000, 9789050000000, 9789070000000, 9789080000000, 9789085000000, 9789090000000, 9789091000000, 9789094000000, 9789095000000, 9789100000000, 9789120000000, 9789150000000, 9789165000000, 9789170000000, 9789182000000, 9789185000000, 9789195000000, 9789197000000, 9789200000000, 9789260000000, 9789280000000, 9789290000000, 9789295000000, 9789299000000, 9789300000000, 9789310000000, 9789350000000, 9789380000000, 9789396000000, 9789400000000, 9789460000000, 9789490000000, 9789500000000, 9789505000000, 9789509000000, 9789509900000, 9789510000000, 9789512000000, 9789515500000, 9789518900000, 9789519500000, 9789520000000, 9789522000000, 9789525000000, 9789526000000, 9789526500000, 9789526600000, 9789526700000, 9789527000000, 9789528000000, 9789529500000, 9789529900000, 9789530000000, 9789531000000, 9789531500000, 9789534800000, 9789535000000, 9789535010000, 9789535100000, 9789535500000, 9789536000000, 9789539500000, 9789540000000, 9789542900000, 9789543000000, 9789548000000, 9789549000000, 9789549300000, 9789550000000, 9789552000000, 9789553400000, 9789553550000, 9789553600000, 9789553800000, 9789553900000, 9789554100000, 9789554500000, 9789555000000, 9789555500000, 9789557110000, 9789557150000, 9789559500000, 9789560000000, 9789560900000, 9789561000000, 9789562000000, 9789566000000, 9789567000000, 9789570000000, 9789570300000, 9789570500000, 9789572000000, 9789572100000, 9789572800000, 9789573100000, 9789574400000, 9789578200000, 9789579700000, 9789580000000, 9789585000000, 9789585100000, 9789585200000, 9789585400000, 9789585600000, 9789586000000, 9789588000000, 9789589500000, 9789590000000, 9789592000000, 9789597000000, 9789598500000, 9789600000000, 9789602000000, 9789606600000, 9789606900000, 9789607000000, 9789608500000, 9789609300000, 9789609400000, 9789609800000, 9789610000000, 9789612000000, 9789616000000, 9789619000000, 9789619800000, 9789620000000, 9789622000000, 9789627000000, 9789628500000, 9789628700000, 9789629000000, 9789630000000, 9789632000000, 9789637000000, 9789638500000, 9789639000000, 9789640000000, 9789641500000, 9789642500000, 9789643000000, 9789645500000, 9789649000000, 9789649700000, 9789649900000, 9789650000000, 9789652000000, 9789656000000, 9789657000000, 9789658000000, 9789659000000, 9789660000000, 9789661300000, 9789661400000, 9789661500000, 9789661700000, 9789662000000, 9789662790000, 9789662900000, 9789663000000, 9789667000000, 9789669000000, 9789669100000, 9789669500000, 9789669800000, 9789670000000, 9789671000000, 9789672000000, 9789672500000, 9789672550000, 9789672700000, 9789672800000, 9789673000000, 9789675000000, 9789676000000, 9789679000000, 9789679900000, 9789679990000, 9789680100000, 9789684000000, 9789685000000, 9789688000000, 9789689000000, 9789690000000, 9789692000000, 9789692100000, 9789692200000, 9789692300000, 9789692400000, 9789694000000, 9789697500000, 9789700100000, 9789706000000, 9789709000000, 9789709100000, 9789709700000, 9789710000000, 9789710160000, 9789710200000, 9789710300000, 9789710600000, 9789715000000, 9789718500000, 9789719100000, 9789719600000, 9789719700000, 9789719900000, 9789720000000, 9789722000000, 9789725500000, 9789728000000, 9789729500000, 9789730000000, 9789731000000, 9789731700000, 9789732000000, 9789735500000, 9789737600000, 9789738500000, 9789738900000, 9789739500000, 9789740000000, 9789742000000, 9789747000000, 9789748500000, 9789749000000, 9789749500000, 9789750000000, 9789750200000, 9789752400000, 9789752500000, 9789756000000, 9789759200000, 9789759900000, 9789760000000, 9789764000000, 9789766000000, 9789768000000, 9789769500000, 9789770000000, 9789772000000, 9789775000000, 9789777000000, 9789778500000, 9789778930000, 9789778950000, 9789779000000, 9789779900000, 9789780000000, 9789782000000, 9789783000000, 9789787800000, 9789788000000, 9789789000000, 9789790000000, 9789791000000, 9789791500000, 9789792000000, 9789793000000, 9789794000000, 9789798000000, 9789799500000, 9789800000000, 9789802000000, 9789806000000, 9789810000000, 9789811700000, 9789811800000, 9789812000000, 9789813000000, 9789813100000, 9789814000000, 9789819500000, 9789819900000, 9789820000000, 9789821000000, 9789827000000, 9789829000000, 9789829800000, 9789830000000, 9789830200000, 9789832000000, 9789834000000, 9789834500000, 9789835000000, 9789838000000, 9789839000000, 9789839900000, 9789840000000, 9789844000000, 9789848000000, 9789849000000, 9789850000000, 9789854000000, 9789856000000, 9789858800000, 9789859000000, 9789860000000, 9789860600000, 9789860700000, 9789860800000, 9789861200000, 9789865400000, 9789868000000, 9789870000000, 9789871000000, 9789872000000, 9789873000000, 9789873600000, 9789874200000, 9789874400000, 9789874500000, 9789874900000, 9789875000000, 9789878250000, 9789878280000, 9789878300000, 9789878500000, 9789878900000, 9789879500000, 9789880000000, 9789881200000, 9789882000000, 9789887000000, 9789888000000, 9789889700000, 9789890000000, 9789892000000, 9789893500000, 9789893700000, 9789895300000, 9789895500000, 9789898000000, 9789899500000, 9789911000000, 9789911200000, 9789911250000, 9789911550000, 9789911750000, 9789912000000, 9789912400000, 9789912450000, 9789912750000, 9789912800000, 9789912980000, 9789913000000, 9789913080000, 9789913600000, 9789913700000, 9789913955000, 9789914000000, 9789914400000, 9789914530000, 9789914700000, 9789914775000, 9789914960000, 9789915000000, 9789915400000, 9789915600000, 9789915650000, 9789915800000, 9789915930000, 9789916000000, 9789916100000, 9789916400000, 9789916600000, 9789916800000, 9789916950000, 9789917000000, 9789917100000, 9789917300000, 9789917350000, 9789917600000, 9789917700000, 9789917980000, 9789918000000, 9789918100000, 9789918200000, 9789918300000, 9789918600000, 9789918800000, 9789918950000, 9789919000000, 9789919100000, 9789919200000, 9789919300000, 9789919500000, 9789919600000, 9789919900000, 9789920000000, 9789920300000, 9789920420000, 9789920500000, 9789920800000, 9789920875000, 9789921000000, 9789921100000, 9789921300000, 9789921400000, 9789921700000, 9789921900000, 9789921970000, 9789922000000, 9789922200000, 9789922300000, 9789922600000, 9789922800000, 9789922850000, 9789923000000, 9789923100000, 9789923600000, 9789923700000, 9789923900000, 9789923940000, 9789924000000, 9789924300000, 9789924400000, 9789924500000, 9789924650000, 9789924900000, 9789925000000, 9789925300000, 9789925550000, 9789925735000, 9789926000000, 9789926200000, 9789926400000, 9789926800000, 9789927000000, 9789927100000, 9789927400000, 9789927500000, 9789928000000, 9789928100000, 9789928400000, 9789928500000, 9789928800000, 9789928900000, 9789929000000, 9789929400000, 9789929550000, 9789929800000, 9789930000000, 9789930500000, 9789930940000, 9789931000000, 9789931240000, 9789931900000, 9789932000000, 9789932400000, 9789932850000, 9789933000000, 9789933100000, 9789933400000, 9789933900000, 9789934000000, 9789934100000, 9789934500000, 9789934800000, 9789935000000, 9789935100000, 9789935400000, 9789935900000, 9789936000000, 9789936200000, 9789936400000, 9789936800000, 9789937000000, 9789937300000, 9789937500000, 9789937800000, 9789938000000, 9789938800000, 9789938950000, 9789938975000, 9789938991000, 9789939000000, 9789939500000, 9789939800000, 9789939900000, 9789939960000, 9789939980000, 9789940000000, 9789940200000, 9789940500000, 9789940840000, 9789940870000, 9789941000000, 9789941100000, 9789941400000, 9789941800000, 9789941900000, 9789942000000, 9789942600000, 9789942700000, 9789942750000, 9789942850000, 9789942900000, 9789942985000, 9789943000000, 9789943300000, 9789943400000, 9789943975000, 9789944000000, 9789944100000, 9789944500000, 9789944600000, 9789944700000, 9789944800000, 9789944900000, 9789945000000, 9789945010000, 9789945080000, 9789945400000, 9789945570000, 9789945580000, 9789945800000, 9789945810000, 9789945850000, 9789946000000, 9789946200000, 9789946400000, 9789946900000, 9789947000000, 9789947200000, 9789947800000, 9789948000000, 9789948400000, 9789948850000, 9789949000000, 9789949090000, 9789949100000, 9789949400000, 9789949700000, 9789949720000, 9789949750000, 9789949900000, 9789950000000, 9789950300000, 9789950850000, 9789951000000, 9789951390000, 9789951850000, 9789951980000, 9789952000000, 9789952200000, 9789952400000, 9789952800000, 9789953000000, 9789953100000, 9789953400000, 9789953600000, 9789953900000, 9789953930000, 9789953970000, 9789954000000, 9789954200000, 9789954400000, 9789954800000, 9789954990000, 9789955000000, 9789955400000, 9789955930000, 9789956000000, 9789956100000, 9789956400000, 9789956900000, 9789957000000, 9789957400000, 9789957650000, 9789957680000, 9789957700000, 9789957850000, 9789957880000, 9789958000000, 9789958020000, 9789958030000, 9789958040000, 9789958090000, 9789958100000, 9789958190000, 9789958200000, 9789958500000, 9789958900000, 9789959000000, 9789959200000, 9789959800000, 9789959950000, 9789959970000, 9789959980000, 9789960000000, 9789960600000, 9789960900000, 9789961000000, 9789961300000, 9789961700000, 9789961950000, 9789962000000, 9789962550000, 9789962560000, 9789962600000, 9789962850000, 9789963000000, 9789963200000, 9789963250000, 9789963280000, 9789963300000, 9789963550000, 9789963735000, 9789963750000, 9789964000000, 9789964700000, 9789964950000, 9789965000000, 9789965400000, 9789965900000, 9789966000000, 9789966140000, 9789966150000, 9789966200000, 9789966700000, 9789966750000, 9789966821000, 9789966825000, 9789966826000, 9789966829000, 9789966960000, 9789967000000, 9789967400000, 9789967900000, 9789968000000, 9789968500000, 9789968940000, 9789969000000, 9789969070000, 9789969500000, 9789969650000, 9789969970000, 9789970000000, 9789970400000, 9789970900000, 9789971000000, 9789971600000, 9789971900000, 9789971990000, 9789972000000, 9789972100000, 9789972200000, 9789972250000, 9789972300000, 9789972600000, 9789972900000, 9789973000000, 9789973060000, 9789973090000, 9789973100000, 9789973700000, 9789973970000, 9789974000000, 9789974300000, 9789974550000, 9789974750000, 9789974880000, 9789974910000, 9789974950000, 9789975000000, 9789975100000, 9789975300000, 9789975400000, 9789975450000, 9789975900000, 9789975950000, 9789976000000, 9789976500000, 9789976580000, 9789976590000, 9789976900000, 9789976990000, 9789977000000, 9789977900000, 9789977990000, 9789978000000, 9789978300000, 9789978400000, 9789978950000, 9789978990000, 9789979000000, 9789979500000, 9789979650000, 9789979660000, 9789979760000, 9789979900000, 9789980000000, 9789980400000, 9789980900000, 9789980990000, 9789981000000, 9789981100000, 9789981160000, 9789981200000, 9789981800000, 9789981950000, 9789982000000, 9789982800000, 9789982990000, 9789983000000, 9789983800000, 9789983950000, 9789983990000, 9789984000000, 9789984500000, 9789984900000, 9789985000000, 9789985500000, 9789985800000, 9789985900000, 9789986000000, 9789986400000, 9789986900000, 9789986940000, 9789986970000, 9789987000000, 9789987400000, 9789987880000, 9789988000000, 9789988400000, 9789988550000, 9789988750000, 9789989000000, 9789989100000, 9789989200000, 9789989300000, 9789989600000, 9789989950000, 9789990100000, 9789990150000, 9789990180000, 9789990200000, 9789990300000, 9789990320000, 9789990390000, 9789990400000, 9789990460000, 9789990490000, 9789990500000, 9789990540000, 9789990580000, 9789990600000, 9789990630000, 9789990660000, 9789990670000, 9789990690000, 9789990695000, 9789990800000, 9789990810000, 9789990890000, 9789990900000, 9789990940000, 9789990995000, 9789991000000, 9789991030000, 9789991090000, 9789991100000, 9789991160000, 9789991200000, 9789991240000, 9789991260000, 9789991290000, 9789991300000, 9789991330000, 9789991336000, 9789991360000, 9789991360500, 9789991400000, 9789991450000, 9789991470000, 9789991480000, 9789991490000, 9789991500000, 9789991550000, 9789991580000, 9789991600000, 9789991630000, 9789991670000, 9789991700000, 9789991730000, 9789991789000, 9789991800000, 9789991840000, 9789991880000, 9789991900000, 9789991930000, 9789991940000, 9789991980000, 9789992000000, 9789992050000, 9789992090000, 9789992100000, 9789992120000, 9789992170000, 9789992180000, 9789992190000, 9789992200000, 9789992240000, 9789992270000, 9789992300000, 9789992320000, 9789992380000, 9789992400000, 9789992420000, 9789992480000, 9789992500000, 9789992510000, 9789992520000, 9789992530000, 9789992540000, 9789992580000, 9789992600000, 9789992610000, 9789992660000, 9789992687000, 9789992690000, 9789992700000, 9789992730000, 9789992760000, 9789992800000, 9789992810000, 9789992880000, 9789992900000, 9789992950000, 9789992980000, 9789993000000, 9789993050000, 9789993080000, 9789993100000, 9789993150000, 9789993180000, 9789993200000, 9789993210000, 9789993260000, 9789993270000, 9789993280000, 9789993300000, 9789993330000, 9789993360000, 9789993400000, 9789993420000, 9789993480000, 9789993500000, 9789993530000, 9789993560000, 9789993570000, 9789993590000, 9789993600000, 9789993610000, 9789993660000, 9789993700000, 9789993720000, 9789993760000, 9789993800000, 9789993820000, 9789993860000, 9789993890000, 9789993900000, 9789993930000, 9789993960000, 9789993990000, 9789994000000, 9789994010000, 9789994070000, 9789994100000, 9789994130000, 9789994180000, 9789994200000, 9789994250000, 9789994280000, 9789994300000, 9789994330000, 9789994360000, 9789994400000, 9789994450000, 9789994480000, 9789994500000, 9789994550000, 9789994590000, 9789994600000, 9789994630000, 9789994660000, 9789994700000, 9789994730000, 9789994770000, 9789994800000, 9789994850000, 9789994880000, 9789994900000, 9789994920000, 9789994980000, 9789994990000, 9789994999000, 9789995000000, 9789995050000, 9789995080000, 9789995100000, 9789995200000, 9789995250000, 9789995280000, 9789995300000, 9789995330000, 9789995380000, 9789995394000, 9789995400000, 9789995430000, 9789995470000, 9789995488000, 9789995500000, 9789995520000, 9789995560000, 9789995580000, 9789995600000, 9789995660000, 9789995686000, 9789995700000, 9789995720000, 9789995780000, 9789995795000, 9789995800000, 9789995850000, 9789995894000, 9789995895000, 9789995900000, 9789995930000, 9789995960000, 9789996000000, 9789996007000, 9789996010000, 9789996095000, 9789996100000, 9789996130000, 9789996137000, 9789996190000, 9789996200000, 9789996250000, 9789996280000, 9789996300000, 9789996350000, 9789996392000, 9789996400000, 9789996420000, 9789996480000, 9789996500000, 9789996530000, 9789996536000, 9789996563000, 9789996600000, 9789996630000, 9789996670000, 9789996680000, 9789996697000, 9789996700000, 9789996710000, 9789996760000, 9789996800000, 9789996840000, 9789996860000, 9789996890000, 9789996900000, 9789996950000, 9789996980000, 9789996995000, 9789997000000, 9789997050000, 9789997090000, 9789997100000, 9789997140000, 9789997185000, 9789997200000, 9789997250000, 9789997290000, 9789997300000, 9789997340000, 9789997380000, 9789997400000, 9789997410000, 9789997426000, 9789997440000, 9789997464000, 9789997465000, 9789997480000, 9789997500000, 9789997530000, 9789997540000, 9789997580000, 9789997600000, 9789997610000, 9789997616000, 9789997620000, 9789997660000, 9789997680000, 9789997685000, 9789997690000, 9789997700000, 9789997720000, 9789997740000, 9789997770000, 9789997780000, 9789997799500, 9789997800000, 9789997850000, 9789997870000, 9789997900000, 9789997940000, 9789997980000, 9789998000000, 9789998010000, 9789998030000, 9789998060000, 9789998075000, 9789998100000, 9789998120000, 9789998127000, 9789998175000, 9789998200000, 9789998220000, 9789998250000, 9789998269000, 9789998290000, 9789998300000, 9789998310000, 9789998350000, 9789998370000, 9789998395000, 9789998400000, 9789998410000, 9789998450000, 9789998470000, 9789998495000, 9789998500000, 9789998520000, 9789998535000, 9789998580000, 9789998585000, 9789998600000, 9789998610000, 9789998650000, 9789998670000, 9789998695000, 9789998700000, 9789998770000, 9789998800000, 9789998810000, 9789998850000, 9789998855000, 9789998880000, 9789998882500, 9789998900000, 9789998910000, 9789998950000, 9789998965000, 9789998990000, 9789999000000, 9789999010000, 9789999050000, 9789999055000, 9789999097500, 9789999200000, 9789999220000, 9789999250000, 9789999265000, 9789999295000, 9791000000000, 9791020000000, 9791070000000, 9791090000000, 9791097600000, 9791100000000, 9791125000000, 9791155000000, 9791185000000, 9791195000000, 9791200000000, 9791220000000, 9791230000000, 9791254500000, 9791260000000, 9791280000000, 9791285000000, 9798000000000, 9798200000000, 9798230000000, 9798350000000, 9798400000000, 9798850000000, 9798885000000, 9798900000000, 9798985000000, 9798990000000])
-
-SPLIT = array('I', [1261, 1351, 1441, 1351, 1441, 1351, 1441, 1711, 1351, 1711, 1351, 1711, 1351, 1441, 1351, 1441, 1531, 1621, 1711, 1351, 1261, 1351, 1441, 1351, 1261, 1441, 1351, 1441, 1531, 1441, 1531, 1441, 1351, 1441, 1711, 1531, 1711, 1531, 1711, 1531, 1711, 1531, 1441, 1531, 1531, 1531, 1711, 1531, 1441, 1531, 1621, 1711, 1621, 1711, 1621, 1711, 1621, 1441, 1621, 1711, 1621, 1711, 1261, 1351, 1531, 1351, 1621, 1351, 1441, 1531, 1351, 1441, 1531, 1621, 1531, 1621, 1711, 1621, 1711, 1261, 1351, 1441, 1531, 1261, 1351, 1441, 1531, 1621, 1711, 1531, 1711, 1531, 1261, 1351, 1441, 1531, 1621, 1711, 1531, 1441, 1261, 1351, 1441, 1531, 1351, 1441, 1351, 1441, 1351, 1441, 1351, 1711, 1351, 1441, 1531, 1621, 1531, 1441, 1531, 1711, 1441, 1531, 1711, 1441, 3241, 3331, 3421, 3511, 3421, 3331, 3511, 3241, 3331, 3421, 3511, 3241, 3241, 3421, 3511, 3421, 3511, 3331, 3511, 3421, 3511, 3421, 3511, 3421, 3511, 3241, 3241, 3331, 3421, 3511, 3151, 3331, 3241, 3331, 3421, 3241, 3331, 3421, 3241, 3331, 3241, 3511, 3241, 3331, 3421, 3331, 3421, 3511, 3421, 3511, 3421, 3331, 3241, 3331, 3421, 3331, 3511, 3421, 3331, 3241, 3331, 3511, 3331, 3421, 3511, 3151, 3241, 3331, 3421, 3511, 3151, 3241, 3331, 3421, 3511, 361, 3241, 3331, 3421, 3511, 3421, 361, 3151, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3511, 361, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3511, 3151, 3241, 361, 3331, 361, 3421, 361, 3511, 3241, 361, 3331, 361, 3421, 361, 3511, 3241, 361, 3331, 361, 3421, 3511, 3241, 361, 3331, 361, 3421, 361, 3511, 3241, 361, 3331, 3511, 3331, 361, 3421, 3511, 3421, 361, 3511, 3241, 361, 3331, 361, 3421, 361, 3511, 361, 3241, 361, 3331, 361, 3421, 361, 3241, 361, 3331, 361, 3421, 361, 3511, 3241, 361, 3331, 361, 3421, 361, 3511, 361, 3331, 361, 3421, 361, 3241, 361, 3331, 361, 3421, 361, 3511, 2251, 271, 2341, 2341, 271, 2431, 271, 2431, 271, 2521, 271, 2521, 2611, 271, 2611, 1261, 1351, 1441, 1531, 1621, 2251, 2341, 2521, 2341, 2521, 2431, 2521, 2611, 2521, 2251, 2521, 2341, 2431, 2521, 2611, 2251, 2341, 2611, 2431, 2521, 2611, 2251, 2341, 2521, 2431, 2521, 2611, 2251, 2521, 2431, 2611, 2431, 2341, 2521, 2341, 2431, 2521, 2431, 2611, 2521, 2611, 2521, 2431, 2251, 2341, 2611, 2521, 2341, 2521, 2431, 2341, 2521, 2521, 2611, 2521, 2611, 2521, 2431, 2521, 2431, 2521, 2431, 2521, 2611, 2521, 2431, 2251, 2521, 2251, 2341, 2431, 2521, 2611, 2251, 271, 2341, 271, 2431, 271, 2521, 271, 2611, 2251, 2341, 2521, 2341, 2521, 2341, 2431, 2341, 2431, 2341, 2431, 2341, 2431, 2521, 2611, 2341, 2431, 2611, 2521, 2251, 2341, 2431, 2521, 2611, 2521, 2341, 2251, 2341, 2431, 2521, 2611, 2431, 2251, 271, 2251, 271, 2161, 2251, 2341, 271, 2431, 271, 2521, 271, 2611, 2161, 2251, 2341, 2431, 2521, 2611, 2251, 2341, 2431, 2521, 2611, 2341, 2431, 2521, 3241, 3331, 3421, 3511, 3151, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3241, 3511, 3421, 3511, 3421, 3241, 3421, 3511, 3151, 3241, 3331, 3511, 3331, 3511, 3241, 3511, 3421, 3511, 3241, 3421, 3331, 3421, 3511, 3421, 3421, 3241, 3421, 3511, 3421, 3511, 3421, 3511, 3421, 3511, 3331, 3511, 3421, 3511, 3241, 3511, 3241, 3331, 3421, 3421, 3241, 3421, 3241, 3421, 3241, 3511, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3511, 3421, 3511, 3331, 3421, 3511, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3331, 3421, 3511, 3241, 3421, 3511, 3241, 3331, 3421, 3511, 361, 3241, 3331, 3421, 3511, 3421, 3331, 3241, 3331, 3421, 3511, 3421, 3241, 3331, 3421, 3331, 3421, 3511, 3331, 3421, 3241, 3331, 361, 3421, 361, 3511, 3241, 3331, 3241, 3421, 3331, 3421, 3331, 3421, 3331, 3421, 3511, 3331, 3511, 3331, 3421, 3511, 3421, 3331, 3511, 3421, 3421, 3331, 3421, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3331, 3421, 3151, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3241, 3331, 3421, 3511, 3421, 3331, 3421, 3241, 3421, 3241, 3331, 3421, 3511, 3421, 3241, 3421, 3151, 3241, 3331, 3421, 3511, 3151, 3331, 3421, 3241, 3331, 3421, 3511, 3421, 3511, 3241, 3331, 3421, 3511, 3511, 3421, 3511, 3241, 3421, 3331, 3421, 3511, 3331, 3151, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3331, 3511, 3331, 3421, 3241, 3331, 3331, 3421, 3511, 3331, 3421, 3331, 3331, 3421, 3511, 3241, 3421, 3331, 3421, 3511, 3241, 3331, 3421, 3241, 3511, 3241, 3331, 3421, 3331, 3421, 361, 3241, 3241, 3331, 3241, 3421, 3511, 3241, 3331, 3421, 3511, 3241, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3511, 3241, 3331, 3421, 3331, 3511, 3241, 3511, 3421, 3241, 3331, 3421, 3511, 3241, 3421, 3511, 3241, 3421, 3241, 3421, 3511, 3421, 3331, 3421, 3511, 3421, 3241, 3421, 3511, 3241, 3511, 3331, 3511, 3421, 3511, 3151, 3241, 3511, 3241, 3511, 3331, 3421, 3511, 451, 4231, 451, 4321, 451, 451, 4231, 451, 4321, 451, 4411, 4231, 451, 4321, 451, 4411, 451, 4231, 451, 4321, 451, 4411, 451, 4231, 451, 4321, 451, 4411, 4141, 4231, 4141, 4321, 451, 4411, 4141, 451, 4231, 451, 4321, 451, 4411, 4141, 451, 4231, 451, 4321, 451, 4411, 4141, 451, 4231, 451, 4321, 451, 4411, 451, 4231, 451, 4321, 451, 4411, 4141, 451, 4231, 451, 4321, 451, 4411, 451, 4231, 451, 4321, 451, 4411, 4141, 4231, 451, 4321, 451, 4411, 451, 4231, 451, 4321, 451, 4411, 4141, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4231, 4321, 4411, 451, 4231, 4321, 4411, 451, 4321, 4231, 4141, 4231, 4321, 4411, 4231, 4321, 4411, 4231, 4321, 4411, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4231, 4321, 4411, 4321, 4411, 4141, 4231, 4321, 4411, 4321, 4231, 4141, 4231, 4321, 4231, 4411, 4141, 4231, 4321, 4141, 4411, 4231, 4321, 4411, 4321, 4411, 4321, 4411, 4231, 4321, 4411, 4321, 4411, 4321, 4411, 4231, 4321, 4231, 4321, 4231, 4321, 4231, 4321, 4231, 4321, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4141, 4231, 4321, 4231, 4321, 4411, 4231, 4321, 4231, 4321, 4231, 4411, 4231, 4411, 4231, 4321, 4411, 4231, 4321, 4411, 4321, 4141, 4231, 4321, 4411, 4141, 4231, 4321, 4231, 4411, 4231, 4321, 4141, 4231, 4321, 4411, 4231, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4231, 4321, 4231, 4321, 4231, 4411, 4231, 4231, 4321, 4411, 4321, 4411, 4231, 4411, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4321, 4231, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4231, 4411, 4231, 4321, 4411, 4141, 4411, 4321, 4411, 4231, 4321, 4411, 4411, 4141, 4231, 4321, 4231, 4321, 4411, 4321, 4231, 4411, 4231, 4411, 4321, 4411, 4321, 4411, 4321, 4411, 4231, 4321, 4411, 4231, 4321, 4411, 4231, 451, 4321, 451, 4411, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4231, 4141, 4321, 4411, 4231, 4321, 4411, 4231, 4321, 4411, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4321, 4231, 4231, 4141, 4321, 4411, 4411, 4231, 4321, 4411, 4141, 4411, 4321, 4231, 4321, 4411, 4231, 4321, 4411, 4231, 4321, 4231, 4321, 4411, 4141, 4231, 4321, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4231, 4321, 4411, 4231, 4321, 4411, 4231, 4321, 4411, 451, 4231, 4321, 4411, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4231, 4321, 4411, 4321, 4231, 4231, 4321, 4411, 4141, 4231, 4321, 4411, 4141, 4321, 4411, 4231, 4321, 4411, 5221, 5311, 5221, 541, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5221, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5221, 5311, 5131, 5311, 5221, 5311, 5131, 5221, 541, 5311, 541, 5131, 5221, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5311, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5221, 5221, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5221, 5131, 5221, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5131, 5311, 5221, 5131, 5221, 5311, 541, 5131, 5221, 5311, 5131, 5221, 5311, 5221, 5131, 5221, 5311, 5221, 5131, 5221, 5311, 5221, 5221, 5311, 5221, 5131, 5221, 5311, 5221, 5131, 5221, 5311, 5311, 5131, 5221, 5311, 541, 5311, 5221, 5311, 5131, 5311, 5221, 5311, 5131, 5221, 5311, 5221, 5311, 5221, 5131, 5221, 5311, 5131, 5311, 5221, 5311, 5131, 5221, 5311, 5221, 5311, 5131, 5221, 5311, 5131, 5311, 5221, 5311, 5131, 5221, 5311, 5221, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5221, 5311, 5221, 5311, 5131, 5311, 5221, 5311, 5131, 5221, 5311, 5221, 5311, 541, 5221, 5311, 5131, 541, 5221, 5311, 541, 5311, 5131, 5221, 5311, 5131, 5221, 5311, 5131, 541, 5221, 541, 5311, 5131, 541, 5221, 5311, 5131, 541, 5221, 541, 5311, 5131, 541, 5221, 541, 5311, 5131, 541, 5221, 541, 5311, 5131, 541, 5221, 541, 5311, 5131, 541, 5221, 541, 5311, 541, 5311, 5131, 541, 5221, 541, 5311, 541, 5131, 541, 5221, 541, 5311, 5131, 541, 5221, 541, 5311, 5131, 541, 5221, 541, 5311, 2251, 2341, 2431, 2521, 2611, 2251, 2341, 2431, 2521, 2611, 271, 2341, 271, 2431, 271, 2521, 271, 181, 1351, 181, 1441, 1441, 1441, 1531, 181, 1711, 181])
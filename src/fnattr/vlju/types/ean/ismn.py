@@ -1,11 +1,22 @@
 # SPDX-License-Identifier: MIT
 """ISMN (International Standard Music Number)."""
 
-from fnattr.vlju.types.ean import EAN13, as13
+from collections.abc import Sequence
+from typing import Self
+
+from fnattr.vlju.types.ean import (
+    EAN13,
+    as13,
+    is13,
+    is_valid_ean13,
+    is_valid_ean13_many,
+)
 
 class ISMN(EAN13):
     """Represents an ISMN (International Standard Music Number)."""
 
+    __slots__ = ()
+
     def __init__(self, s: str) -> None:
         v = as13(s, 'ismn')
         if v is None:
@@ -13,6 +24,10 @@ class ISMN(EAN13):
             raise ValueError(msg)
         super().__init__(v, 'ismn')
 
+    @classmethod
+    def try_parse(cls, s: str) -> Self | None:
+        return cls(s) if isinstance(s, str) and is13(s, 'ismn') else None
+
     def lv(self) -> str:
         if self._value[: 4] != '9790':      # pragma: no branch
             raise ValueError(self._value)   # pragma: no cover
@@ -20,3 +35,14 @@ class ISMN(EAN13):
 
     def path(self) -> str:
         return self.lv()
+
+def is_valid_ismn13(s: str) -> bool:
+    """Check for 13-digit-only form."""
+    return is_valid_ean13(s) and s.startswith('9790')
+
+def is_valid_ismn13_many(strings: Sequence[str]) -> list[bool]:
+    """Check each of `strings` as by `is_valid_ismn13()`."""
+    return [
+        ok and s.startswith('9790')
+        for ok, s in zip(is_valid_ean13_many(strings), strings, strict=True)
+    ]
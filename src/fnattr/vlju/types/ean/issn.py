@@ -1,12 +1,17 @@
 # SPDX-License-Identifier: MIT
 """ISSN - International Standard Serial Number."""
 
+from collections.abc import Sequence
+from typing import Self
+
 from fnattr.util import checksum
-from fnattr.vlju.types.ean import EAN13, as13
+from fnattr.vlju.types.ean import EAN13, as13, is13
 
 class ISSN(EAN13):
     """Represents an ISSN (International Standard Serial Number)."""
 
+    __slots__ = ()
+
     def __init__(self, s: str) -> None:
         # self._value contains an unsplit ISSN-13 string.
         v = as13(s, 'issn')
@@ -14,6 +19,10 @@ class ISSN(EAN13):
             raise ValueError(s)
         super().__init__(v, 'issn')
 
+    @classmethod
+    def try_parse(cls, s: str) -> Self | None:
+        return cls(s) if isinstance(s, str) and is13(s, 'issn') else None
+
     def lv(self) -> str:
         if (v := self.split8()) is None:    # pragma: no branch
             raise ValueError(v)             # pragma: no cover
@@ -41,3 +50,12 @@ class ISSN(EAN13):
         if (s := self.issn8()) is None:
             return None
         return f'{s[0:4]}-{s[4:8]}'
+
+def is_valid_issn8(s: str) -> bool:
+    """Check for 8-character-only form."""
+    return (len(s) == 8 and s[0 : 7].isdigit()
+            and checksum.mod11(s[0 : 7]) == s[7])
+
+def is_valid_issn8_many(strings: Sequence[str]) -> list[bool]:
+    """Check each of `strings` as by `is_valid_issn8()`."""
+    return checksum.is_valid_mod11_many(strings, 8, is_valid_issn8)
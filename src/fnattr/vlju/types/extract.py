@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: MIT
+"""
+Extract identifiers from running text.
+
+A single combined pattern finds candidate ISBNs, ISMNs, ISSNs, DOIs and
+LCCNs; candidates are then checked (by check digit, where there is one)
+and converted to the corresponding Vlju type.
+
+ISBN-10, ISSN and LCCN candidates must follow their label (‘ISBN’,
+‘ISSN’, ‘LCCN’), since bare numbers of those shapes are common in other
+roles. ISBN-13 candidates may also appear bare.
+"""
+
+import functools
+import re
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import NamedTuple, TextIO
+
+from fnattr.vlju import Vlju
+from fnattr.vlju.types.doi import DOI
+from fnattr.vlju.types.ean import is_valid_ean13, key13
+from fnattr.vlju.types.ean.isbn import ISBN, is_valid_isbn10
+from fnattr.vlju.types.ean.ismn import ISMN
+from fnattr.vlju.types.ean.issn import ISSN, is_valid_issn8
+from fnattr.vlju.types.lccn import LCCN, normalize
+
+class Found(NamedTuple):
+    """An identifier found in text, with its offsets."""
+
+    key: str
+    vlju: Vlju
+    start: int
+    end: int
+
+# Every match is at most MAX_MATCH characters long, and looks ahead
+# at most one character beyond its end. Every repetition in PATTERN must
+# be bounded; the longest match is a DOI, at 12 + 4 × 10 + 1 + 201 = 254.
+MAX_MATCH = 256
+
+PATTERN = re.compile(
+    r"""
+        \b ISBN (?: -?1[03] )? :? \s{0,3}
+            (?P<isbn> 97[89] (?: [-\s]?\d ){10}
+                    | \d (?: [-\s]?\d ){8} [-\s]?[\dX] )
+            (?! [\w-] )
+    |   (?<! [\w-] )
+            (?P<ean> 97[89] (?: -?\d ){10} )
+            (?! [\w-] )
+    |   \b [EP]? -? ISSN :? \s{0,3}
+            (?P<issn> \d{4} -? \d{3} [\dX] )
+            (?! [\w-] )
+    |   \b LCCN :? \s{0,3}
+            (?P<lccn> [A-Z]{0,3} \s? \d{2,4} -? \d{1,6} )
+            (?! [\w-] )
+    |   (?<! [\w.] )
+            (?P<doi> 10 \. \d{4,9} (?: \. \d{1,9} ){0,4} /
+                     [^\s"<>]{0,200} [^\s"<>.,;:!?'()\[\]{}] )
+    """, re.VERBOSE | re.IGNORECASE)
+
+LCCN_NORMALIZED = re.compile(r'[a-z]{0,3}(\d\d){4,5}')
+
+def _ean(s: str) -> Vlju | None:
+    if not is_valid_ean13(s := s.replace('-', '').replace(' ', '')):
+        return None
+    if (k := key13(s)) == 'ismn':
+        return ISMN(s)
+    if k == 'isbn':
+        return ISBN(s)
+    return None     # pragma: no cover
+
+def _isbn(s: str) -> Vlju | None:
+    s = re.sub(r'[-\s]', '', s).upper()
+    if len(s) == 10:
+        return ISBN(s) if is_valid_isbn10(s) else None
+    return _ean(s)
+
+def _issn(s: str) -> Vlju | None:
+    s = s.replace('-', '').upper()
+    return ISSN(s) if is_valid_issn8(s) else None
+
+def _lccn(s: str) -> Vlju | None:
+    if LCCN_NORMALIZED.fullmatch(normalize(s)):
+        return LCCN(s)
+    return None
+
+CHECK: dict[str, Callable[[str], Vlju | None]] = {
+    'isbn': _isbn,
+    'ean': _ean,
+    'issn': _issn,
+    'lccn': _lccn,
+    'doi': DOI,
+}
+
+def _found(m: re.Match, base: int = 0) -> Found | None:
+    group = str(m.lastgroup)
+    if (v := CHECK[group](m.group(group))) is None:
+        return None
+    start, end = m.span(group)
+    if isinstance(v, ISMN):
+        group = 'ismn'
+    elif group == 'ean':
+        group = 'isbn'
+    return Found(group, v, base + start, base + end)
+
+def scan(text: str) -> Iterator[Found]:
+    """Yield the identifiers in `text`."""
+    for m in PATTERN.finditer(text):
+        if found := _found(m):
+            yield found
+
+def scan_chunks(chunks: Iterable[str]) -> Iterator[Found]:
+    """
+    Yield the identifiers in the concatenation of `chunks`.
+
+    Offsets are relative to the start of the whole text. An identifier
+    may straddle chunks; text is held back until it can no longer be
+    part of an unfinished match, so at most about MAX_MATCH characters
+    beyond the current chunk are retained.
+    """
+    buffer = ''
+    base = 0        # Offset of buffer in the whole text.
+    pos = 0         # Offset of the unscanned part of buffer.
+    for chunk in chunks:
+        buffer += chunk
+        # Matches must end before `limit` to be final.
+        limit = len(buffer) - MAX_MATCH
+        cut = None
+        for m in PATTERN.finditer(buffer, pos):
+            if m.end() >= limit:
+                cut = m.start()
+                break
+            if found := _found(m, base):
+                yield found
+            pos = m.end()
+        if cut is None:
+            cut = max(pos, limit)
+        # Keep one character before the cut for lookbehind.
+        keep = max(cut - 1, 0)
+        buffer = buffer[keep :]
+        base += keep
+        pos = cut - keep
+    for m in PATTERN.finditer(buffer, pos):
+        if found := _found(m, base):
+            yield found
+
+def scan_file(f: TextIO, size: int = 1 << 16) -> Iterator[Found]:
+    """Yield the identifiers in a text file, read in chunks of `size`."""
+    return scan_chunks(iter(functools.partial(f.read, size), ''))
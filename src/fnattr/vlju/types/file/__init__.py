@@ -3,15 +3,23 @@
 
 import pathlib
 
+from collections.abc import Hashable
+
 from fnattr.util import escape
 from fnattr.util.repr import mkrepr
+from fnattr.util.writeonce import init_attr
+from fnattr.vlju import Vlju
 from fnattr.vlju.types.uri import URI, Authority
 from fnattr.vlju.types.url import URL
 
 class File(URI):
     """Represents a local file path."""
 
-    _authority = Authority('')
+    __slots__ = ('_file', )
+
+    _file: pathlib.Path
+
+    _local = Authority('')
 
     def __init__(self, s: object = '') -> None:
         # `File` does not use the URI `path` component. Instead, it stores
@@ -19,17 +27,17 @@ class File(URI):
         if hasattr(s, 'cast_params'):
             s, _ = s.cast_params(type(self))
         if isinstance(s, pathlib.Path):
-            self._file = s
+            init_attr(self, '_file', s)
             absolute = s.is_absolute()
         elif isinstance(s, str):
-            self._file = pathlib.Path(s)
+            init_attr(self, '_file', pathlib.Path(s))
             absolute = s.startswith('/')
         else:
             raise TypeError(s)
         super().__init__(
             '',
             scheme='file',
-            authority=self._authority,
+            authority=self._local,
             sa=('://' if absolute else ':'),
             ap='')
 
@@ -52,10 +60,17 @@ class File(URI):
     # Vlju overrides:
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, Vlju):
+            other = other.typed()
         if isinstance(other, File):
             return self._file == other._file    # noqa: SLF001
         return False
 
+    __hash__ = URI.__hash__
+
+    def _hash_key(self) -> Hashable:
+        return self._file
+
     def __str__(self) -> str:
         return str(self._file)
 
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 """Info - an entity in the ‘info’ URI scheme."""
 
+from fnattr.util.writeonce import cached
 from fnattr.vlju.types.uri import URI, auth
 
 class Info(URI):
@@ -11,6 +12,8 @@ class Info(URI):
     long:   uri
     """
 
+    __slots__ = ('_str', )
+
     def __init__(self, s: str, **kwargs) -> None:
         super().__init__(
             s,
@@ -19,6 +22,7 @@ class Info(URI):
             sa=':',
             ap='/')
 
+    @cached('_str')
     def __str__(self) -> str:
         return f'{self.sauthority()}/{self._value}'
 
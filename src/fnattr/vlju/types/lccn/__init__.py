@@ -24,6 +24,8 @@ class LCCN(Info):
     long:   uri
     """
 
+    __slots__ = ()
+
     _lc = Authority('lccn.loc.gov')
 
     def __init__(self, s: str) -> None:
@@ -3,7 +3,7 @@
 
 import re
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import Self
 
 from fnattr.util import fearmat
@@ -13,46 +13,62 @@ from fnattr.vlju.types.url import URL
 
 Template = str | None
 
+_UNSET = object()
+
 class SiteBase(URL):
     """Base class for SiteFactory-generated Vljus."""
 
+    # No __slots__: subclasses set `_scheme` and `_authority` as class
+    # attributes, which hide the URI slots, so instances need a __dict__.
+
     _scheme: str
     _authority: Authority | None = None
     path_template: Template = None
     query_template: Template = None
     fragment_template: Template = None
     normalize_template: Template = None
-    url_patterns: list[tuple[re.Pattern, str]] = []
+    url_sources: Iterable[str | list[str]] | None = None
+    _url_patterns: list[tuple[re.Pattern, str]] | None = None
+
+    # Compiled forms of the templates, set when a subclass is created.
+    _path_format: fearmat.Formatter | None = None
+    _query_format: fearmat.Formatter | None = None
+    _fragment_format: fearmat.Formatter | None = None
+    _normalize_format: fearmat.Formatter | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for part in ('path', 'query', 'fragment', 'normalize'):
+            # Only templates set in this class replace inherited ones;
+            # any empty template means none.
+            if (t := cls.__dict__.get(f'{part}_template', _UNSET)) is _UNSET:
+                continue
+            setattr(cls, f'_{part}_format',
+                    staticmethod(fearmat.compiled(t)) if t else None)
 
     def __init__(self, s: str) -> None:
-        if (t := match_url(type(self).url_patterns, s)):
+        if (t := match_url(type(self).url_patterns(), s)):
             s = t
-        if self.normalize_template:
-            s = fearmat.fearmat(self.normalize_template, {'id': s, 'x': s})
+        if self._normalize_format:
+            s = self._normalize_format({'id': s, 'x': s})
         super().__init__(s, scheme=self._scheme, authority=self._authority)
 
     def __str__(self) -> str:
         return self._value
 
     def path(self) -> str:
-        if self.path_template:
-            return fearmat.fearmat(self.path_template, {
-                'id': self._value,
-                'x': self._value,
-            })
+        if self._path_format:
+            return self._path_format({'id': self._value, 'x': self._value})
         return self._value
 
     def query(self) -> str:
-        if self.query_template:
-            return fearmat.fearmat(self.query_template, {
-                'id': self._value,
-                'x': self._value,
-            })
+        if self._query_format:
+            return self._query_format({'id': self._value, 'x': self._value})
         return ''
 
     def fragment(self) -> str:
-        if self.fragment_template:
-            return fearmat.fearmat(self.fragment_template, {
+        if self._fragment_format:
+            return self._fragment_format({
                 'id': self._value,
                 'x': self._value,
             })
@@ -78,7 +94,15 @@ class SiteBase(URL):
 
     @classmethod
     def match_url(cls, url: str) -> str:
-        return match_url(cls.url_patterns, url)
+        return match_url(cls.url_patterns(), url)
+
+    @classmethod
+    def url_patterns(cls) -> list[tuple[re.Pattern, str]]:
+        """Return the URL patterns, compiled on first use."""
+        if (p := cls.__dict__.get('_url_patterns')) is None:
+            p = site_url_patterns(cls.url_sources)
+            cls._url_patterns = p
+        return p
 
 def site_class(name: str,
                host: Authority | str,
@@ -97,7 +121,7 @@ def site_class(name: str,
             'query_template': unlistify(query),
             'fragment_template': unlistify(fragment),
             'normalize_template': unlistify(normalize),
-            'url_patterns': site_url_patterns(url),
+            'url_sources': url,
         })
 
 def unlistify(s: str | list[str] | None) -> str | None:
@@ -126,3 +150,193 @@ def match_url(patterns: list[tuple[re.Pattern, str]], url: str) -> str:
         if (m := pattern.fullmatch(url)):
             return m.expand(replacement)
     return ''
+
+UrlMatch = Callable[[str], str]
+
+def combine_url_patterns(patterns: list[tuple[re.Pattern, str]]) -> UrlMatch:
+    """
+    Return a function equivalent to `match_url` over `patterns`.
+
+    Where possible, the patterns are combined into one alternation, with
+    replacement group references renumbered to suit.
+    """
+    if not patterns or any(
+            _NOT_COMBINABLE.search(p.pattern) or p.flags != patterns[0][0].flags
+            for p, _ in patterns):
+        return lambda url: match_url(patterns, url)
+    # In verbose mode, a pattern may end in a comment, which a newline ends.
+    end = '\n' if patterns[0][0].flags & re.VERBOSE else ''
+    alternatives = []
+    replacements = []
+    group = 1
+    for p, replacement in patterns:
+        alternatives.append(f'({p.pattern}{end})')
+        replacements.append((group, _renumber(replacement, group)))
+        group += 1 + p.groups
+    combined = re.compile('|'.join(alternatives), patterns[0][0].flags)
+
+    def match(url: str) -> str:
+        if (m := combined.fullmatch(url)):
+            for group, replacement in replacements:
+                if m.start(group) >= 0:
+                    # A lone group reference needs no template expansion.
+                    if (g := _LONE_GROUP.fullmatch(replacement)):
+                        return m.group(int(g[1])) or ''
+                    return m.expand(replacement)
+        return ''
+
+    return match
+
+# Back references, named groups and global inline flags do not survive
+# being combined.
+_LONE_GROUP = re.compile(r'\\g<(\d+)>')
+_NOT_COMBINABLE = re.compile(r'\\[1-9]|\(\?P[<=]|\(\?[aiLmsux]+\)')
+
+def _renumber(replacement: str, offset: int) -> str:
+    return re.sub(r'\\(?:g<(\d+)>|(\d+))',
+                  lambda m: f'\\g<{int(m[1] or m[2]) + offset}>', replacement)
+
+def url_host_suffix(pattern: str) -> str | None:
+    """
+    Return a host name suffix required by a verbose URL pattern, if evident.
+
+    The pattern must begin with a literal scheme (perhaps ending ‘?’),
+    ‘://’, and a host part that ends in literal labels separated by
+    escaped dots. Before those, it may have an optional group of such
+    labels, as in ‘(?:www\\.)?’, or label characters, classes of them,
+    ‘\\d’, ‘\\w’ and quantifiers, up to an escaped dot. A pattern with a
+    top-level ‘|’ has no evident host.
+    """
+    tokens = list(_verbose_tokens(pattern))
+    if ('|', True) in tokens:
+        return None
+    text = [t for t, _ in tokens]
+    for i in range(len(tokens) - 2):
+        if text[i : i + 3] == [':', '/', '/'] and tokens[i][1]:
+            break
+    else:
+        return None
+    if not re.fullmatch(r'[A-Za-z]+\??', ''.join(text[: i])):
+        return None
+    host = []
+    for t, top in tokens[i + 3 :]:
+        if t == '/' and top:
+            break
+        host.append(t)
+    if not (m := _LITERAL_HOST.fullmatch(''.join(host))):
+        return None
+    return m['host'].replace('\\.', '.').lower()
+
+# The part of a host pattern before its literal suffix: an optional group
+# of literal labels, or anything that can only match host name characters
+# and ends in an escaped dot.
+_LITERAL_HOST = re.compile(
+    r"""
+        (?: \( (?:\?:)? (?: [A-Za-z0-9-]+ \\\. )+ \) \?
+          | (?: [A-Za-z0-9-] | \\[.dw-] | \[ [A-Za-z0-9._\\-]+ \] | [*+?] )*?
+            \\\.
+        )??
+        (?P<host> [A-Za-z0-9-]+ (?: \\\. [A-Za-z0-9-]+ )* )
+    """, re.VERBOSE)
+
+def _verbose_tokens(pattern: str) -> Iterator[tuple[str, bool]]:
+    """
+    Yield the tokens of a verbose regular expression, skipping whitespace
+    and comments, each with whether it is outside any group or class.
+    """
+    i = 0
+    depth = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            yield pattern[i : i + 2], False
+            i += 2
+        elif c == '[':
+            # A class runs to the first ‘]’ that is not escaped and not
+            # its first member.
+            j = i + 1
+            if pattern.startswith('^', j):
+                j += 1
+            if pattern.startswith(']', j):
+                j += 1
+            while j < len(pattern) and pattern[j] != ']':
+                j += 2 if pattern[j] == '\\' else 1
+            yield pattern[i : j + 1], False
+            i = j + 1
+        elif c == '#':
+            if (i := pattern.find('\n', i)) < 0:
+                break
+        elif c.isspace():
+            i += 1
+        else:
+            if c == ')':
+                depth -= 1
+            yield c, depth == 0
+            if c == '(':
+                depth += 1
+            i += 1
+
+def url_host(url: str) -> str:
+    """Return the host part of a URL, or the empty string."""
+    if (i := url.find('://')) < 0:
+        return ''
+    host = url[i + 3 :]
+    for c in '/?#':
+        host = host.partition(c)[0]
+    host = host.rpartition('@')[2]
+    if not host.endswith(']'):
+        host = host.partition(':')[0]
+    return host.lower()
+
+class SiteMatcher:
+    """
+    Finds the site whose URL patterns match a URL.
+
+    This is equivalent to trying each site's `match_url()` in order, but
+    each URL is tried only against sites whose patterns require its host
+    (or a parent domain), or whose host requirement is not evident; and
+    each site's patterns are tried as one combined pattern. Sites with
+    any pattern whose host is not evident (see `url_host_suffix()`) are
+    tried for every URL.
+    """
+
+    def __init__(self, sites: Mapping[str, type[SiteBase]]) -> None:
+        self._sites: list[tuple[str, type[SiteBase], UrlMatch]] = []
+        self._by_host: dict[str, list[int]] = {}
+        self._any: list[int] = []
+        for k, scls in sites.items():
+            if not (patterns := scls.url_patterns()):
+                continue
+            i = len(self._sites)
+            self._sites.append((k, scls, combine_url_patterns(patterns)))
+            hosts = {url_host_suffix(p.pattern) for p, _ in patterns}
+            if None in hosts:
+                self._any.append(i)
+            else:
+                for host in hosts:
+                    self._by_host.setdefault(str(host), []).append(i)
+
+    def candidates(self, url: str) -> list[int]:
+        """Return the indices of the sites that might match `url`, in order."""
+        r = list(self._any)
+        host = url_host(url)
+        while host:
+            r += self._by_host.get(host, ())
+            host = host.partition('.')[2]
+        if len(r) > 1:
+            r.sort()
+        return r
+
+    def match(self, url: str) -> tuple[str | None, SiteBase | None]:
+        """Return (key, site Vlju) for the first matching site."""
+        for i in self.candidates(url):
+            k, scls, match = self._sites[i]
+            if (v := match(url)):
+                return k, scls(v)
+        return None, None
+
+    def match_urls(
+            self,
+            urls: Iterable[str]) -> list[tuple[str | None, SiteBase | None]]:
+        """Return `match()` for each of `urls`."""
+        return [self.match(url) for url in urls]
@@ -2,6 +2,7 @@
 """Timestamp."""
 
 from fnattr.util.duration import Duration
+from fnattr.util.writeonce import init_attr
 from fnattr.vlju import Vlju
 
 class Timestamp(Vlju):
@@ -12,17 +13,22 @@ class Timestamp(Vlju):
     long:   [[[[[[_d_`d`]_h_]_h_`h`]_m_]_m_`m`]_s_]_s_[`.`_f_...]
     """
 
+    __slots__ = ('_duration', )
+
+    _duration: Duration
+
     def __init__(self, s: object) -> None:
         if isinstance(s, str):
-            self._duration = Duration.parse(s)
+            duration = Duration.parse(s)
         elif isinstance(s, Duration):
-            self._duration = s
+            duration = s
         elif hasattr(s, 'cast_params'):
             v, d = s.cast_params(type(self))
-            self._duration = Duration.parse(v) if v else Duration(**d)
+            duration = Duration.parse(v) if v else Duration(**d)
         else:
             raise TypeError(s)
-        super().__init__(str(self._duration))
+        init_attr(self, '_duration', duration)
+        super().__init__(str(duration))
 
     def lv(self) -> str:
         return self._duration.fmt()
@@ -1,22 +1,34 @@
 # SPDX-License-Identifier: MIT
 """URI - Vlju representable as a URI."""
 
+import functools
 import re
+import sys
 
+from collections.abc import Hashable
 from typing import Any, Self
 
 from fnattr.util import escape
 from fnattr.util.repr import mkrepr
 from fnattr.util.typecheck import needtype
+from fnattr.util.writeonce import WriteOnce, cached, init_attr
 from fnattr.vlju import Vlju
 
-class Authority:
-    """Authority represents a URI authority."""
+class Authority(WriteOnce):
+    """
+    Authority represents a URI authority.
+
+    Like Vlju, an Authority is immutable and hashable, so instances are
+    freely shared; `auth()` returns a shared instance for a string.
+    The string form is computed once.
+    """
+
+    __slots__ = ('host', 'port', 'username', 'password', '_str')
 
     host: str
-    port: int | None = None
-    username: str | None = None
-    password: str | None = None
+    port: int | None
+    username: str | None
+    password: str | None
 
     def __init__(self,
                  host: str | Self,
@@ -25,11 +37,12 @@ class Authority:
                  password: str | None = None) -> None:
 
         if isinstance(host, Authority):
-            self.username = host.username
-            self.password = host.password
-            self.host = host.host
-            self.port = host.port
+            u = host.username
+            p = host.password
+            pn = host.port
+            host = host.host
         elif isinstance(host, str):
+            u = p = pn = None
             if host.startswith('//'):
                 host = host[2 :]
             if '@' in host:
@@ -45,29 +58,25 @@ class Authority:
                 if password is not None and password != p:
                     message = f'password={password} conflicts with {up}@'
                     raise ValueError(message)
-                self.username = u
-                self.password = p
             if ':' in host:
                 host, pstr = host.split(':', 1)
                 pn = int(pstr)
                 if port is not None and port != pn:
                     message = f'port={port} conflicts with {host}'
                     raise ValueError(message)
-                self.port = pn
-            self.host = host.lower()
+            host = host.lower()
         else:
             raise TypeError
 
-        if port is not None:
-            self.port = port
-        if username is not None:
-            self.username = username
-        if password is not None:
-            self.password = password
+        init_attr(self, 'host', host)
+        init_attr(self, 'port', pn if port is None else port)
+        init_attr(self, 'username', u if username is None else username)
+        init_attr(self, 'password', p if password is None else password)
 
     def __repr__(self) -> str:
         return mkrepr(self, ['host'], ['port', 'username', 'password'])
 
+    @cached('_str')
     def __str__(self) -> str:
         r = ''
         if self.username:
@@ -87,6 +96,9 @@ class Authority:
                     and self.password == other.password)
         return False
 
+    def __hash__(self) -> int:
+        return hash((self.host, self.port, self.username, self.password))
+
 AuthorityArg = Authority | str | None
 
 def auth(a: AuthorityArg) -> Authority | None:
@@ -94,8 +106,22 @@ def auth(a: AuthorityArg) -> Authority | None:
         return None
     if isinstance(a, Authority):
         return a
+    if isinstance(a, str):
+        return _shared_authority(a)
     return Authority(a)
 
+@functools.lru_cache(maxsize=1024)
+def _shared_authority(s: str) -> Authority:
+    return Authority(s)
+
+# Default scheme/authority separators, indexed by (has scheme, has authority).
+SA = {
+    (False, False): '',
+    (False, True): '//',
+    (True, False): ':',
+    (True, True): '://',
+}
+
 class URI(Vlju):
     """
     Represents a URI.
@@ -105,8 +131,26 @@ class URI(Vlju):
     where:
         uri   → `scheme()` `_sa` `sauthority()` `_ap` `spath()`
                 `squery()` `sfragment()` `sr()` `sq()`
+
+    The URI string is built on first use and kept in `_uri`, since the
+    components can not change. Subclasses must likewise derive the
+    components (`path()`, `sauthority()` and so on) from the constructor
+    arguments alone; string forms they add may be cached with
+    `writeonce.cached`.
     """
 
+    __slots__ = ('_scheme', '_authority', '_query', '_fragment', '_urnq',
+                 '_urnr', '_sa', '_ap', '_uri')
+
+    _scheme: str
+    _authority: Authority | None
+    _query: str | None
+    _fragment: str | None
+    _urnq: str | None
+    _urnr: str | None
+    _sa: str
+    _ap: str
+
     def __init__(self, s: str | object, **kwargs) -> None:
         if isinstance(s, str):
             if kwargs:
@@ -119,21 +163,22 @@ class URI(Vlju):
         else:
             raise TypeError(s)
         super().__init__(v)
-        self._scheme: str = needtype(kwargs.get('scheme', ''), str)
-        self._authority: Authority | None = auth(kwargs.get('authority'))
-        self._query: str | None = needtype(kwargs.get('query'), str, None)
-        self._fragment: str | None = needtype(kwargs.get('fragment'), str, None)
-        self._urnq: str | None = needtype(kwargs.get('urnq'), str, None)
-        self._urnr: str | None = needtype(kwargs.get('urnr'), str, None)
+        scheme = sys.intern(needtype(kwargs.get('scheme', ''), str))
+        init_attr(self, '_scheme', scheme)
+        init_attr(self, '_authority', auth(kwargs.get('authority')))
+        init_attr(self, '_query', needtype(kwargs.get('query'), str, None))
+        fragment = needtype(kwargs.get('fragment'), str, None)
+        init_attr(self, '_fragment', fragment)
+        init_attr(self, '_urnq', needtype(kwargs.get('urnq'), str, None))
+        init_attr(self, '_urnr', needtype(kwargs.get('urnr'), str, None))
         sa = kwargs.get('sa')   # scheme/authority separator
         if sa is None:
-            sa = ':' if self._scheme else ''
-            sa += '//' if self._authority else ''
-        self._sa: str = needtype(sa, str)
+            sa = SA[bool(self._scheme), self._authority is not None]
+        init_attr(self, '_sa', needtype(sa, str))
         ap = kwargs.get('ap')   # authority/path separator
         if ap is None:
             ap = '/' if (self._authority and self._value[0].isalnum()) else ''
-        self._ap: str = needtype(ap, str)
+        init_attr(self, '_ap', needtype(ap, str))
 
     def scheme(self) -> str:
         return self._scheme
@@ -180,9 +225,18 @@ class URI(Vlju):
         return f'#{escape.fragment.encode(s)}' if s else ''
 
     def uri(self, path: str | None = None) -> str:
+        if path is not None:
+            return self._join(escape.path.encode(path))
+        try:
+            return self._uri
+        except AttributeError:
+            init_attr(self, '_uri', self._join(self.spath()))
+            return self._uri
+
+    def _join(self, spath: str) -> str:
         return (self.scheme() + self._sa + self.sauthority() + self._ap +
-                (self.spath() if path is None else escape.path.encode(path))
-                + self.squery() + self.sfragment() + self.sr() + self.sq())
+                spath + self.squery() + self.sfragment() + self.sr() +
+                self.sq())
 
     def cast_params(self, t: object) -> tuple[str, dict]:
         if t is URI:
@@ -222,6 +276,8 @@ class URI(Vlju):
         return super().__getitem__(key)
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, Vlju):
+            other = other.typed()
         if isinstance(other, URI):
             return (self._value == other._value                 # noqa: SLF001
                     and self._scheme == other._scheme           # noqa: SLF001
@@ -234,6 +290,12 @@ class URI(Vlju):
                     and self._ap == other._ap)                  # noqa: SLF001
         return False
 
+    __hash__ = Vlju.__hash__
+
+    def _hash_key(self) -> Hashable:
+        return (self._value, self._scheme, self._authority, self._query,
+                self._fragment, self._urnq, self._urnr, self._sa, self._ap)
+
     def __repr__(self) -> str:
         return mkrepr(          # pragma: no cover
             self, ['_value'],
@@ -251,7 +313,7 @@ def split_uri(s: str) -> tuple[str, dict[str, Any]]:
 
     # authority
     if s.startswith('//') and (i := s.find('/', 2)) > 0:
-        d['authority'] = Authority(s[2 : i])
+        d['authority'] = auth(s[2 : i])
         s = s[i :]
 
     # fragment
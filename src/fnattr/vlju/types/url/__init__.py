@@ -6,6 +6,8 @@ from fnattr.vlju.types.uri import URI
 class URL(URI):
     """Represents a URL."""
 
+    __slots__ = ()
+
     def cast_params(self, t: object) -> tuple[str, dict]:
         if t is URL:
             return (self._value,
@@ -1,7 +1,10 @@
 # SPDX-License-Identifier: MIT
 """URN - Vlju representable as a URN."""
 
+from collections.abc import Hashable
+
 from fnattr.util.repr import mkrepr
+from fnattr.vlju import Vlju
 from fnattr.vlju.types.uri import URI, Authority
 
 class URN(URI):
@@ -12,6 +15,8 @@ class URN(URI):
     long:   uri
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  s: str,
                  authority: Authority | str | None = None,
@@ -35,6 +40,8 @@ class URN(URI):
     # Vlju overrides:
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, Vlju):
+            other = other.typed()
         if isinstance(other, URN):
             return (self._value == other._value                 # noqa: SLF001
                     and self._scheme == other._scheme           # noqa: SLF001
@@ -43,5 +50,11 @@ class URN(URI):
                     and self._urnr == other._urnr)              # noqa: SLF001
         return False
 
+    __hash__ = URI.__hash__
+
+    def _hash_key(self) -> Hashable:
+        return (self._value, self._scheme, self._authority, self._urnq,
+                self._urnr)
+
     def __repr__(self) -> str:
         return mkrepr(self, ['_value'], ['_authority', '_urnq', '_urnr'])
@@ -15,7 +15,10 @@ from typing import Any, Self, TextIO
 from fnattr.util.error import Error
 from fnattr.util.io import PathLike, open_input, open_output
 from fnattr.util.registry import Registry
-from fnattr.vlju.types.all import URI, URL, File, Vlju
+from fnattr.vlju import Vlju
+from fnattr.vlju.types.file import File
+from fnattr.vlju.types.uri import URI
+from fnattr.vlju.types.url import URL
 from fnattr.vljumap import VljuFactory, VljuMap, enc
 
 VljuArg = Vlju | str | None
@@ -23,6 +26,37 @@ EncoderArg = enc.Encoder | str | None
 FactoryArg = VljuFactory | str | None
 ModeArg = str | None
 
+def rename_file(original: Path,
+                modified: Path,
+                *,
+                mkdir: bool = True,
+                dedup: bool = False,
+                dryrun: bool = False) -> bool:
+    """
+    Rename the file `original` to `modified`; return whether it moved.
+
+    If `modified` exists, then nothing is done if it is the same file;
+    with `dedup`, `original` is removed if the contents are the same;
+    otherwise, this raises FileExistsError.
+    """
+    logging.info('rename: %s', original)
+    logging.info('    to: %s', modified)
+    if dryrun:
+        return False
+    if modified.exists():
+        if modified.samefile(original):
+            logging.info('same file')
+            return False
+        if dedup and filecmp.cmp(original, modified, shallow=False):
+            logging.info('removing duplicate')
+            original.unlink()
+            return False
+        raise FileExistsError(modified)
+    if mkdir and not modified.parent.exists():
+        modified.parent.mkdir(parents=True)
+    original.rename(modified)
+    return True
+
 class VljuM(VljuMap):
     """VljuMap operations."""
 
@@ -126,24 +160,12 @@ class VljuM(VljuMap):
             message = 'no file to rename'
             raise Error(message)
         modified_path = self.filename(encoder, self.mode.get(mode))
-        logging.info('rename: %s', self._original_path)
-        logging.info('    to: %s', modified_path)
-        if dryrun:
-            return self
-        if modified_path.exists():
-            if modified_path.samefile(self._original_path):
-                logging.info('same file')
-                return self
-            if dedup and filecmp.cmp(
-                    self._original_path, modified_path, shallow=False):
-                logging.info('removing duplicate')
-                self._original_path.unlink()
-                return self
-            raise FileExistsError(modified_path)
-        if mkdir and not modified_path.parent.exists():
-            modified_path.parent.mkdir(parents=True)
-        self._original_path.rename(modified_path)
-        self.set_path(modified_path)
+        if rename_file(self._original_path,
+                       modified_path,
+                       mkdir=mkdir,
+                       dedup=dedup,
+                       dryrun=dryrun):
+            self.set_path(modified_path)
         return self
 
     def reset(self,
@@ -229,7 +251,7 @@ class VljuM(VljuMap):
                 return self[k][0]
         else:
             for _, v in self.pairs():
-                if isinstance(v, k):
+                if isinstance(v := v.typed(), k):
                     return v
         return Vlju('')
 
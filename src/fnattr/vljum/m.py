@@ -1,16 +1,18 @@
 # SPDX-License-Identifier: MIT
 """Pre-configured VljuM."""
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
 from typing import Any
 
 from fnattr.util.registry import Registry
 from fnattr.vlju.types.all import VLJU_TYPES, Vlju
-from fnattr.vlju.types.site import SiteBase, site_class
+from fnattr.vlju.types.site import SiteBase, SiteMatcher, site_class
 from fnattr.vljum import VljuM
 from fnattr.vljumap import enc
 from fnattr.vljumap.factory import (
+    InterningFactory,
+    LazyFactory,
     LooseMappedFactory,
     MappedFactory,
     default_factory,
@@ -24,6 +26,8 @@ class M(VljuM):
     raw_factory = default_factory
     strict_factory = MappedFactory(VLJU_TYPES)
     loose_factory = LooseMappedFactory(VLJU_TYPES)
+    interned_factory = InterningFactory(loose_factory)
+    lazy_factory = LazyFactory(loose_factory)
     default_registry = {
         'factory':
             Registry().update({
@@ -31,6 +35,8 @@ class M(VljuM):
                 'typed': loose_factory,
                 'loose': loose_factory,
                 'strict': strict_factory,
+                'interned': interned_factory,
+                'lazy': lazy_factory,
             }).set_default('loose'),
         'encoder':
             Registry().update(enc.encoder).set_default('v3'),
@@ -43,6 +49,9 @@ class M(VljuM):
             }).set_default('short'),
     }
     site_classes: dict[str, type[SiteBase]] = {}
+    # The current matcher, with the `site_classes` items it was built from.
+    _site_matcher: tuple[tuple[tuple[str, type[SiteBase]], ...],
+                         SiteMatcher] | None = None
 
     @classmethod
     def configure_sites(cls, site: Mapping[str, Mapping[str, Any]]) -> None:
@@ -51,13 +60,28 @@ class M(VljuM):
             cls.strict_factory.setitem(k, scls)
             cls.loose_factory.setitem(k, scls)
             cls.site_classes[k] = scls
+        cls.interned_factory.clear()
+        cls.lazy_factory.clear()
+        cls._site_matcher = None
+
+    @classmethod
+    def site_matcher(cls) -> SiteMatcher:
+        """Return a matcher for `site_classes`, built on first use."""
+        key = tuple(cls.site_classes.items())
+        if cls._site_matcher is None or cls._site_matcher[0] != key:
+            cls._site_matcher = (key, SiteMatcher(cls.site_classes))
+        return cls._site_matcher[1]
 
     @classmethod
     def from_site_url(cls, url: str) -> tuple[str | None, SiteBase | None]:
-        for k, scls in cls.site_classes.items():
-            if (v := scls.match_url(url)):
-                return k, scls(v)
-        return None, None
+        return cls.site_matcher().match(url)
+
+    @classmethod
+    def match_urls(
+            cls,
+            urls: Iterable[str]) -> list[tuple[str | None, SiteBase | None]]:
+        """Return `from_site_url()` for each of `urls`."""
+        return cls.site_matcher().match_urls(urls)
 
     @classmethod
     def exports(cls) -> dict[str, Any]:
@@ -1,32 +1,65 @@
 # SPDX-License-Identifier: MIT
 """Command DSL."""
 
+import functools
+import io
+import logging
+import sys
 import textwrap
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import NamedTuple, TextIO
 
 from fnattr.util.docsplit import docsplit
 from fnattr.util.error import Error
+from fnattr.util.parallel import ordered_map
 from fnattr.util.registry import Registry
 from fnattr.vljum.m import M
 
+class Op(NamedTuple):
+    """A compiled DSL command."""
+
+    name: str
+    command: Callable[..., None]
+    args: tuple[str, ...] = ()
+
+Program = tuple[Op, ...]
+
 class Runner:
     """Command DSL."""
 
     commands: dict[str, Callable] = {}
 
-    def __init__(self, m: M | None = None) -> None:
+    # Descriptions of the arguments taken by each command, used by `compile()`.
+    # Commands not listed here take no arguments, except for `help` and the
+    # registry commands.
+    arguments: dict[str, tuple[str, ...]] = {
+        'add': ('key', 'value'),
+        'decode': ('string', ),
+        'delete': ('keys', ),
+        'dir': ('directory', ),
+        'extract': ('keys', ),
+        'file': ('filename', ),
+        'order': ('keys', ),
+        'remove': ('key', 'value'),
+        'set': ('key', 'value'),
+        'sort': ('keys or ‘--all’', ),
+        'suffix': ('suffix', ),
+    }
+
+    # Commands taking one argument, which must name an entry in the
+    # `M` registry of the same name.
+    registries: tuple[str, ...] = ('decoder', 'encoder', 'factory', 'mode')
+
+    def __init__(self,
+                 m: M | None = None,
+                 output: TextIO | None = None) -> None:
         self.tokens: Iterator[str] | None = None
         self.m = M() if m is None else m
+        self.output = output
         self.report = False
         self.help: dict | None = None
-        self.commands = {}
-        for i in dir(type(self)):
-            if i.startswith('command_'):
-                m = getattr(type(self), i)
-                if callable(m):             # pragma: no branch
-                    self.commands[i[8 :]] = m
-        self.commands |= {
+        self.commands = self.command_table() | {
             # Factories
             k: type(self).set_factory
             for k in self.m.factory
@@ -40,6 +73,23 @@ class Runner:
             for k in self.m.mode
         }
 
+    @classmethod
+    def command_table(cls) -> dict[str, Callable]:
+        """Return the `command_` methods of the class, by command name."""
+        # Cached per class, since subclasses may add commands.
+        if '_command_table' not in cls.__dict__:
+            table = {}
+            for i in dir(cls):
+                if i.startswith('command_'):
+                    m = getattr(cls, i)
+                    if callable(m):         # pragma: no branch
+                        table[i[8 :]] = m
+            cls._command_table = table
+        return cls._command_table
+
+    def write(self, *args: object) -> None:
+        print(*args, file=self.output)
+
     def token(self) -> str | None:
         if self.tokens:
             try:
@@ -54,7 +104,7 @@ class Runner:
             raise Error(message)
         return t
 
-    def command_add(self, cmd: str) -> None:
+    def command_add(self, _: str, key: str, val: str) -> None:
         """
         Add an attribute.
 
@@ -62,8 +112,6 @@ class Runner:
 
         Synopsis: add ‹key› ‹value›
         """
-        key = self.need(f'{cmd}: expected key')
-        val = self.need(f'{cmd}: expected value')
         self.m.add(key, val)
         self.report = True
 
@@ -79,11 +127,11 @@ class Runner:
         original = self.m.original()
         current = self.m.filename()
         if current != original:
-            print(original)
-            print(current)
+            self.write(original)
+            self.write(current)
         self.report = False
 
-    def command_decode(self, cmd: str) -> None:
+    def command_decode(self, _: str, s: str) -> None:
         """
         Decode a string.
 
@@ -91,18 +139,18 @@ class Runner:
 
         Synopsis: decode ‹string›
         """
-        self.m.decode(self.need(f'{cmd}: expected string'))
+        self.m.decode(s)
         self.report = True
 
-    def command_decoder(self, cmd: str) -> None:
+    def command_decoder(self, _: str, name: str) -> None:
         """
         Set the current active decoder.
 
         Synopsis: decoder ‹decoder›
         """
-        self.set_registry(self.m.decoder, cmd)
+        self.m.decoder.set_default(name)
 
-    def command_delete(self, cmd: str) -> None:
+    def command_delete(self, _: str, keys: str) -> None:
         """
         Delete all attributes for one or more ‹key›s.
 
@@ -111,17 +159,17 @@ class Runner:
 
         Synopsis: delete ‹key›[,‹key›]*
         """
-        for key in self.need(f'{cmd}: expected keys').split(','):
+        for key in keys.split(','):
             self.m.remove(key)
         self.report = True
 
-    def command_dir(self, cmd: str) -> None:
+    def command_dir(self, _: str, directory: str) -> None:
         """
         Set the directory associated with a file name.
 
         Synopsis: dir ‹directory›
         """
-        self.m.with_dir(self.need(f'{cmd}: expected directory'))
+        self.m.with_dir(directory)
         self.report = True
 
     def command_encode(self, _: str) -> None:
@@ -132,18 +180,18 @@ class Runner:
 
         Synopsis: encode
         """
-        print(self.m.encode())
+        self.write(self.m.encode())
         self.report = False
 
-    def command_encoder(self, cmd: str) -> None:
+    def command_encoder(self, _: str, name: str) -> None:
         """
         Set the current active encoder.
 
         Synopsis: encoder ‹encoder›
         """
-        self.set_registry(self.m.encoder, cmd)
+        self.m.encoder.set_default(name)
 
-    def command_extract(self, cmd: str) -> None:
+    def command_extract(self, _: str, keys: str) -> None:
         """
         Extract attributes for one or more keys.
 
@@ -152,18 +200,18 @@ class Runner:
 
         Synopsis: extract ‹key›[,‹key›]*
         """
-        self.m = self.m.submap(self.need(f'{cmd}: expected keys').split(','))
+        self.m = self.m.submap(keys.split(','))
         self.report = True
 
-    def command_factory(self, cmd: str) -> None:
+    def command_factory(self, _: str, name: str) -> None:
         """
         Set the current active factory.
 
         Synopsis: factory ‹factory›
         """
-        self.set_registry(self.m.factory, cmd)
+        self.m.factory.set_default(name)
 
-    def command_file(self, cmd: str) -> None:
+    def command_file(self, _: str, filename: str) -> None:
         """
         Decode a file name.
 
@@ -171,7 +219,7 @@ class Runner:
 
         Synopsis: file ‹filename›
         """
-        self.m.file(self.need(f'{cmd}: expected filename'))
+        self.m.file(filename)
         self.report = True
 
     def command_filename(self, _: str) -> None:
@@ -182,49 +230,46 @@ class Runner:
 
         Synopsis: encode
         """
-        print(self.m.filename())
+        self.write(self.m.filename())
         self.report = False
 
-    def command_help(self, _: str) -> None:
+    def command_help(self, _: str, *names: str) -> None:
         """
         Show information about a subcommand, or list subcommands.
 
         Synopsis: help [‹subcommand›]*
         """
-        if self.help is None:   # pragma: no branch
-            self.help = {}
-            for k, c in self.commands.items():
-                if c.__doc__:
-                    self.help[k] = docsplit(c.__doc__)
+        help_table = self.help_table()
         helped = 0
-        while (name := self.token()) is not None:
+        for name in names:
             helped += 1
-            if name not in self.help:
-                print(f'No help available for {name}\n')
+            if name not in help_table:
+                self.write(f'No help available for {name}\n')
                 helped = 0
                 break
-            desc, info = self.help[name]
-            print(f'NAME\n  {name} - {desc[0]}\n')
+            desc, info = help_table[name]
+            self.write(f'NAME\n  {name} - {desc[0]}\n')
             synopsis = info.get('synopsis')
             if synopsis:        # pragma: no branch
-                print(f'SYNOPSIS\n  {synopsis}\n')
+                self.write(f'SYNOPSIS\n  {synopsis}\n')
             description = '\n\n'.join(desc)
             if description:     # pragma: no branch
-                print(f'DESCRIPTION\n{textwrap.indent(description, "  ")}\n')
+                description = textwrap.indent(description, '  ')
+                self.write(f'DESCRIPTION\n{description}\n')
         if helped == 0:
-            print('COMMANDS')
-            for name in sorted(self.help.keys()):
-                print(f'  {name:8} - {self.help[name][0][0]}')
+            self.write('COMMANDS')
+            for name in sorted(help_table.keys()):
+                self.write(f'  {name:8} - {help_table[name][0][0]}')
 
-    def command_mode(self, cmd: str) -> None:
+    def command_mode(self, _: str, name: str) -> None:
         """
         Set the current active mode.
 
         Synopsis: mode ‹mode›
         """
-        self.set_registry(self.m.mode, cmd)
+        self.m.mode.set_default(name)
 
-    def command_order(self, cmd: str) -> None:
+    def command_order(self, _: str, keys: str) -> None:
         """
         Arranges keys.
 
@@ -235,14 +280,13 @@ class Runner:
 
         Synopsis: order (--all | ‹key›[,‹key›]*)
         """
-        t = self.need(f'{cmd}: expected keys')
-        self.m = self.m.sortkeys(None if t == '--all' else t.split(','))
+        self.m = self.m.sortkeys(None if keys == '--all' else keys.split(','))
         self.report = True
 
     def command_quiet(self, _: str) -> None:
         self.report = False
 
-    def command_remove(self, cmd: str) -> None:
+    def command_remove(self, _: str, key: str, val: str) -> None:
         """
         Remove a specific attribute.
 
@@ -250,8 +294,6 @@ class Runner:
 
         Synopsis: remove ‹key› ‹value›
         """
-        key = self.need(f'{cmd}: expected key')
-        val = self.need(f'{cmd}: expected value')
         self.m.remove(key, val)
         self.report = True
 
@@ -268,7 +310,7 @@ class Runner:
         self.m.rename()
         self.report = False
 
-    def command_set(self, cmd: str) -> None:
+    def command_set(self, _: str, key: str, val: str) -> None:
         """
         Set an attribute.
 
@@ -277,31 +319,28 @@ class Runner:
 
         Synopsis: set ‹key› ‹value›
         """
-        key = self.need(f'{cmd}: expected key')
-        val = self.need(f'{cmd}: expected value')
         self.m.reset(key, val)
         self.report = True
 
-    def command_sort(self, cmd: str) -> None:
+    def command_sort(self, _: str, keys: str) -> None:
         """
         Sorts values for a given key or all keys.
 
         Synopsis: sort (--all | ‹key›[,‹key›]*)
         """
-        t = self.need(f'{cmd}: expected keys or ‘--all’')
-        if t == '--all':
+        if keys == '--all':
             self.m.sort()
         else:
-            self.m.sort(*t.split(','))
+            self.m.sort(*keys.split(','))
         self.report = True
 
-    def command_suffix(self, cmd: str) -> None:
+    def command_suffix(self, _: str, suffix: str) -> None:
         """
         Set the suffix associated with a file name.
 
         Synopsis: suffix ‹ext›
         """
-        self.m.with_suffix(self.need(f'{cmd}: expected suffix'))
+        self.m.with_suffix(suffix)
         self.report = True
 
     def command_uri(self, _: str) -> None:
@@ -313,7 +352,7 @@ class Runner:
 
         Synopsis: uri
         """
-        print(self.m.uri())
+        self.write(self.m.uri())
         self.report = False
 
     def command_url(self, _: str) -> None:
@@ -327,7 +366,7 @@ class Runner:
         """
         u = self.m.url()
         if u:
-            print(u)
+            self.write(u)
         self.report = False
 
     def set_coder(self, cmd: str) -> None:
@@ -342,26 +381,117 @@ class Runner:
     def set_mode(self, cmd: str) -> None:
         self.m.mode.set_default(cmd)
 
-    def set_registry(self, r: Registry, cmd: str) -> None:
+    def need_registry_key(self, r: Registry, cmd: str) -> str:
         keys = r.keys()
         choices = ', '.join(f'‘{k}’' for k in keys)
         message = f'{cmd}: expected one of: {choices}'
         t = self.need(message)
         if t not in keys:
             raise Error(message)
-        r.set_default(t)
+        return t
 
-    def run(self, args: Iterable[str]) -> None:
+    def help_table(self) -> dict:
+        if self.help is None:
+            self.help = {}
+            for k, c in self.commands.items():
+                if c.__doc__:
+                    self.help[k] = docsplit(c.__doc__)
+        return self.help
+
+    def compile(self, args: Iterable[str]) -> Program:
+        """
+        Compile DSL tokens into a program.
+
+        All commands and their arguments are checked here, so that errors
+        are reported before anything runs. The resulting program can be
+        applied by `execute()` any number of times, by any `Runner`.
+        """
         self.tokens = iter(args)
-        self.report = False
+        program = []
         while (cmd := self.token()) is not None:
             c = self.commands.get(cmd)
             if not c:
                 msg = f'{cmd}: Unknown command'
                 raise Error(msg)
-            c(self, cmd)
+            if cmd in self.registries:
+                a: tuple[str, ...] = (
+                    self.need_registry_key(getattr(self.m, cmd), cmd), )
+            elif cmd == 'help':
+                a = tuple(self.help_names())
+            else:
+                a = tuple(
+                    self.need(f'{cmd}: expected {i}')
+                    for i in self.arguments.get(cmd, ()))
+            program.append(Op(cmd, c, a))
+        self.tokens = None
+        return tuple(program)
+
+    def help_names(self) -> Iterator[str]:
+        # `help` takes command names up to and including the first that
+        # is not a documented command.
+        help_table = self.help_table()
+        while (name := self.token()) is not None:
+            yield name
+            if name not in help_table:
+                break
+
+    def execute(self, program: Program, *, report: bool = False) -> None:
+        """
+        Apply a compiled program to the current state.
+
+        If `report` is true, or the program changes the attributes without
+        writing them, the attributes are written at the end.
+        """
+        self.report = report
+        for op in program:
+            op.command(self, op.name, *op.args)
         if self.report:
-            print(self.m)
+            self.write(self.m)
+
+    def run(self, args: Iterable[str]) -> None:
+        self.execute(self.compile(args))
 
     def runs(self, s: str) -> None:
         self.run(s.split())
+
+def run_batch(program: Sequence[str],
+              files: Iterable[str],
+              output: TextIO | None = None,
+              jobs: int = 1) -> int:
+    """
+    Apply a DSL program to each of a sequence of files.
+
+    The program is compiled once, so that errors in it are raised before
+    any file is processed. Each file name is decoded as if by
+    `file ‹filename›` before the program runs. Output for each file is
+    collected and written in one piece, in the order of `files`, even when
+    spread across `jobs` processes. A failure is logged and processing
+    continues with the next file.
+
+    Returns the number of files that failed.
+    """
+    if output is None:
+        output = sys.stdout
+    compiled = Runner().compile(program)
+    failures = 0
+    for file, out, error in ordered_map(
+            functools.partial(run_file, compiled), files, jobs):
+        if error:
+            failures += 1
+            logging.error('%s: %s', file, error)
+        output.write(out)
+    return failures
+
+def run_file(program: Program, file: str) -> tuple[str, str, str | None]:
+    """Apply a compiled program to a file, returning output and any error."""
+    buffer = io.StringIO()
+    error = None
+    try:
+        runner = Runner(output=buffer)
+        runner.m.file(file)
+        runner.execute(program, report=True)
+    except Error as e:
+        error = str(e)
+    except Exception as e:  # noqa: blind-except
+        error = f'{type(e).__name__}{e.args}'
+    return file, buffer.getvalue(), error
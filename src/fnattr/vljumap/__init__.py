@@ -27,10 +27,30 @@ class VljuMap(MultiMap[str, Vlju]):
 
     def to_strings(self, mode: str | None = None) -> MultiMap[str, str]:
         m: MultiMap[str, str] = MultiMap()
-        for k, v in self.get_pairs(mode):
-            m.add(k, str(v))
+        for k, vlist in self.string_lists(mode):
+            m.data[k] = vlist
         return m
 
+    def string_lists(
+        self,
+        mode: str | None = None,
+    ) -> Generator[tuple[str, list[str]], None, None]:
+        """
+        Yield (k, strings) for each key that has values.
+
+        The strings are as in `to_strings()`, i.e. without duplicates,
+        but no intermediate map is constructed.
+        """
+        for k, vlist in self.lists():
+            if vlist:
+                yield (k, _unique_strings(vlist, mode))
+
+    def strings(self, k: str, mode: str | None = None) -> list[str]:
+        """Return the strings for key `k`, as in `to_strings()[k]`."""
+        if vlist := self.data.get(k):
+            return _unique_strings(vlist, mode)
+        return []
+
     def add_pairs(self,
                   i: Iterable[tuple[str, str]],
                   factory: VljuFactory | None = None) -> Self:
@@ -39,3 +59,8 @@ class VljuMap(MultiMap[str, Vlju]):
         for k, v in i:
             self.add(*factory(k, v))
         return self
+
+def _unique_strings(vlist: list[Vlju], mode: str | None) -> list[str]:
+    if len(vlist) == 1:
+        return [str(vlist[0].get(mode))]
+    return list(dict.fromkeys(str(v.get(mode)) for v in vlist))
@@ -0,0 +1,244 @@
+# SPDX-License-Identifier: MIT
+"""VljuBatch - columnar storage for many decoded file names."""
+
+import array
+import bisect
+import functools
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Self
+
+from fnattr.vlju import Vlju
+from fnattr.vlju.types.all import VLJU_TYPES
+from fnattr.vlju.types.doi import DOI
+from fnattr.vlju.types.ean.isbn import ISBN
+from fnattr.vljumap import VljuMap
+from fnattr.vljumap.enc import Encoder, v3
+from fnattr.vljumap.factory import (
+    LooseMappedFactory,
+    VljuFactory,
+    default_factory,
+)
+
+class VljuBatch:
+    """
+    Columnar store of the attributes of many file names.
+
+    Each (file, key, value) attribute is a row. Rows are held in parallel
+    arrays of integer codes: `file` holds the file id (the order in which
+    the file was added), `key` indexes `keys`, and `value` indexes
+    `values`. Keys and value strings are stored once however often they
+    occur. Rows for a file are contiguous, and file ids never decrease.
+
+    Values are stored as the canonical string of the Vlju made by the
+    factory, so converting back to a VljuMap with the same factory gives
+    equal values. The batch's `factory` is the default for decoding and
+    converting; unless given, it is `typed_factory()` if `typed`, else
+    `default_factory`. `typed_factory()` knows only the built-in types,
+    so batches ignore site configuration: to type configured site keys,
+    pass the configured factory (e.g. `M.loose_factory`) as `factory`.
+    With `typed`, values that were made as ISBN or DOI
+    also record, per value string, the ISBN as an integer in `isbn`
+    (else -1) and the index of the DOI prefix in `prefixes` in
+    `doi_prefix` (else -1).
+
+    Decoders fill the batch directly, without a VljuMap per file.
+    The rows for each key are indexed, so queries by key examine only
+    the rows that have it.
+    """
+
+    def __init__(self,
+                 *,
+                 typed: bool = True,
+                 keep_names: bool = True,
+                 factory: VljuFactory | None = None) -> None:
+        self.typed = typed
+        if factory is None:
+            factory = typed_factory() if typed else default_factory
+        self.factory = factory
+        self.file = array.array('I')
+        self.key = array.array('I')
+        self.value = array.array('I')
+        self.keys: list[str] = []
+        self.values: list[str] = []
+        self.isbn = array.array('q')
+        self.doi_prefix = array.array('i')
+        self.prefixes: list[str] = []
+        self.names: list[str] | None = [] if keep_names else None
+        self.nfiles = 0
+        self._key_code: dict[str, int] = {}
+        self._value_code: dict[str, int] = {}
+        self._prefix_code: dict[str, int] = {}
+        self._key_rows: list[array.array[int]] = []
+
+    @classmethod
+    def from_names(cls,
+                   names: Iterable[str],
+                   decoder: Encoder = v3,
+                   factory: VljuFactory | None = None,
+                   **kwargs) -> Self:
+        """Return a batch of the decoded file name stems `names`."""
+        batch = cls(factory=factory, **kwargs)
+        for s in names:
+            batch.add(s, decoder)
+        return batch
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.file)
+
+    def add(self,
+            s: str,
+            decoder: Encoder = v3,
+            factory: VljuFactory | None = None) -> int:
+        """Decode the file name stem `s` as a new file; return its id."""
+        if factory is None:
+            factory = self.factory
+        row = _Rows(self, s)
+        decoder.decode(row, s, factory)   # type: ignore[arg-type]
+        return row.file_id
+
+    def add_file(self,
+                 p: Path | str,
+                 decoder: Encoder = v3,
+                 factory: VljuFactory | None = None) -> int:
+        """Decode the file name `p` as a new file; return its id."""
+        if factory is None:
+            factory = self.factory
+        row = _Rows(self, str(p))
+        decoder.decode_file(row, Path(p), factory)  # type: ignore[arg-type]
+        return row.file_id
+
+    def add_map(self, m: VljuMap, name: str = '') -> int:
+        """Add the contents of `m` as a new file; return its id."""
+        row = _Rows(self, name)
+        for k, v in m.pairs():
+            row.add(k, v)
+        return row.file_id
+
+    def key_code(self, k: str) -> int | None:
+        return self._key_code.get(k)
+
+    def value_code(self, v: str) -> int | None:
+        return self._value_code.get(v)
+
+    def rows(self, file_id: int) -> range:
+        """Return the row indices for `file_id`."""
+        return range(bisect.bisect_left(self.file, file_id),
+                     bisect.bisect_right(self.file, file_id))
+
+    def pairs(self, file_id: int) -> Iterable[tuple[str, str]]:
+        """Yield (key, value) strings for `file_id`."""
+        for i in self.rows(file_id):
+            yield (self.keys[self.key[i]], self.values[self.value[i]])
+
+    def to_map(self,
+               file_id: int,
+               factory: VljuFactory | None = None) -> VljuMap:
+        if factory is None:
+            factory = self.factory
+        return VljuMap().add_pairs(self.pairs(file_id), factory)
+
+    def to_maps(self,
+                factory: VljuFactory | None = None) -> Iterable[VljuMap]:
+        for file_id in range(self.nfiles):
+            yield self.to_map(file_id, factory)
+
+    def where(self, key: str, value: str | None = None) -> list[int]:
+        """Return the indices of rows with `key` (and `value`, if given)."""
+        if (kc := self._key_code.get(key)) is None:
+            return []
+        rows = self._key_rows[kc]
+        if value is None:
+            return rows.tolist()
+        if (vc := self._value_code.get(value)) is None:
+            return []
+        v = self.value
+        return [i for i in rows if v[i] == vc]
+
+    def files(self, key: str, value: str | None = None) -> list[int]:
+        """Return the ids of files with `key` (and `value`, if given)."""
+        file = self.file
+        return list(dict.fromkeys(file[i] for i in self.where(key, value)))
+
+    def group(self, key: str) -> dict[str, list[int]]:
+        """Map each value of `key` to the ids of files that have it."""
+        r: dict[int, list[int]] = {}
+        file = self.file
+        value = self.value
+        for i in self.where(key):
+            ids = r.setdefault(value[i], [])
+            if not ids or ids[-1] != file[i]:
+                ids.append(file[i])
+        return {self.values[vc]: ids for vc, ids in r.items()}
+
+    def count(self) -> dict[str, int]:
+        """Map each key to the number of rows that have it."""
+        return {k: len(rows) for k, rows in zip(self.keys, self._key_rows,
+                                                strict=True)}
+
+    def _code(self, table: dict[str, int], strings: list[str],
+              s: str) -> int:
+        if (c := table.get(s)) is None:
+            c = len(strings)
+            table[s] = c
+            strings.append(s)
+        return c
+
+    def _add_value(self, s: str, v: Vlju) -> int:
+        if (vc := self._value_code.get(s)) is None:
+            vc = self._code(self._value_code, self.values, s)
+            if self.typed:
+                self.isbn.append(-1)
+                self.doi_prefix.append(-1)
+        if self.typed:
+            v = v.typed()
+            if isinstance(v, ISBN):
+                self.isbn[vc] = int(v)
+            elif isinstance(v, DOI):
+                self.doi_prefix[vc] = self._code(self._prefix_code,
+                                                 self.prefixes,
+                                                 str(v.prefix()))
+        return vc
+
+@functools.cache
+def typed_factory() -> VljuFactory:
+    """
+    Return the factory that typed batches use by default.
+
+    It maps only the built-in types of `VLJU_TYPES`, not configured sites.
+    """
+    return LooseMappedFactory(VLJU_TYPES)
+
+class _Rows:
+    """Stands in for a VljuMap while decoding one file into a VljuBatch."""
+
+    def __init__(self, batch: VljuBatch, name: str) -> None:
+        self.batch = batch
+        self.file_id = batch.nfiles
+        self.seen: set[tuple[int, int]] = set()
+        batch.nfiles += 1
+        if batch.names is not None:
+            batch.names.append(name)
+
+    def add(self, k: str, v: Vlju) -> Self:
+        batch = self.batch
+        kc = batch._code(batch._key_code, batch.keys, k)  # noqa: SLF001
+        vc = batch._add_value(str(v), v)                  # noqa: SLF001
+        if (kc, vc) not in self.seen:
+            self.seen.add((kc, vc))
+            key_rows = batch._key_rows                      # noqa: SLF001
+            if kc == len(key_rows):
+                key_rows.append(array.array('I'))
+            key_rows[kc].append(len(batch.file))
+            batch.file.append(self.file_id)
+            batch.key.append(kc)
+            batch.value.append(vc)
+        return self
+
+    def add_pairs(self, i: Iterable[tuple[str, str]],
+                  factory: VljuFactory) -> Self:
+        for k, v in i:
+            self.add(*factory(k, v))
+        return self
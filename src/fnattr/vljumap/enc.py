@@ -1,9 +1,8 @@
 # SPDX-License-Identifier: MIT
 """Encode and decode VljuMap."""
 
-import csv as py_csv
+import functools
 import io
-import json as py_json
 import re
 import shlex
 import urllib.parse
@@ -15,8 +14,6 @@ from pathlib import Path
 from typing import NamedTuple
 
 from fnattr.util import escape
-from fnattr.util.error import Error
-from fnattr.util.multimap import MultiMap
 from fnattr.vlju.types.ean.isbn import is_valid_isbn10, is_valid_isbn13
 from fnattr.vljumap import VljuFactory, VljuMap
 
@@ -50,6 +47,14 @@ class Encoder:
         else:
             self.decode_file = self._decode_file
 
+    def encode_many(self,
+                    maps: Iterable[VljuMap],
+                    mode: str | None = None) -> Generator[str, None, None]:
+        """Encode each of `maps`; equivalent to `encode()` on each."""
+        encode = self.encode
+        for n in maps:
+            yield encode(n, mode)
+
     def can_encode(self) -> bool:
         return self.encode != _unimplemented_encode
 
@@ -151,21 +156,28 @@ v3 = _register_encoder(
         description=V3_DESCRIPTION))
 
 def _v3_enc(config: V3Config, n: VljuMap, mode: str | None) -> str:
-    m = n.to_strings(mode)
-
-    sequence = config.seq_join.join(m['n'])
-    sequence = sequence and f'{config.seq_start}{sequence}{config.seq_end}'
-    title_qjoin = config.title_join.translate(
-        escape.mktrans_urlish(config.title_join.strip()))
-    title = config.title_join.join(
-        config.quote.encode(i).replace(config.title_join, title_qjoin)
-        for i in m['title'])
-    attrs = config.attr_join.join(
-        kv_fmt(k, v, config.attr_kv, config.quote)
-        for k, v in m.pairs()
-        if k not in ('title', 'n'))
-    attrs = attrs and f'{config.attr_start}{attrs}{config.attr_end}'
-    return join_non_empty(' ', sequence, title, attrs)
+    sequence = title = ''
+    attrs: list[str] = []
+    for k, vlist in n.string_lists(mode):
+        if k == 'n':
+            sequence = config.seq_join.join(vlist)
+            sequence = sequence and (
+                f'{config.seq_start}{sequence}{config.seq_end}')
+        elif k == 'title':
+            title_qjoin = _v3_title_qjoin(config.title_join)
+            title = config.title_join.join(
+                config.quote.encode(i).replace(config.title_join, title_qjoin)
+                for i in vlist)
+        else:
+            attrs.extend(
+                kv_fmt(k, v, config.attr_kv, config.quote) for v in vlist)
+    attr = config.attr_join.join(attrs)
+    attr = attr and f'{config.attr_start}{attr}{config.attr_end}'
+    return join_non_empty(' ', sequence, title, attr)
+
+@functools.cache
+def _v3_title_qjoin(title_join: str) -> str:
+    return title_join.translate(escape.mktrans_urlish(title_join.strip()))
 
 def _v3_dec_file(config: V3Config, n: VljuMap, p: Path,
                  factory: VljuFactory) -> DecodeFileResult:
@@ -186,59 +198,58 @@ def _v3_dec(config: V3Config, n: VljuMap, s: str,
     return n.add_pairs(_v3_dec_iter(config, s), factory)
 
 def _v3_dec_iter(config: V3Config, s: str) -> Iterable[tuple[str, str]]:
-    if config.attr_start in s:
-        s, _, attr = s.partition(config.attr_start)
-    else:
-        attr = ''
-    if s:
-        sequence, title = _v3_dec_seq(config, s)
-        for v in sequence:
-            yield ('n', v)
+    # Single pass over `s`: the sequence scan and the title and attribute
+    # splits each cover a disjoint part of the string, and fields are only
+    # unquoted if they contain an escape.
+    a = s.find(config.attr_start)
+    end = len(s) if a < 0 else a
+    if end:
+        pos = _v3_dec_seq_end(config, s, end)
+        if pos:
+            yield from _v3_dec_seq(config, s, pos)
+            title = s[pos : end].strip()
+        else:
+            title = s[: end]
         if title:
             for i in title.split(config.title_join):
-                yield ('title', escape.winfile.decode(i.strip()))
-    if attr:
-        for k, v in _v3_dec_attr(config, attr):
-            yield (k, v)
+                yield ('title', _v3_unquote(i.strip()))
+    if a >= 0 and (attr := s[a + len(config.attr_start):]):
+        yield from _v3_dec_attr(config, attr)
 
 def _v3_dec_attr(config: V3Config, s: str) -> Iterable[tuple[str, str]]:
     if s.endswith(config.attr_end):
         s = s[:-1]
     else:
         warnings.warn(f"Expected '{config.attr_end}' after '{s}'", stacklevel=0)
+    kv_sep = config.attr_kv
     for kv in s.split(config.attr_join.strip()):
-        if config.attr_kv in kv:
-            k, v = kv.split(config.attr_kv, 1)
-        else:
-            k = kv
-            v = ''
-        k = escape.winfile.decode(k.strip())
-        v = escape.winfile.decode(v.strip())
-        if not k:
-            continue
-        yield (k, v)
-
-def _v3_dec_seq(config: V3Config, s: str) -> tuple[Iterable[str], str]:
-    # Not currently used by any encoding:
-    # if config.seq_start:
-    #     if not s.startswith(config.seq_start):
-    #         return ([], s)
-    #     s = s[len(config.seq_start):]
-    if config.seq_end not in s:
-        return ([], s)
-    seq: list[str] = []
-    t = s
-    lj = len(config.seq_join)
-    while (((i := t.find(config.seq_join)) > 0) and t[: i].isalnum()
-           and t[i + lj].isalnum() and t[0].isdigit()):
-        seq.append(t[: i])
-        t = t[(i + lj):]
-    if ((i := t.find(config.seq_end)) > 0 and t[: i].isalnum()
-            and t[0].isdigit()):
-        seq.append(t[: i])
-        t = t[(i + len(config.seq_end)):]
-        return (seq, t.strip())
-    return ([], s)
+        k, _, v = kv.partition(kv_sep)
+        if k := k.strip():
+            yield (_v3_unquote(k), _v3_unquote(v.strip()))
+
+def _v3_unquote(s: str) -> str:
+    return escape.winfile.decode(s) if '%' in s else s
+
+def _v3_dec_seq_end(config: V3Config, s: str, end: int) -> int:
+    """Return the index following sequence numbers in `s[:end]`, or 0."""
+    # Not currently used by any encoding: config.seq_start
+    join = config.seq_join
+    lj = len(join)
+    pos = 0
+    while ((i := s.find(join, pos, end)) > pos and i + lj < end
+           and s[pos].isdigit() and s[pos : i].isalnum()
+           and s[i + lj].isalnum()):
+        pos = i + lj
+    if ((i := s.find(config.seq_end, pos, end)) > pos and s[pos].isdigit()
+            and s[pos : i].isalnum()):
+        return i + len(config.seq_end)
+    return 0
+
+def _v3_dec_seq(config: V3Config, s: str,
+                end: int) -> Generator[tuple[str, str], None, None]:
+    """Yield sequence numbers from `s[:end]`, as found by `_v3_dec_seq_end`."""
+    for i in s[: end - len(config.seq_end)].split(config.seq_join):
+        yield ('n', i)
 
 ###############################################################################
 #
@@ -367,12 +378,12 @@ V1_CONFIG = V3Config(
     escape.unixfile, attr_start='[', attr_end=']', attr_join=',')
 
 def v1_encode(n: VljuMap, mode: str | None = None) -> str:
-    m = n.to_strings(mode)
-    r = _v1_enc_author_title(m)
+    r = _v1_enc_author_title(n, mode)
     attrs = ','.join(
         kv_fmt(k, v, '=', escape.unixfile)
-        for k, v in m.pairs()
-        if k not in ('title', 'a'))
+        for k, vlist in n.string_lists(mode)
+        if k not in ('title', 'a')
+        for v in vlist)
     return spj(r, f'[{attrs}]') if attrs else r
 
 def v1_decode(n: VljuMap, s: str, factory: VljuFactory) -> VljuMap:
@@ -382,10 +393,10 @@ v1 = _register_encoder(
     Encoder(
         'v1', v1_encode, v1_decode, desc=V1_DESC, description=V1_DESCRIPTION))
 
-def _v1_enc_author_title(m: MultiMap) -> str:
-    author = '; '.join(i for i in m['a'])
+def _v1_enc_author_title(n: VljuMap, mode: str | None) -> str:
+    author = '; '.join(n.strings('a', mode))
     r = f'{author}:' if author else ''
-    title = ': '.join(i for i in m['title'])
+    title = ': '.join(n.strings('title', mode))
     return spj(r, title)
 
 def _v1_dec_iter(config: V3Config, s: str) -> Iterable[tuple[str, str]]:
@@ -427,12 +438,11 @@ V0_DESCRIPTION = """
 """ + V0_GRAMMAR
 
 def v0_encode(n: VljuMap, mode: str | None = None) -> str:
-    m = n.to_strings(mode)
-    r = _v1_enc_author_title(m)
-    if 'isbn' in m:
-        return spj(r, m['isbn'][0])
-    if 'lccn' in m:
-        return spj(r, f'lccn={m["lccn"][0]}')
+    r = _v1_enc_author_title(n, mode)
+    if isbn := n.strings('isbn', mode):
+        return spj(r, isbn[0])
+    if lccn := n.strings('lccn', mode):
+        return spj(r, f'lccn={lccn[0]}')
     return r
 
 def v0_decode(n: VljuMap, s: str, factory: VljuFactory) -> VljuMap:
@@ -442,27 +452,46 @@ v0 = _register_encoder(
     Encoder(
         'v0', v0_encode, v0_decode, desc=V0_DESC, description=V0_DESCRIPTION))
 
-V0_RE = re.compile(
-    r"""
-        (?P<rest>.*)
-        \b(?:
-            (?P<isbn> (?: [0-9]{13} | [0-9]{9}[0-9xX] ) )
-        | lccn=(?P<lccn> \S+ )
-        )$
-        """, re.VERBOSE)
-
 def _v0_dec_iter(s: str) -> Generator[tuple[str, str], None, None]:
-    if m := V0_RE.fullmatch(s):
-        s = m.group('rest')
+    if tail := _v0_dec_tail(s):
+        i, k, v = tail
+        s = s[: i]
     yield from _v1_dec_author_title(s)
-    if m:
-        if isbn := m.group('isbn'):
-            yield ('isbn', isbn)
-        elif lccn := m.group('lccn'):   # pragma: no branch
-            yield ('lccn', lccn)
-        else:                           # pragma: no cover
-            message = f'no isbn or lccn in {s}'
-            raise Error(message)
+    if tail:
+        yield (k, v)
+
+def _v0_dec_tail(s: str) -> tuple[int, str, str] | None:
+    """
+    Find a trailing ISBN or LCCN.
+
+    Returns the start index, key, and value, or None. This is equivalent to
+    matching `(?P<rest>.*)\\b(?:(?P<isbn>[0-9]{13}|[0-9]{9}[0-9xX])
+    |lccn=(?P<lccn>\\S+))$`, preferring the longest `rest`, but examines only
+    the last whitespace-delimited token.
+    """
+    if '\n' in s:
+        # ‘.’ does not match a newline, and a newline can't be in the tail.
+        return None
+    n = len(s)
+    candidates = []
+    if (n >= 13 and _is_ascii_digits(s[n - 13 :])
+            and _is_word_boundary(s, n - 13)):
+        candidates.append((n - 13, 'isbn', s[n - 13 :]))
+    if (n >= 10 and _is_ascii_digits(s[n - 10 : n - 1]) and s[-1] in V0_ISBN_END
+            and _is_word_boundary(s, n - 10)):
+        candidates.append((n - 10, 'isbn', s[n - 10 :]))
+    lo = n
+    while lo > 0 and not s[lo - 1].isspace():
+        lo -= 1
+    hi = n - 1
+    while (i := s.rfind('lccn=', lo, hi)) >= 0:
+        if _is_word_boundary(s, i):
+            candidates.append((i, 'lccn', s[i + 5 :]))
+            break
+        hi = i + 4
+    return max(candidates, default=None)
+
+V0_ISBN_END = frozenset('0123456789xX')
 
 ###############################################################################
 #
@@ -493,18 +522,17 @@ SFC_DESCRIPTION = """
 """ + SFC_GRAMMAR
 
 def sfc_encode(n: VljuMap, mode: str | None = None) -> str:
-    m = n.to_strings(mode)
-    title = ' - '.join(i for i in m['title'])
-    author = ', '.join(i for i in m['a'])
+    title = ' - '.join(n.strings('title', mode))
+    author = ', '.join(n.strings('a', mode))
     if author:
         author = f'by {author}'
-    isbn = m['isbn'][0] if 'isbn' in m else ''
-    if 'edition' in m:
-        e = int(m['edition'][0])
+    isbn = (n.strings('isbn', mode) or [''])[0]
+    if editions := n.strings('edition', mode):
+        e = int(editions[0])
         edition = f'{e}{nth(e)} edition'
     else:
         edition = ''
-    date = m['date'][0] if 'date' in m else ''
+    date = (n.strings('date', mode) or [''])[0]
     return join_non_empty(' ', title, author, isbn, edition, date)
 
 def sfc_decode(n: VljuMap, s: str, factory: VljuFactory) -> VljuMap:
@@ -518,30 +546,9 @@ sfc = _register_encoder(
         desc=SFC_DESC,
         description=SFC_DESCRIPTION))
 
-SFC_TAIL_RE = re.compile(
-    r"""
-        (?P<prefix> .*)
-        (?:
-            (?P<date> [12]\d\d\d ) |
-            (?: (?P<edition> \d+ ) \w*\s+edition )
-        )$
-        """, re.X)
-
 def _sfc_dec_iter(s: str) -> Generator[tuple[str, str], None, None]:
-    while True:
-        if m := SFC_TAIL_RE.fullmatch(s):
-            for k in ('date', 'edition'):
-                if v := m.group(k):
-                    yield (k, v)
-            s = m.group('prefix').strip()
-        elif is_valid_isbn10(s[-10 :]):
-            yield ('isbn', s[-10 :])
-            s = s[:-10].strip()
-        elif is_valid_isbn13(s[-13 :]):
-            yield ('isbn', s[-13 :])
-            s = s[:-13].strip()
-        else:
-            break
+    tail, s = _sfc_dec_tail(s)
+    yield from tail
     if (by := s.rfind(' by ')) > 0:
         authors = s[by + 4 :]
     elif s.startswith('by '):
@@ -563,6 +570,61 @@ def _sfc_dec_iter(s: str) -> Generator[tuple[str, str], None, None]:
         for i in s.split(' - ', 1):
             yield ('title', escape.winfile.decode(i.strip()))
 
+def _sfc_dec_tail(s: str) -> tuple[list[tuple[str, str]], str]:
+    """
+    Split trailing dates, editions and ISBNs from `s`, right to left.
+
+    Returns the tail attributes and the remaining string. A date or edition
+    is what would be found by repeatedly matching `(?P<prefix>.*)(?:
+    (?P<date>[12]\\d\\d\\d)|(?P<edition>\\d+)\\w*\\s+edition)$` and
+    stripping the prefix, but each token is examined only once, so the time
+    taken is linear in the length of `s`.
+    """
+    tail = []
+    start = 0
+    end = len(s)
+    newline = s.find('\n')
+    matched = False
+    while True:
+        t = _sfc_dec_date_edition(s, start, end)
+        if t and not 0 <= newline < t[0]:   # ‘.’ does not match a newline.
+            end, k, v = t
+            tail.append((k, v))
+        elif is_valid_isbn10(v := s[max(start, end - 10) : end]):
+            tail.append(('isbn', v))
+            end -= 10
+        elif is_valid_isbn13(v := s[max(start, end - 13) : end]):
+            tail.append(('isbn', v))
+            end -= 13
+        else:
+            break
+        while end > start and s[end - 1].isspace():
+            end -= 1
+        if not matched:
+            matched = True
+            while start < end and s[start].isspace():
+                start += 1
+            newline = s.find('\n', start, end)
+    return tail, (s[start : end] if matched else s)
+
+def _sfc_dec_date_edition(s: str, start: int,
+                          end: int) -> tuple[int, str, str] | None:
+    if end - start >= 4 and s[end - 4] in '12' and s[end - 3 : end].isdecimal():
+        return (end - 4, 'date', s[end - 4 : end])
+    if not s.endswith('edition', start, end):
+        return None
+    # ‘\\d+\\w*\\s+’ before ‘edition’, with the shortest possible match.
+    i = end - 7
+    while i > start and s[i - 1].isspace():
+        i -= 1
+    if i == end - 7:
+        return None
+    while i > start and _is_word_char(c := s[i - 1]):
+        i -= 1
+        if c.isdecimal():
+            return (i, 'edition', c)
+    return None
+
 ###############################################################################
 #
 # JSON
@@ -576,13 +638,20 @@ JSON_DESCRIPTION = """
   of values.
 """
 
+# The `json` and `csv` modules are imported on first use, since most
+# invocations never need them.
+
 def json_encode(n: VljuMap, mode: str | None = None) -> str:
+    import json as py_json
+
     return py_json.dumps(dict(n.get_lists(mode)))
 
 def json_decode(n: VljuMap, s: str, factory: VljuFactory) -> VljuMap:
     return n.add_pairs(_json_dec_iter(s), factory)
 
 def _json_dec_iter(s: str) -> Generator[tuple[str, str], None, None]:
+    import json as py_json
+
     for k, vl in py_json.loads(s).items():
         if isinstance(vl, list):
             for v in vl:
@@ -712,6 +781,8 @@ csv = _register_encoder(
         description=CSV_DESCRIPTION))
 
 def _csv_enc(n: VljuMap, mode: str | None, **kwargs) -> str:
+    import csv as py_csv
+
     with io.StringIO() as f:
         w = py_csv.writer(f, **kwargs)
         for kv in n.get_pairs(mode):
@@ -719,6 +790,8 @@ def _csv_enc(n: VljuMap, mode: str | None, **kwargs) -> str:
         return f.getvalue()
 
 def _csv_dec_iter(s: str, **kwargs) -> Generator[tuple[str, str], None, None]:
+    import csv as py_csv
+
     for row in py_csv.reader(s.split('\n'), **kwargs):
         if row:
             k, v = row
@@ -730,6 +803,19 @@ def _csv_dec_iter(s: str, **kwargs) -> Generator[tuple[str, str], None, None]:
 #
 ###############################################################################
 
+def _is_ascii_digits(s: str) -> bool:
+    return s.isascii() and s.isdigit()
+
+def _is_word_char(c: str) -> bool:
+    """Test for a regular expression ‘\\w’ character."""
+    return c.isalnum() or c == '_'
+
+def _is_word_boundary(s: str, i: int) -> bool:
+    """Test for a regular expression ‘\\b’ at index `i`."""
+    before = i > 0 and _is_word_char(s[i - 1])
+    after = i < len(s) and _is_word_char(s[i])
+    return before != after
+
 def kv_fmt(k: str, v: str | None, sep: str, e: escape.Escape) -> str:
     if v:
         return f'{k}{sep}{e.encode(v)}'
@@ -1,10 +1,17 @@
 # SPDX-License-Identifier: MIT
 """Vlju factories."""
 
-from collections.abc import Callable, Mapping
-from typing import Self
+import functools
+import sys
+import weakref
+
+from collections import Counter
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any, NamedTuple, Self
 
 from fnattr.util.error import Error
+from fnattr.util.lazy import ImportMap
+from fnattr.util.writeonce import init_attr
 from fnattr.vlju import Vlju
 
 VljuFactory = Callable[[str, str], tuple[str, Vlju]]
@@ -21,7 +28,7 @@ class MappedFactory:
     def __init__(self,
                  kmap: Mapping[str, type[Vlju]],
                  default: type[Vlju] = Vlju) -> None:
-        self.kmap = dict(kmap)
+        self.kmap: ImportMap[type[Vlju]] = ImportMap(kmap)
         self.default = default
 
     def setitem(self, k: str, v: type[Vlju]) -> Self:
@@ -29,18 +36,221 @@ class MappedFactory:
         return self
 
     def __call__(self, k: str, v: str) -> tuple[str, Vlju]:
-        try:
-            return (k, self.kmap.get(k, self.default)(v))
-        except Exception as e:  # noqa: blind-except
+        if (value := self.kmap.get(k, self.default).try_parse(v)) is None:
             msg = f'{k} {v}'
-            raise FactoryError(msg) from e
+            raise FactoryError(msg)
+        return (k, value)
 
 class LooseMappedFactory(MappedFactory):
-    """VljuFactory that maps keys for Vlju types, and reverts to default."""
+    """
+    VljuFactory that maps keys for Vlju types, and reverts to default.
+
+    Outcomes for mapped keys are remembered for the most recent
+    `maxsize` (key, value) pairs, so a repeated pair yields the same
+    Vlju without parsing again. `fallbacks` counts, per key, the values
+    that were not suitable for the key's type and reverted to default.
+    """
+
+    def __init__(self,
+                 kmap: Mapping[str, type[Vlju]],
+                 default: type[Vlju] = Vlju,
+                 maxsize: int = 4096) -> None:
+        super().__init__(kmap, default)
+        self.fallbacks: Counter[str] = Counter()
+        self._parse = functools.lru_cache(maxsize)(self._parse_uncached)
+
+    def setitem(self, k: str, v: type[Vlju]) -> Self:
+        self._parse.cache_clear()
+        return super().setitem(k, v)
 
     def __call__(self, k: str, v: str) -> tuple[str, Vlju]:
-        try:
-            value = self.kmap.get(k, self.default)(v)
-        except Exception:   # noqa: blind-except
-            value = self.default(v)
+        if k not in self.kmap:
+            return (k, self.default(v))
+        value, typed = self._parse(k, v)
+        if not typed:
+            self.fallbacks[k] += 1
         return (k, value)
+
+    def cache_info(self) -> Any:  # noqa: any-type
+        """Return the statistics of the outcome cache."""
+        return self._parse.cache_info()
+
+    def clear(self) -> Self:
+        """Forget remembered outcomes and reset the counts."""
+        self._parse.cache_clear()
+        self.fallbacks.clear()
+        return self
+
+    def _parse_uncached(self, k: str, v: str) -> tuple[Vlju, bool]:
+        if (value := self.kmap[k].try_parse(v)) is None:
+            return (self.default(v), False)
+        return (value, True)
+
+class LazyVlju(Vlju):
+    """
+    Vlju whose type is resolved on first use.
+
+    Holds the raw value string, and the LazyFactory and key that make the
+    typed Vlju from it. Anything beyond the raw string (a string form in
+    any mode, a comparison, a typed method) makes the typed Vlju, once,
+    and defers to it, so results are the same as from the factory itself.
+    Type tests should use `typed()`.
+    """
+
+    __slots__ = ('_key', '_factory', '_typed')
+
+    _key: str
+    _factory: 'LazyFactory'
+    _typed: Vlju
+
+    def __init__(self, s: str, k: str, factory: 'LazyFactory') -> None:
+        super().__init__(s)
+        init_attr(self, '_key', k)
+        init_attr(self, '_factory', factory)
+
+    def raw(self) -> str:
+        """Return the value string as given."""
+        return self._value
+
+    def is_typed(self) -> bool:
+        """Return whether the typed Vlju has been made."""
+        return hasattr(self, '_typed')
+
+    def typed(self) -> Vlju:
+        try:
+            return self._typed
+        except AttributeError:
+            typed = self._factory.resolve(self._key, self._value)
+            init_attr(self, '_typed', typed)
+            return typed
+
+    def __getattr__(self, name: str) -> Any:  # noqa: any-type
+        # Only reached for names that LazyVlju does not have.
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.typed(), name)
+
+    def __str__(self) -> str:
+        return str(self.typed())
+
+    def __int__(self) -> int:
+        return int(self.typed())    # type: ignore[call-overload]
+
+    def lv(self) -> str:
+        return self.typed().lv()
+
+    def __getitem__(self, key: str | None) -> str:
+        return self.typed()[key]
+
+    def __repr__(self) -> str:
+        return repr(self.typed())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyVlju):
+            if self._source() == other._source():  # noqa: SLF001
+                return True
+            other = other.typed()
+        return self.typed() == other
+
+    __hash__ = Vlju.__hash__
+
+    def _hash_key(self) -> Hashable:
+        return self.typed()._hash_key()     # noqa: SLF001
+
+    def _source(self) -> tuple[str, str, int]:
+        return (self._value, self._key, id(self._factory))
+
+class LazyFactory:
+    """
+    VljuFactory that defers typing values until they are used.
+
+    Wraps a MappedFactory. Values for keys that it maps to a type are
+    returned as LazyVlju, which calls the wrapped factory on first use;
+    values for other keys are made directly. So decoding does not pay for
+    parsing typed values that are never looked at, as when only keys
+    are examined. Errors from a strict factory arise on first use.
+
+    Typed values are remembered, up to `maxsize` of them, and a value
+    already typed is returned as is rather than wrapped again; otherwise
+    a LazyVlju costs more than parsing would when most values end up
+    being used, as in decoding and encoding every name. Call `clear()`
+    after changing the wrapped factory's key map.
+    """
+
+    def __init__(self, factory: MappedFactory, maxsize: int = 4096) -> None:
+        self.factory = factory
+        self.maxsize = maxsize
+        self._typed: dict[tuple[str, str], Vlju] = {}
+
+    def __call__(self, k: str, v: str) -> tuple[str, Vlju]:
+        if k not in self.factory.kmap:
+            return (k, self.factory.default(v))
+        if (value := self._typed.get((k, v))) is not None:
+            return (k, value)
+        return (k, LazyVlju(v, k, self))
+
+    def resolve(self, k: str, v: str) -> Vlju:
+        """Return the typed Vlju for `v` under key `k`."""
+        value = self.factory(k, v)[1]
+        if len(self._typed) < self.maxsize:
+            self._typed[(k, v)] = value
+        return value
+
+    def clear(self) -> Self:
+        """Forget remembered typed values."""
+        self._typed.clear()
+        return self
+
+class InternStats(NamedTuple):
+    """Counts for an InterningFactory."""
+
+    hits: int
+    misses: int
+    size: int
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class InterningFactory:
+    """
+    VljuFactory that shares equal results.
+
+    Wraps another factory. Keys are interned, and the Vlju made for each
+    (key, value) pair is remembered in a table of weak references, so that
+    a repeated value yields the same instance for as long as one is in use.
+    The table holds at most `maxsize` entries; beyond that, results are
+    made afresh.
+    """
+
+    def __init__(self, factory: VljuFactory, maxsize: int = 1 << 16) -> None:
+        self.factory = factory
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._keys: dict[str, str] = {}
+        self._table: weakref.WeakValueDictionary[tuple[str, str], Vlju] = (
+            weakref.WeakValueDictionary())
+
+    def __call__(self, k: str, v: str) -> tuple[str, Vlju]:
+        if (key := self._keys.get(k)) is not None:
+            if (value := self._table.get((k, v))) is not None:
+                self.hits += 1
+                return (key, value)
+        self.misses += 1
+        key, value = self.factory(k, v)
+        key = sys.intern(key)
+        if len(self._table) < self.maxsize:
+            self._keys.setdefault(sys.intern(k), key)
+            self._table[(k, v)] = value
+        return (key, value)
+
+    def stats(self) -> InternStats:
+        return InternStats(self.hits, self.misses, len(self._table))
+
+    def clear(self) -> Self:
+        """Forget remembered values and reset the counts."""
+        self._keys.clear()
+        self._table.clear()
+        self.hits = self.misses = 0
+        return self
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: MIT
+"""Test make_isbn_ranges."""
+
+import io
+
+from pathlib import Path
+
+import pytest
+
+from fnattr.extra import make_isbn_ranges
+from fnattr.extra.make_isbn_ranges import (
+    RangesDiff,
+    RangesFromXml,
+    affected_files,
+)
+from fnattr.vlju.types.ean.isbn import RANGE_FILE, map_ranges
+from fnattr.vljumap import enc
+
+XML = Path(__file__).parents[3] / 'third_party/data/RangeMessage.xml'
+
+def message(*groups: tuple[str, str, list[tuple[str, int]]]) -> io.BytesIO:
+    """Return an ISBNRangeMessage with the given groups."""
+    r = ['<ISBNRangeMessage><EAN.UCCPrefixes><EAN.UCC><Prefix>978</Prefix>'
+         '<Rules><Rule><Range>0000000-9999999</Range><Length>1</Length>'
+         '</Rule></Rules></EAN.UCC></EAN.UCCPrefixes><RegistrationGroups>']
+    for prefix, agency, rules in groups:
+        r.append(f'<Group><Prefix>{prefix}</Prefix><Agency>{agency}</Agency>'
+                 '<Rules>')
+        for rng, length in rules:
+            r.append(f'<Rule><Range>{rng}</Range><Length>{length}</Length>'
+                     '</Rule>')
+        r.append('</Rules></Group>')
+    r.append('</RegistrationGroups></ISBNRangeMessage>')
+    return io.BytesIO(''.join(r).encode())
+
+OLD = [
+    ('978-0', 'English language',
+     [('0000000-1999999', 2), ('2000000-6999999', 3),
+      ('7000000-9999999', 4)]),
+    ('978-2', 'French language', [('0000000-9999999', 2)]),
+]
+NEW = [
+    ('978-0', 'English language',
+     [('0000000-1999999', 2), ('2000000-6999999', 4),
+      ('7000000-9999999', 4)]),
+    ('978-1', 'English language', [('0000000-9999999', 2)]),
+    ('978-2', 'French', [('0000000-9999999', 2)]),
+]
+
+def test_ranges_from_xml_matches_installed():
+    data = RangesFromXml(XML).data()
+    assert data.to_bytes() == RANGE_FILE.read_bytes()
+    assert data.agencies() == map_ranges().agencies()
+
+def test_ranges_from_xml_not_message():
+    with pytest.raises(ValueError, match='not an ISBNRangeMessage'):
+        RangesFromXml(io.BytesIO(b'<Other><Group/></Other>'))
+
+def test_ranges_diff():
+    old = RangesFromXml(message(*OLD)).data()
+    new = RangesFromXml(message(*NEW)).data()
+    diff = RangesDiff(old, new)
+    assert diff
+    assert diff.added == [(9781000000000, 1261)]
+    assert diff.removed == []
+    assert diff.resplit == [(9780200000000, 1351, 1441)]
+    assert diff.agencies == {
+        ('978', '1'): (None, 'English language'),
+        ('978', '2'): ('French language', 'French'),
+    }
+    assert list(diff.lines()) == [
+        '+ 978-1-00-000000-0',
+        '~ 978-0-200-00000-0 → 978-0-2000-0000-0',
+        "agency 978-1: None → 'English language'",
+        "agency 978-2: 'French language' → 'French'",
+    ]
+    assert diff.affects('9780201896831')
+    assert diff.affects('9781000000001')
+    assert not diff.affects('9780123456786')
+    assert not diff.affects('9782123456803')
+    assert not RangesDiff(old, old)
+    assert not RangesDiff(old, old).affects('9780201896831')
+
+def test_affected_files(tmp_path):
+    old = RangesFromXml(message(*OLD)).data()
+    new = RangesFromXml(message(*NEW)).data()
+    files = [
+        'A [isbn=9780201896831].pdf',
+        'B [isbn=9780123456786].pdf',
+        'C [isbn=0123456789; isbn=1000000001].pdf',
+        'D.pdf',
+    ]
+    assert list(affected_files(RangesDiff(old, new), files,
+                               enc.v3)) == [files[0], files[2]]
+
+def test_main(tmp_path, capsys):
+    old = tmp_path / 'old.bin'
+    old.write_bytes(RangesFromXml(message(*OLD)).data().to_bytes())
+    xml = tmp_path / 'new.xml'
+    xml.write_bytes(message(*NEW).getvalue())
+    (tmp_path / 'books').mkdir()
+    book = tmp_path / 'books' / 'A [isbn=9780201896831].pdf'
+    book.touch()
+    (tmp_path / 'books' / 'B [isbn=9780123456786].pdf').touch()
+    out = tmp_path / 'new.bin'
+    assert make_isbn_ranges.main([
+        'make_isbn_ranges', '-i', str(xml), '-o', str(out), '--against',
+        str(old), '-d', '-r', str(tmp_path / 'books')
+    ]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == '+ 978-1-00-000000-0'
+    assert lines[-1] == str(book)
+    assert map_ranges(out).start[-1] == 9782000000000
@@ -2,6 +2,10 @@
 """Test fna command."""
 
 import logging
+import os
+import subprocess
+import sys
+
 from pathlib import Path
 
 import pytest
@@ -351,3 +355,153 @@ def test_fna_reraise(capsys, caplog):
     with pytest.raises(RuntimeError):
         _ = fna(['--log-level=debug', '--execute', 'raise RuntimeError'],
                 capsys)
+
+def test_fna_batch_argv(capsys, caplog):
+    r, out = fna([
+        '--batch',
+        '--decoder=sfc',
+        'order',
+        'a,isbn,edition',
+        'v3',
+        '--',
+        D1SFC,
+        'x.pdf',
+    ], capsys)
+    assert r == 0
+    assert out == f'{D1V3}\nx.pdf\n'
+    assert caplog.text == ''
+
+def test_fna_batch_stdin_null(capsys, caplog, monkeypatch):
+    monkeypatch.setattr('sys.stdin', pytestutil.stringio(f'{D1V3}\0a\nb.pdf\0'))
+    r, out = fna(['--batch', '--null', 'quiet', 'extract', 'isbn', 'encode'],
+                 capsys)
+    assert r == 0
+    assert out == '[isbn=9780123456786]\n\n'
+    assert caplog.text == ''
+
+def test_fna_batch_files_from(capsys, caplog, monkeypatch):
+    infile = pytestutil.stringio('one.pdf\ntwo.pdf\n')
+    monkeypatch.setattr(Path, 'open', pytestutil.fake_fixed(infile))
+    r, out = fna(['-b', '-F', 'list', 'suffix', 'txt'], capsys)
+    assert r == 0
+    assert out == 'one.txt\ntwo.txt\n'
+    assert caplog.text == ''
+
+def test_fna_batch_continues_after_error(capsys, caplog):
+    r, out = fna(
+        ['--batch', 'strict', 'add', 'isbn', '1', '--', 'a.pdf', 'b.pdf'],
+        capsys)
+    assert r == 1
+    assert out == ''
+    assert 'a.pdf: isbn 1' in caplog.text
+    assert 'b.pdf: isbn 1' in caplog.text
+
+def test_fna_batch_program_error(capsys, caplog):
+    r, out = fna(['--batch', 'add', 'isbn', '--', 'a.pdf', 'b.pdf'], capsys)
+    assert r == 1
+    assert out == ''
+    assert 'add: expected value' in caplog.text
+    assert 'a.pdf' not in caplog.text
+
+def test_fna_recursive(capsys, caplog, tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'skip').mkdir()
+    for name in ('b.pdf', 'a.txt', 'sub/c.pdf', 'skip/d.pdf'):
+        (tmp_path / name).touch()
+    r, out = fna([
+        '--recursive',
+        str(tmp_path),
+        '--include=*.pdf',
+        '--exclude=skip',
+        'filename',
+    ], capsys)
+    assert r == 0
+    assert out == f'{tmp_path}/b.pdf\n{tmp_path}/sub/c.pdf\n'
+    assert caplog.text == ''
+
+def test_fna_batch_jobs(capsys, caplog):
+    files = [f'{i:03}.pdf' for i in range(200)]
+    r, out = fna(['-b', '-j', '2', 'suffix', 'txt', '--', *files], capsys)
+    assert r == 0
+    assert out == ''.join(f'{i:03}.txt\n' for i in range(200))
+    assert caplog.text == ''
+
+# Start-up budget for `import fnattr.fna`, in microseconds of cumulative
+# `python -X importtime` time. This is deliberately generous; it exists to
+# catch a heavy module (e.g. generated data tables) becoming an eager import.
+IMPORT_BUDGET_US = 300_000
+
+# Modules that starting fna must not load. This catches a heavy module
+# (e.g. generated data tables, numpy, the server) becoming an eager import.
+IMPORT_DEFERRED = (
+    'asyncio',
+    'csv',
+    'json',
+    'mmap',
+    'numpy',
+    'fnattr.fna.client',
+    'fnattr.fna.server',
+    'fnattr.vlju.types.doi',
+    'fnattr.vlju.types.doi.org',
+    'fnattr.vlju.types.lccn',
+    'fnattr.vlju.types.timestamp',
+)
+
+def loaded_modules(argv: list[str] | None) -> set[str]:
+    """
+    Return the modules loaded by a fresh interpreter running fna `argv`.
+
+    With `argv` None, the interpreter only imports fnattr.fna.
+    """
+    statement = 'import sys, fnattr.fna\n'
+    if argv is not None:
+        argv = ['fna', '--no-default-config', *argv]
+        statement += f'fnattr.fna.main({argv!r})\n'
+    statement += 'print(*sys.modules, sep="\\n", file=sys.stderr)\n'
+    src = Path(fnattr.fna.__file__).parents[2]
+    p = subprocess.run([sys.executable, '-c', statement],
+                       capture_output=True,
+                       text=True,
+                       check=True,
+                       env=os.environ | {'PYTHONPATH': str(src)})
+    return set(p.stderr.splitlines())
+
+@pytest.mark.parametrize(('argv', 'deferred'), [
+    (None, (*IMPORT_DEFERRED, 'fnattr.vljum.m', 'fnattr.vljum.runner')),
+    (['help'], IMPORT_DEFERRED),
+    (['decode', 'T [isbn=9780804429573; a=B]', 'encode'], IMPORT_DEFERRED),
+])
+def test_fna_import_deferred(argv, deferred):
+    loaded = loaded_modules(argv)
+    assert 'fnattr.fna' in loaded
+    if argv is not None:
+        assert 'fnattr.vljum.runner' in loaded
+    eager = sorted(loaded.intersection(deferred))
+    assert not eager, f'eagerly imported: {eager}'
+
+def importtime(statement: str) -> dict[str, tuple[int, int]]:
+    """Return {module: (self µs, cumulative µs)} for a fresh interpreter."""
+    src = Path(fnattr.fna.__file__).parents[2]
+    p = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ | {'PYTHONPATH': str(src)})
+    r = {}
+    for line in p.stderr.splitlines():
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            r[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return r
+
+def worst_imports(t: dict[str, tuple[int, int]], n: int = 10) -> str:
+    worst = sorted(t.items(), key=lambda kv: kv[1][0], reverse=True)[: n]
+    return '\n'.join(f'{s:8} {c:8} {k}' for k, (s, c) in worst)
+
+def test_fna_import_budget():
+    t = importtime('import fnattr.fna')
+    _, cumulative = t['fnattr.fna']
+    assert cumulative < IMPORT_BUDGET_US, (
+        f'import fnattr.fna took {cumulative} µs; worst offenders '
+        f'(self µs, cumulative µs):\n{worst_imports(t)}')
@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: MIT
+"""Test fna server and client."""
+
+import asyncio
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import fnattr.fna
+
+from fnattr.fna import client, server
+from fnattr.util.error import Error
+
+MK_V3 = '[x=2; x=1; z=Z; z=Y; y=Why]'
+
+def serve_requests(path: Path,
+                   *argvs: list[str],
+                   cwd: Path | None = None) -> list[dict]:
+
+    async def go() -> list[dict]:
+        with ProcessPoolExecutor(2) as executor:
+            s = await server.start(path, executor)
+            async with s:
+                return await asyncio.gather(
+                    *(client.request(path, argv, cwd) for argv in argvs))
+
+    return asyncio.run(go())
+
+def test_server_execute():
+    r = server.execute(['decode', MK_V3, 'extract', 'y'])
+    assert r == {'stdout': '[y=Why]\n', 'stderr': '', 'status': 0}
+
+def test_server_execute_error():
+    r = server.execute(['add'])
+    assert r['status'] == 1
+    assert r['stdout'] == ''
+    assert 'add: expected key' in r['stderr']
+
+def test_server_respond_bad_request():
+    r = server.respond(b'{"argv": 1}\n')
+    assert r['status'] == 2
+    assert 'bad request' in r['stderr']
+    r = server.respond(b'not json\n')
+    assert r['status'] == 2
+
+def test_server_concurrent_clients(tmp_path):
+    argvs = [['add', 'x', str(i)] for i in range(8)]
+    r = serve_requests(tmp_path / 'fna.sock', *argvs)
+    assert [i['stdout'] for i in r] == [f'[x={i}]\n' for i in range(8)]
+    assert all(i['status'] == 0 for i in r)
+
+def test_server_connection_reuse(tmp_path):
+    path = tmp_path / 'fna.sock'
+
+    async def go() -> list[dict]:
+        with ProcessPoolExecutor(1) as executor:
+            s = await server.start(path, executor)
+            async with s:
+                reader, writer = await asyncio.open_unix_connection(path)
+                r = []
+                for argv in (['add', 'a', '1'], ['encoder', 'lalala']):
+                    writer.write(client.encode_message({'argv': argv}))
+                    await writer.drain()
+                    r.append(client.decode_message(await reader.readline()))
+                writer.close()
+                await writer.wait_closed()
+                return r
+
+    r = asyncio.run(go())
+    assert r[0]['stdout'] == '[a=1]\n'
+    assert r[1]['status'] == 1
+
+def test_server_relative_rename(tmp_path):
+    work = tmp_path / 'work'
+    work.mkdir()
+    (work / 'old.pdf').write_text('')
+    assert Path.cwd() != work
+    r = serve_requests(tmp_path / 'fna.sock',
+                       ['file', 'old.pdf', 'add', 'x', '1', 'rename'],
+                       cwd=work)
+    assert r[0]['status'] == 0, r[0]['stderr']
+    assert sorted(p.name for p in work.iterdir()) == ['old [x=1].pdf']
+
+def test_server_respond_bad_cwd():
+    r = server.respond(b'{"argv": [], "cwd": "relative"}\n')
+    assert r['status'] == 2
+    assert 'bad request' in r['stderr']
+
+RESPOND = server.respond
+
+def sleep_then_respond(line: bytes) -> dict:
+    if b'slow' in line:
+        time.sleep(1)
+    return RESPOND(line)
+
+def test_server_slow_request_does_not_block(tmp_path, monkeypatch):
+    path = tmp_path / 'fna.sock'
+    monkeypatch.setattr(server, 'respond', sleep_then_respond)
+
+    async def go() -> list[float]:
+        with ProcessPoolExecutor(2) as executor:
+            s = await server.start(path, executor)
+            async with s:
+                t = time.monotonic()
+                done: list[float] = []
+
+                async def one(argv: list[str]) -> None:
+                    await client.request(path, argv)
+                    done.append(time.monotonic() - t)
+
+                await asyncio.gather(one(['decode', 'slow']),
+                                     one(['add', 'x', '1']))
+                return done
+
+    done = asyncio.run(go())
+    assert done[0] < 0.5 <= done[1]
+
+def test_server_socket_directory_private(tmp_path):
+    d = tmp_path / 'sock'
+    d.mkdir(mode=0o755)
+    os.chmod(d, 0o755)
+    with pytest.raises(Error, match='mode'):
+        server.private_directory(d)
+    os.chmod(d, 0o700)
+    server.private_directory(d)
+    (tmp_path / 'link').symlink_to(d)
+    with pytest.raises(Error, match='not a directory'):
+        server.private_directory(tmp_path / 'link')
+
+def test_client_default_socket_path(monkeypatch):
+    monkeypatch.setenv('XDG_RUNTIME_DIR', '/run/user/1')
+    assert client.default_socket_path() == Path('/run/user/1/fnattr/fna.sock')
+    monkeypatch.delenv('XDG_RUNTIME_DIR')
+    assert client.default_socket_path().name == 'fna.sock'
+
+def test_fna_client_no_server(tmp_path, capsys, caplog):
+    r = fnattr.fna.main(
+        ['fna', '--client', f'--socket={tmp_path / "none"}', 'add', 'x', '1'])
+    assert r == 1
+    assert capsys.readouterr().out == ''
+    assert 'server:' in caplog.text
+
+@pytest.mark.parametrize(('argv', 'jobs'), [
+    ([], None),
+    (['--jobs=3'], 3),
+])
+def test_fna_serve_jobs(tmp_path, monkeypatch, argv, jobs):
+    calls = []
+
+    async def fake_serve(path, jobs=None):
+        calls.append((path, jobs))
+
+    monkeypatch.setattr(server, 'serve', fake_serve)
+    path = tmp_path / 'fna.sock'
+    assert fnattr.fna.main(['fna', '--serve', f'--socket={path}', *argv]) == 0
+    assert calls == [(str(path), jobs)]
+
+def test_fna_client(tmp_path, capsys, monkeypatch):
+    path = tmp_path / 'fna.sock'
+    monkeypatch.setattr(client, 'run',
+                        lambda p, argv, cwd=None: serve_requests(p, argv)[0])
+    r = fnattr.fna.main(['fna', '--client', f'--socket={path}', 'add', 'q'])
+    out, err = capsys.readouterr()
+    assert r == 1
+    assert out == ''
+    assert 'add: expected value' in err
@@ -31,3 +31,40 @@ def test_alt13(s):
 ])
 def test_mod11(s, x):
     assert checksum.mod11(s) == x
+
+def test_mod11_zero():
+    assert checksum.mod11_checksum('000000000') == 0
+    assert checksum.mod11('000000000') == '0'
+    assert checksum.mod11('020189683') == '4'
+
+@pytest.fixture(name='engine', params=['numpy', 'python'])
+def fixture_engine(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(checksum, 'numpy', lambda: None)
+    return request.param
+
+DIGIT_STRINGS = [f'{i * 7919 % 10**12:012}' for i in range(200)]
+
+def test_checksum_many(engine):
+    assert checksum.alt13_checksum_many(DIGIT_STRINGS) == [
+        checksum.alt13_checksum(s) for s in DIGIT_STRINGS
+    ]
+    assert checksum.alt13_many(DIGIT_STRINGS) == [
+        checksum.alt13(s) for s in DIGIT_STRINGS
+    ]
+    nine = [s[3 :] for s in DIGIT_STRINGS]
+    assert checksum.mod11_checksum_many(nine) == [
+        checksum.mod11_checksum(s) for s in nine
+    ]
+    assert checksum.mod11_many(nine) == [checksum.mod11(s) for s in nine]
+    assert checksum.alt13_many([]) == []
+
+def test_checksum_many_irregular(engine):
+    # Unequal lengths and non-ASCII digits give the scalar results.
+    strings = ['123', '45', '٣٤']
+    assert checksum.alt13_many(strings) == [checksum.alt13(s) for s in strings]
+    assert checksum.mod11_many(strings) == [checksum.mod11(s) for s in strings]
+    with pytest.raises(ValueError, match='invalid literal'):
+        checksum.alt13_many(['12', 'ab'])
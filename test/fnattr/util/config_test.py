@@ -133,3 +133,71 @@ def test_read_configs_no_toml(monkeypatch):
     monkeypatch.setattr(Path, 'open', lambda *_: f)
     d = config.read_configs(['vlju.toml'])
     assert d == {}
+
+def test_xdg_cache_dir(monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', '/cache/home')
+    assert config.xdg_cache_dir() == Path('/cache/home')
+    monkeypatch.delenv('XDG_CACHE_HOME')
+    monkeypatch.setattr(Path, 'home', lambda: Path('/home/homu'))
+    assert config.xdg_cache_dir() == Path('/home/homu/.cache')
+
+def test_read_configs_cached(tmp_path, caplog):
+    caplog.set_level('DEBUG')
+    a = tmp_path / 'a.toml'
+    b = tmp_path / 'b.toml'
+    a.write_text('[option]\nx = 1\ny = 1\n')
+    b.write_text('[option]\ny = 2\n')
+    cache = tmp_path / 'cache' / 'test.pickle'
+    expect = {'option': {'x': 1, 'y': 2}}
+
+    assert config.read_configs_cached([a, b], cache) == expect
+    assert 'config cache miss' in caplog.text
+    assert cache.exists()
+    caplog.clear()
+
+    assert config.read_configs_cached([a, b], cache) == expect
+    assert 'config cache hit' in caplog.text
+    assert 'using config' not in caplog.text
+    caplog.clear()
+
+    # Different file list.
+    assert config.read_configs_cached([b, a], cache) == {
+        'option': {'x': 1, 'y': 1},
+    }
+    assert 'config cache miss' in caplog.text
+
+def test_read_configs_cached_invalidated_by_change(tmp_path, caplog):
+    caplog.set_level('DEBUG')
+    a = tmp_path / 'a.toml'
+    a.write_text('[option]\nx = 1\n')
+    cache = tmp_path / 'test.pickle'
+    config.read_configs_cached([a], cache)
+    a.write_text('[option]\nx = 22\n')
+    caplog.clear()
+    assert config.read_configs_cached([a], cache) == {'option': {'x': 22}}
+    assert 'config cache miss' in caplog.text
+
+def test_read_configs_cached_not_stored_on_error(tmp_path):
+    a = tmp_path / 'a.toml'
+    a.write_text('wtf!')
+    cache = tmp_path / 'test.pickle'
+    assert config.read_configs_cached([a], cache) == {}
+    assert not cache.exists()
+
+def test_read_configs_cached_corrupt(tmp_path):
+    a = tmp_path / 'a.toml'
+    a.write_text('[option]\nx = 1\n')
+    cache = tmp_path / 'test.pickle'
+    cache.write_bytes(b'garbage')
+    assert config.read_configs_cached([a], cache) == {'option': {'x': 1}}
+
+def test_rccamo_config_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    a = tmp_path / 'a.toml'
+    a.write_text('[option]\na = 1\n')
+    args = argparse.Namespace(
+        a=None, default_config=False, config_cache=True)
+    _, options = config.read_cmd_configs_and_merge_options(
+        'test', [a], args, a=10)
+    assert options == {'a': 1}
+    assert (tmp_path / 'fnattr' / 'test.config.pickle').exists()
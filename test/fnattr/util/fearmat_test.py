@@ -4,7 +4,7 @@
 import pytest
 
 from fnattr.util.error import Error
-from fnattr.util.fearmat import fearmat
+from fnattr.util.fearmat import code, compiled, fearmat
 
 def test_fearmat():
     template = '{a}a{b}{b}e{b}'
@@ -23,3 +23,25 @@ def test_fearmat_builtins():
     s = fearmat('{open(x)}', {'x': '/etc/passwd'},
                 {'open': lambda s: s.upper()})
     assert s == '/ETC/PASSWD'
+
+def test_fearmat_compiled():
+    f = compiled('{a}a{b}{b}e{b}')
+    assert f({'a': 'p', 'b': 's'}) == 'passes'
+    assert f({'a': 'w', 'b': 'd'}) == 'wadded'
+
+def test_fearmat_compiled_disallowed():
+    f = compiled('{open(x)}')
+    with pytest.raises(NameError):
+        _ = f({'x': '/etc/passwd'})
+    with pytest.raises(Error):
+        _ = compiled('{a}a"""{b}"""a{a}')
+
+def test_fearmat_compiled_builtins():
+    f = compiled('{open(x)}', {'open': lambda s: s.upper()})
+    assert f({'x': '/etc/passwd'}) == '/ETC/PASSWD'
+
+def test_fearmat_cached():
+    template = '{a}-{b}'
+    assert code(template) is code(template)
+    assert fearmat(template, {'a': 1, 'b': 2}) == '1-2'
+    assert code(template) is code(template)
@@ -4,7 +4,7 @@
 import io
 import sys
 
-from fnattr.util.io import open_input, open_output, opener
+from fnattr.util.io import open_input, open_output, opener, read_records
 
 def test_opener_none_is_default():
     f = opener(None, 'w', sys.stdout)
@@ -70,3 +70,15 @@ def test_open_input_filename_is_openend(mocker):
         fp = f
     o.assert_called_once_with('r', encoding='utf-8')
     fp.close.assert_called_once()   # pylint: disable=no-member
+
+def test_read_records_newline():
+    s = io.StringIO('one\ntwo\n\nthree')
+    assert list(read_records(s)) == ['one', 'two', 'three']
+
+def test_read_records_nul():
+    s = io.StringIO('a b\nc\0d\0')
+    assert list(read_records(s, '\0')) == ['a b\nc', 'd']
+
+def test_read_records_straddle_chunks():
+    s = io.StringIO('alpha\nbeta\ngamma\n')
+    assert list(read_records(s, size=3)) == ['alpha', 'beta', 'gamma']
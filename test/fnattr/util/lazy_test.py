@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: MIT
+"""Test lazy."""
+
+import fractions
+
+from fnattr.util.lazy import Import, ImportMap
+
+def test_import_load():
+    assert Import('fractions', 'Fraction').load() is fractions.Fraction
+
+def test_import_map_loads_on_access():
+    m = ImportMap({'f': Import('fractions', 'Fraction'), 'i': int})
+    assert 'f' in m
+    assert list(m) == ['f', 'i']
+    assert len(m) == 2
+    assert not m.is_loaded('f')
+    assert m.is_loaded('i')
+    assert m['f'] is fractions.Fraction
+    assert m.is_loaded('f')
+    assert m.get('i') is int
+    assert m.get('x', str) is str
+
+def test_import_map_copy_is_independent_and_lazy():
+    m = ImportMap({'f': Import('fractions', 'Fraction')})
+    n = m.copy()
+    assert not n.is_loaded('f')
+    n['g'] = int
+    del n['f']
+    assert 'g' not in m
+    assert 'f' in m
+    assert dict(m) == {'f': fractions.Fraction}
@@ -181,3 +181,90 @@ def test_multimap_submap():
     assert list(h.keys()) == ['issn', 'ismn']
     assert h['issn'] == d['issn']
     assert h['ismn'] == d['ismn']
+
+def test_multimap_has():
+    d = mk(CASES_KEY_LIST)
+    assert d.has('isbn', '0-201-89683-4')
+    assert not d.has('isbn', '1351-5381')
+    assert not d.has('none', '1351-5381')
+    assert 'none' not in d.keys()
+
+def test_multimap_index():
+    d: MultiMap[str, int] = MultiMap()
+    n = 3 * d.index_threshold
+    for i in range(n):
+        d.add('k', i)
+        d.add('k', i)
+    assert d['k'] == list(range(n))
+    assert d.has('k', n - 1)
+    d.remove('k', n - 1)
+    assert not d.has('k', n - 1)
+    assert d.pop('k') == n - 2
+    assert not d.has('k', n - 2)
+    d.add('k', n - 1)
+    assert d['k'] == [*range(n - 2), n - 1]
+    del d['k']
+    assert not d.has('k', 0)
+    d.add('k', 0)
+    assert d['k'] == [0]
+
+def test_multimap_index_unhashable():
+    d: MultiMap[str, list[int]] = MultiMap()
+    n = 2 * d.index_threshold
+    for i in range(n):
+        d.add('k', [i])
+        d.add('k', [i])
+    assert d['k'] == [[i] for i in range(n)]
+    assert d.has('k', [0])
+
+def test_multimap_copy_independent():
+    d: MultiMap[str, int] = MultiMap()
+    for i in range(2 * d.index_threshold):
+        d.add('k', i)
+    e = d.copy()
+    f = d.submap(['k'])
+    e.add('k', -1)
+    f.remove('k', 0)
+    assert not d.has('k', -1)
+    assert d.has('k', 0)
+    assert e.has('k', 0)
+    assert d['k'] == list(range(2 * d.index_threshold))
+
+def test_multimap_copy_on_write():
+    d = mk(CASES_KEY_LIST)
+    e = d.copy()
+    assert e.data['isbn'] is d.data['isbn']
+    e.add('isbn', '0-262-51087-1')
+    assert e.data['isbn'] is not d.data['isbn']
+    assert d['isbn'] == CASES_KEY_LIST['isbn']
+    assert e.data['issn'] is d.data['issn']
+
+    # Lists from [] and get() are private and may be modified in place.
+    e['issn'].append('0000-0000')
+    e.get('ismn').clear()
+    d['ean13'].pop()
+    assert d['issn'] == CASES_KEY_LIST['issn']
+    assert d['ismn'] == CASES_KEY_LIST['ismn']
+    assert e['ean13'] == CASES_KEY_LIST['ean13']
+
+    # Both sides see their own changes on a copy of a copy.
+    f = e.copy()
+    f.sortvalues()
+    f.pop('ean13')
+    assert e['isbn'] == [*CASES_KEY_LIST['isbn'], '0-262-51087-1']
+    assert e['ean13'] == CASES_KEY_LIST['ean13']
+
+def test_multimap_submap_copy_on_write():
+    d: MultiMap[str, int] = MultiMap()
+    for i in range(2 * d.index_threshold):
+        d.add('k', i).add('j', i)
+    e = d.submap(['k'])
+    assert e.data['k'] is d.data['k']
+    e.remove('k', 0)
+    e.add('k', -1)
+    assert d['k'] == list(range(2 * d.index_threshold))
+    assert d.has('k', 0)
+    assert not d.has('k', -1)
+    assert not e.has('k', 0)
+    del d['k']
+    assert e.has('k', 1)
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: MIT
+"""Test parallel."""
+
+import os
+
+from fnattr.util.parallel import ordered_map
+
+STATE = {'offset': 0}
+
+def set_offset(n: int) -> None:
+    STATE['offset'] = n
+
+def square(n: int) -> int:
+    return n * n + STATE['offset']
+
+def pid(_: int) -> int:
+    return os.getpid()
+
+def test_ordered_map_serial():
+    assert list(ordered_map(square, range(5))) == [0, 1, 4, 9, 16]
+
+def test_ordered_map_serial_initializer():
+    r = list(ordered_map(square, range(3), initializer=set_offset,
+                         initargs=(1, )))
+    set_offset(0)
+    assert r == [1, 2, 5]
+
+def test_ordered_map_parallel_order():
+    r = list(ordered_map(square, range(1000), jobs=3, chunksize=7))
+    assert r == [n * n for n in range(1000)]
+
+def test_ordered_map_parallel_initializer():
+    r = list(ordered_map(square, range(10), jobs=2, chunksize=3,
+                         initializer=set_offset, initargs=(100, )))
+    assert r == [n * n + 100 for n in range(10)]
+    assert STATE['offset'] == 0
+
+def test_ordered_map_parallel_workers():
+    r = set(ordered_map(pid, range(100), jobs=2, chunksize=1))
+    assert os.getpid() not in r
+
+def test_ordered_map_parallel_empty():
+    assert list(ordered_map(square, [], jobs=2)) == []
@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: MIT
+"""Test scan."""
+
+import os
+
+from pathlib import Path
+
+import pytest
+
+from fnattr.util.scan import scan
+
+@pytest.fixture(name='tree')
+def fixture_tree(tmp_path):
+    for f in ('b.pdf', 'a.pdf', 'c.txt', 'd/x.pdf', 'd/e/y.pdf', 'f/z.pdf'):
+        p = tmp_path / f
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(f)
+    return tmp_path
+
+def names(root: Path, **kwargs) -> list[str]:
+    return [str(Path(e.path).relative_to(root)) for e in scan(root, **kwargs)]
+
+def test_scan_order(tree):
+    assert names(tree) == [
+        'a.pdf', 'b.pdf', 'c.txt', 'd/x.pdf', 'd/e/y.pdf', 'f/z.pdf',
+    ]
+
+def test_scan_include(tree):
+    assert names(tree, include=['*.txt', 'y*']) == ['c.txt', 'd/e/y.pdf']
+
+def test_scan_exclude(tree):
+    assert names(tree, exclude=['e', 'f', '*.txt']) == [
+        'a.pdf', 'b.pdf', 'd/x.pdf',
+    ]
+
+def test_scan_symlinks(tree):
+    os.symlink(tree / 'd', tree / 'f' / 'link')
+    os.symlink(tree / 'a.pdf', tree / 'f' / 'alink.pdf')
+    assert names(tree, symlinks='skip') == [
+        'a.pdf', 'b.pdf', 'c.txt', 'd/x.pdf', 'd/e/y.pdf', 'f/z.pdf',
+    ]
+    assert names(tree, symlinks='files') == [
+        'a.pdf', 'b.pdf', 'c.txt', 'd/x.pdf', 'd/e/y.pdf',
+        'f/alink.pdf', 'f/z.pdf',
+    ]
+    assert names(tree / 'f', symlinks='follow') == [
+        'alink.pdf', 'z.pdf', 'link/x.pdf', 'link/e/y.pdf',
+    ]
+
+def test_scan_symlink_cycle(tree):
+    os.symlink(tree, tree / 'd' / 'up')
+    assert names(tree, symlinks='follow') == [
+        'a.pdf', 'b.pdf', 'c.txt', 'd/x.pdf', 'd/e/y.pdf', 'f/z.pdf',
+    ]
+
+def test_scan_follow_error(tree, caplog):
+    # The link is taken for a directory, but is gone when visited.
+    os.symlink(tree / 'd', tree / 'f' / 'link')
+    found = []
+    for e in scan(tree / 'f', symlinks='follow'):
+        found.append(e.name)
+        if e.name == 'z.pdf':
+            os.unlink(tree / 'f' / 'link')
+    assert found == ['z.pdf']
+    assert 'No such file' in caplog.text
+    assert names(tree / 'missing', symlinks='follow') == []
+
+def test_scan_bad_policy(tree):
+    with pytest.raises(ValueError, match='sometimes'):
+        list(scan(tree, symlinks='sometimes'))
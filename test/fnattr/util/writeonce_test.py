@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: MIT
+"""Test WriteOnce."""
+
+import pytest
+
+from fnattr.util.writeonce import WriteOnce, cached, init_attr, instance_slots
+
+class Slotted(WriteOnce):
+    __slots__ = ('a', 'b')
+
+class Defaulted(Slotted):
+    b = 'default'   # Hides the slot, so `b` lives in __dict__.
+
+class Unslotted(WriteOnce):
+    c = 'default'
+
+def test_write_once_slots():
+    s = Slotted()
+    assert not hasattr(s, '__dict__')
+    s.a = 1
+    with pytest.raises(AttributeError, match='Slotted.a is read-only'):
+        s.a = 2
+    with pytest.raises(AttributeError, match='read-only'):
+        del s.a
+    s.b = 3
+    assert (s.a, s.b) == (1, 3)
+
+def test_write_once_default():
+    d = Defaulted()
+    assert d.b == 'default'
+    d.b = 'set'
+    assert d.b == 'set'
+    with pytest.raises(AttributeError, match='read-only'):
+        d.b = 'again'
+    u = Unslotted()
+    u.c = 'set'
+    with pytest.raises(AttributeError, match='read-only'):
+        u.c = 'again'
+
+def test_init_attr():
+    s = Slotted()
+    init_attr(s, 'a', 1)
+    assert s.a == 1
+    with pytest.raises(AttributeError, match='read-only'):
+        s.a = 2
+    u = Unslotted()
+    init_attr(u, 'c', 'set')
+    with pytest.raises(AttributeError, match='read-only'):
+        u.c = 'again'
+
+def test_instance_slots():
+    assert instance_slots(Slotted) == {'a', 'b'}
+    assert instance_slots(Defaulted) == {'a'}
+    assert instance_slots(Unslotted) == set()
+
+class Cached(WriteOnce):
+    __slots__ = ('calls', '_twice')
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    @cached('_twice')
+    def twice(self) -> int:
+        """Return 2."""
+        self.calls.append(1)
+        return 2
+
+def test_cached():
+    c = Cached()
+    assert c.twice() == 2
+    assert c.twice() == 2
+    assert c.calls == [1]
+    assert Cached.twice.__doc__ == 'Return 2.'
+    with pytest.raises(AttributeError, match='read-only'):
+        c._twice = 3    # noqa: SLF001
@@ -88,6 +88,17 @@ def test_doi_copy():
     assert a is not b
     assert a == b
 
+def test_doi_string_cached():
+    a = DOI('10.1234/lorem')
+    assert str(a) is str(a)
+    assert a.lv() is a.lv()
+    assert a.lv() == 'doi:10.1234/lorem'
+    b = copy.copy(a)
+    assert str(b) == '10.1234,lorem'
+    h = DOI('20.1234/lorem')
+    assert h.lv() is h.lv()
+    assert h.lv() == 'info:hdl/20.1234/lorem'
+
 def test_doi_eq():
     a = DOI('10.1234/lorem')
     b = DOI('10.1234/lorem')
@@ -95,6 +106,7 @@ def test_doi_eq():
     assert a is not b
     assert a == b
     assert a != c
+    assert hash(a) == hash(b)
 
 def test_doi_eq_prefix():
     a = DOI('10.1234/lorem')
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: MIT
+"""Test DOI organization data."""
+
+import pytest
+
+from fnattr.vlju.types.doi import DOI, Prefix
+from fnattr.vlju.types.doi.org import (
+    ORG_FILE,
+    OrgData,
+    map_org,
+    org,
+    org_many,
+    organization,
+)
+
+def test_org():
+    assert org(DOI('10.1002/abc')) == 'Wiley (John Wiley & Sons)'
+    assert org(Prefix('10.1001')) == 'American Medical Association'
+    assert org([10, 88888]) == 'Crossref Test'
+    assert org([10, 3]) is None
+    assert org([11, 1001]) is None
+    assert org([10, 1001, 1]) is None
+    assert org([10, -1]) is None
+
+def test_org_partial():
+    registrants = org([10])
+    assert isinstance(registrants, dict)
+    assert len(registrants) == len(organization())
+    assert registrants[1001] == 'American Medical Association'
+    assert org([11]) is None
+    assert org([]) == {10: registrants}
+
+def test_org_dict():
+    d = {10: {1001: 'x'}}
+    assert org([10, 1001], d) == 'x'
+    assert org([10], d) == {1001: 'x'}
+    assert org([10, 1002], d) is None
+    assert org([10, 1001, 1], d) is None
+
+def test_org_many():
+    dois = [DOI('10.1002/abc'), Prefix('10.3'), [10], [10, 1007]]
+    assert org_many(dois) == [
+        'Wiley (John Wiley & Sons)', None, None, 'Springer-Verlag'
+    ]
+    assert org_many([]) == []
+
+def test_org_data_roundtrip(tmp_path):
+    data = OrgData.from_items([((10, 5), 'Ærø'), ((10, 1), 'A'),
+                               ((20, 1), '')])
+    p = tmp_path / 'org.bin'
+    p.write_bytes(data.to_bytes())
+    r = map_org(p)
+    assert list(r.items()) == [((10, 1), 'A'), ((10, 5), 'Ærø'),
+                               ((20, 1), '')]
+    assert r.get([10]) == {1: 'A', 5: 'Ærø'}
+    assert r.get([20, 1]) == ''
+    assert map_org(ORG_FILE).to_bytes() == ORG_FILE.read_bytes()
+
+def test_org_data_errors(tmp_path):
+    with pytest.raises(ValueError, match='unsupported prefix'):
+        OrgData.from_items([((10, 1, 2), 'A')])
+    p = tmp_path / 'org.bin'
+    p.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError, match='not DOI organization data'):
+        map_org(p)
@@ -3,10 +3,31 @@
 
 import pytest
 
-from fnattr.vlju.types.ean import EAN13, is_valid_ean13, key13, to13
-from fnattr.vlju.types.ean.isbn import ISBN
-from fnattr.vlju.types.ean.ismn import ISMN
-from fnattr.vlju.types.ean.issn import ISSN
+from fnattr.util import checksum
+from fnattr.vlju.types.ean import (
+    EAN13,
+    is_valid_ean13,
+    is_valid_ean13_many,
+    key13,
+    to13,
+)
+from fnattr.vlju.types.ean.isbn import (
+    ISBN,
+    is_valid_isbn10,
+    is_valid_isbn10_many,
+    is_valid_isbn13,
+    is_valid_isbn13_many,
+)
+from fnattr.vlju.types.ean.ismn import (
+    ISMN,
+    is_valid_ismn13,
+    is_valid_ismn13_many,
+)
+from fnattr.vlju.types.ean.issn import (
+    ISSN,
+    is_valid_issn8,
+    is_valid_issn8_many,
+)
 from fnattr.vlju.types.uri import URI
 
 # fmt: off
@@ -65,3 +86,32 @@ def test_ean13_to_uri(i, out):
     e = EAN13(i)
     uri = URI(e)
     assert str(uri) == f'urn:ean13:{out}'
+
+MANY_CASES = [
+    '9780804429573', '9780804429574', '978080442957', '97808044295730',
+    '978080442957X', 'abcdefghijklm', '', '٩٧٨٠٨٠٤٤٢٩٥٧٣', '9790692006282',
+    '9771351538009', '080442957X', '0804429578', '13515381', '13515382',
+    '0317847X', '1050124X', '105012XX', '2434561X', '034207-5',
+] + [to13(f'{i * 104729 % 10**9:09}') or '' for i in range(100)]
+
+@pytest.fixture(name='engine', params=['numpy', 'python'])
+def fixture_engine(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(checksum, 'numpy', lambda: None)
+    return request.param
+
+def test_is_valid_many(engine):
+    for many, one in ((is_valid_ean13_many, is_valid_ean13),
+                      (is_valid_isbn10_many, is_valid_isbn10),
+                      (is_valid_isbn13_many, is_valid_isbn13),
+                      (is_valid_issn8_many, is_valid_issn8),
+                      (is_valid_ismn13_many, is_valid_ismn13)):
+        assert many(MANY_CASES) == [one(s) for s in MANY_CASES], many
+        assert many([]) == []
+    assert is_valid_ean13_many(['9780804429573', '9780804429574']) == [
+        True, False
+    ]
+    assert is_valid_isbn10_many(['080442957X', '0804429578']) == [True, False]
+    assert is_valid_issn8_many(['13515381', '13515382']) == [True, False]
@@ -1,9 +1,20 @@
 # SPDX-License-Identifier: MIT
 """Test ISBN."""
 
+import random
+import warnings
+
 import pytest
 
-from fnattr.vlju.types.ean.isbn import ISBN
+from fnattr.vlju.types.ean.isbn import (
+    ISBN,
+    RANGE_FILE,
+    PrefixRanges,
+    RangeData,
+    Ranges,
+    is_valid_isbn10,
+    map_ranges,
+)
 from fnattr.vlju.types.uri import URI
 
 CASES = [
@@ -13,6 +24,8 @@ CASES = [
     ('0127450408', '9780127450407', '0-12-745040-8', '978-0-12-745040-7'),
 ]
 
+RANGES = map_ranges()
+
 NOT_ISBN_CASES = ['4545784063439', 'Not an ISBN']
 
 @pytest.mark.parametrize(('s10', 's13', 'split10', 'split13'), CASES)
@@ -41,6 +54,13 @@ def test_isbn_isbn10(s10):
     i10 = ISBN(s10)
     assert i10.isbn10() == s10
 
+@pytest.mark.parametrize('s10', [c[0] for c in CASES])
+def test_is_valid_isbn10(s10):
+    assert is_valid_isbn10(s10)
+    bad = s10[: 9] + ('0' if s10[9] == 'X' else 'X')
+    assert not is_valid_isbn10(bad)
+    assert not is_valid_isbn10(s10[: 9])
+
 def test_isbn_isbn10_not_isbn10():
     # Not representable as ISBN-10:
     assert ISBN('9791692006289').isbn10() is None
@@ -74,6 +94,77 @@ def test_isbn_split_unknown():
     ISBN.split_all = False
     i = ISBN(CASES[0][0])
     # Cheat for testing; set the value to an unsplittable EAN.
-    i._value = NOT_ISBN_CASES[0]    # noqa: SLF001
+    object.__setattr__(i, '_value', NOT_ISBN_CASES[0])
     with pytest.warns(UserWarning, match='not found'):
         assert i.split13() == NOT_ISBN_CASES[0]
+
+def split_or_warning(r: Ranges, s: str) -> tuple[str, ...] | str:
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        t = r.split(s)
+    return str(w[0].message) if w else t
+
+def test_prefix_ranges_boundaries():
+    reference = Ranges(RANGES.start, RANGES.split)
+    prefix = PrefixRanges(RANGES.start, RANGES.split)
+    prefix.build()
+    points = {0, 10**13 - 1}
+    for start in RANGES.start:
+        points.update((start - 1, start, start + 1))
+    scale = 10**(13 - PrefixRanges.COARSE)
+    for block in range(PrefixRanges.FIRST, PrefixRanges.LAST + 1):
+        points.update((block * scale - 1, block * scale))
+    for x in sorted(points):
+        s = f'{x:013}'
+        assert split_or_warning(prefix, s) == split_or_warning(reference, s)
+
+def test_prefix_ranges_split_many():
+    reference = Ranges(RANGES.start, RANGES.split)
+    prefix = PrefixRanges(RANGES.start, RANGES.split)
+    rng = random.Random(1)
+    isbns = [f'97{rng.randrange(8, 10)}{rng.randrange(10**10):010}'
+             for _ in range(1000)]
+    assert prefix.split_many(isbns) == reference.split_many(isbns)
+    assert prefix.split_many(isbns) == [prefix.split(s) for s in isbns]
+    assert prefix.split_many([]) == []
+    with pytest.raises(RuntimeError, match='non-digit'):
+        prefix.split_many(['978000000000X'])
+
+def test_prefix_ranges_lazy():
+    reference = Ranges(RANGES.start, RANGES.split)
+    prefix = PrefixRanges(RANGES.start, RANGES.split)
+    rng = random.Random(2)
+    isbns = [f'978{rng.randrange(10**10):010}'
+             for _ in range(2 * PrefixRanges.build_after)]
+    assert [prefix.split(s) for s in isbns] == reference.split_many(isbns)
+    assert prefix._built  # noqa: SLF001
+
+def test_map_ranges():
+    assert len(RANGES.start) == len(RANGES.split) > 1000
+    assert list(RANGES.start) == sorted(RANGES.start)
+    agencies = RANGES.agencies()
+    assert agencies[('978', '0')] == 'English language'
+    assert agencies[('979', '10')] == 'France'
+    data = RangeData.from_agencies(RANGES.start, RANGES.split, agencies)
+    assert data.to_bytes() == RANGE_FILE.read_bytes()
+
+def test_map_ranges_roundtrip(tmp_path):
+    data = RangeData.from_agencies([9780000000000, 9780200000000],
+                                   [1261, 1351], {('978', '0'): 'Ærø'})
+    p = tmp_path / 'r.bin'
+    p.write_bytes(data.to_bytes())
+    r = map_ranges(p)
+    assert list(r.start) == [9780000000000, 9780200000000]
+    assert list(r.split) == [1261, 1351]
+    assert r.agencies() == {('978', '0'): 'Ærø'}
+    assert Ranges(r.start, r.split).split('9780201896831') == (
+        '978', '0', '201', '89683', '1')
+
+def test_map_ranges_not_ranges(tmp_path):
+    p = tmp_path / 'r.bin'
+    p.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError, match='not ISBN range data'):
+        map_ranges(p)
+    p.write_bytes(RANGE_FILE.read_bytes()[:-1])
+    with pytest.raises(ValueError, match='not ISBN range data'):
+        map_ranges(p)
@@ -48,7 +48,7 @@ def test_issn_issn8(s8, s13):
 def test_issn_issn8_not_issn():
     # Cheat for testing; set the value to an EAN that is not an ISSN.
     i = ISSN(CASES[0][0])
-    i._value = NOT_ISSN_CASES[0]  # noqa: SLF001
+    object.__setattr__(i, '_value', NOT_ISSN_CASES[0])
     assert i.issn8() is None
 
 @pytest.mark.parametrize(('s8', 'split13'), ((c[0], c[3]) for c in CASES))
@@ -65,7 +65,7 @@ def test_issn_split8(s13, split8):
 def test_issn_split8_not_issn():
     # Cheat for testing; set the value to an EAN that is not an ISSN.
     i = ISSN(CASES[0][0])
-    i._value = NOT_ISSN_CASES[0]  # noqa: SLF001
+    object.__setattr__(i, '_value', NOT_ISSN_CASES[0])
     assert i.split8() is None
 
 @pytest.mark.parametrize(('s8', 'split8'), ((c[0], c[2]) for c in CASES))
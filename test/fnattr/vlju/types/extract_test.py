@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: MIT
+"""Test identifier extraction."""
+
+import io
+
+import pytest
+
+from fnattr.vlju.types.doi import DOI
+from fnattr.vlju.types.ean.isbn import ISBN
+from fnattr.vlju.types.ean.ismn import ISMN
+from fnattr.vlju.types.ean.issn import ISSN
+from fnattr.vlju.types.extract import (
+    MAX_MATCH,
+    PATTERN,
+    scan,
+    scan_chunks,
+    scan_file,
+)
+from fnattr.vlju.types.lccn import LCCN
+
+TEXT = """
+See ISBN 0-201-89683-4 and 978-0-8044-2957-3 (hardcover); not 9780804429574.
+ISSN: 1351-5381; eISSN 2434-561X; ISSN 1351-5382. LCCN 2001-12345,
+LCCN n78-89035. DOI 10.1016/0003-6870(84)90060-7.
+(see https://doi.org/10.1234/abc.def). Score: ISBN 979-0-692-00628-2.
+Phone 555-1234-567. Not ISBN 0201896835. x9780804429573 978-0-8044-2957-3-1.
+"""
+
+EXPECT = [
+    ('isbn', ISBN('9780201896831'), '0-201-89683-4'),
+    ('isbn', ISBN('9780804429573'), '978-0-8044-2957-3'),
+    ('issn', ISSN('13515381'), '1351-5381'),
+    ('issn', ISSN('2434561X'), '2434-561X'),
+    ('lccn', LCCN('2001-12345'), '2001-12345'),
+    ('lccn', LCCN('n78-89035'), 'n78-89035'),
+    ('doi', DOI('10.1016/0003-6870(84)90060-7'),
+     '10.1016/0003-6870(84)90060-7'),
+    ('doi', DOI('10.1234/abc.def'), '10.1234/abc.def'),
+    ('ismn', ISMN('9790692006282'), '979-0-692-00628-2'),
+]
+
+def test_scan():
+    found = list(scan(TEXT))
+    assert [(f.key, f.vlju, TEXT[f.start : f.end]) for f in found] == EXPECT
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 50, MAX_MATCH, 10_000])
+def test_scan_chunks(size):
+    text = TEXT * 3 + ' ' * (2 * MAX_MATCH) + TEXT
+    chunks = (text[i : i + size] for i in range(0, len(text), size))
+    assert list(scan_chunks(chunks)) == list(scan(text))
+
+@pytest.mark.parametrize('text', [
+    'ISBN-13:   978-0-8044-2957-3',
+    'eISSN:   1351-5381',
+    'LCCN:   abc 1234-123456',
+    '10.123456789' + '.123456789' * 4 + '/' + 'x' * 300,
+    '10.1111' + '.1' * 200 + '/abc ',
+])
+def test_max_match(text):
+    for m in PATTERN.finditer(text):
+        assert len(m.group()) <= MAX_MATCH
+    chunks = (text[i : i + 7] for i in range(0, len(text), 7))
+    assert list(scan_chunks(chunks)) == list(scan(text))
+
+def test_scan_file():
+    assert list(scan_file(io.StringIO(TEXT), 5)) == list(scan(TEXT))
+    assert list(scan_chunks([])) == []
@@ -38,6 +38,7 @@ def test_file_eq():
     p = File('/etc/passwd')
     q = File('/etc/passwd')
     assert q == p
+    assert hash(q) == hash(p)
     assert str(p) == str(q)
     assert p.path() == q.path()
 
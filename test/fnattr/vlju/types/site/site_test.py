@@ -1,7 +1,18 @@
 # SPDX-License-Identifier: MIT
 """Test SiteBase and site_class()."""
 
-from fnattr.vlju.types.site import SiteBase, site_class
+import pytest
+
+from fnattr.vlju.types.site import (
+    SiteBase,
+    SiteMatcher,
+    combine_url_patterns,
+    match_url,
+    site_class,
+    site_url_patterns,
+    url_host,
+    url_host_suffix,
+)
 from fnattr.vlju.types.uri import Authority
 
 class SiteA(SiteBase):
@@ -52,3 +63,175 @@ def test_site_class():
         normalize="{x.replace('_', ',')}")
     e0 = SiteE('foo_bar_baz')
     assert e0.lv() == 'https://example.com/foo?bar#baz'
+
+def test_site_class_templates_compiled():
+    SiteG = site_class(  # noqa: non-lowercase-variable-in-function
+        'SiteG',
+        host='example.com',
+        path='item/{x}',
+        query='q={x.upper()}')
+    assert SiteG._path_format is not None           # noqa: SLF001
+    assert SiteG._fragment_format is None           # noqa: SLF001
+    assert SiteG('abc').lv() == 'https://example.com/item/abc?q=ABC'
+
+    class SiteH(SiteG):
+        path_template = 'other/{x}'
+        query_template = None
+
+    assert SiteH('abc').lv() == 'https://example.com/other/abc'
+    assert SiteG('abc').lv() == 'https://example.com/item/abc?q=ABC'
+
+    class SiteJ(SiteG):
+        path_template = ''
+        query_template = ''
+
+    assert SiteJ._path_format is None               # noqa: SLF001
+    assert SiteJ._query_format is None              # noqa: SLF001
+    assert SiteJ('abc').lv() == 'https://example.com/abc'
+
+def test_site_class_template_disallowed():
+    SiteI = site_class(  # noqa: non-lowercase-variable-in-function
+        'SiteI',
+        host='example.com',
+        path='{open(x)}')
+    with pytest.raises(NameError):
+        _ = SiteI('abc').path()
+
+def test_site_class_url_patterns_compiled_on_use():
+    SiteF = site_class(  # noqa: non-lowercase-variable-in-function
+        'SiteF',
+        host='example.com',
+        path='item/{x}',
+        url=[r'https?://example\.com/item/(\d+)'])
+    assert '_url_patterns' not in SiteF.__dict__
+    assert SiteF.match_url('https://example.com/item/123') == '123'
+    assert len(SiteF.__dict__['_url_patterns']) == 1
+
+@pytest.mark.parametrize(('pattern', 'host'), [
+    (r'https?://danbooru\.donmai\.us/posts/(\d+)', 'danbooru.donmai.us'),
+    (r'https?://(?:www\.)?pixiv\.net/en/artworks/(\d+)', 'pixiv.net'),
+    (r'https?://youtu\.be/(\w+)', 'youtu.be'),
+    (r'https?://(www\.)?example\.com', 'example.com'),
+    (r'https?://.*\.pximg\.net/img-[a-z]+/.*/(\d+_p\d+).*', None),
+    (r'https?://youtu.be/(\w+)', None),
+    (r'https?://x?youtube\.com/(\w+)', 'com'),
+    (r'https?://img\d*\.site1cdn\.net/(\w+)', 'site1cdn.net'),
+    (r'https?://[a-z0-9]+\.b\.com/(\w+)', 'b.com'),
+    (r'https?://[^/]+\.b\.com/(\w+)', None),
+    (r'https?://.*pximg\.net/(\w+)', None),
+    (r'https?://(?:x|www\.)?example\.com', None),
+    (r'https?://a\.com(?::\d+)?/(\d+)', None),
+    (r'https?://(a\.org/x|b\.com/y)', None),
+    (r'https?://a\.com/(\d+)|https?://b\.com/(\d+)', None),
+    (r'https?://a\.com/[#](\d+) | https?://b\.com/(\d+)', None),
+    (r'https?://a\.com/(?:x|y)/(\d+)', 'a.com'),
+    (r'https?://a\.com/[|](\d+)', 'a.com'),
+    (r'(?:https?|ftp)://example\.com/(\w+)', None),
+    (r'https?://[a-z]+/(\w+)', None),
+    (r'.*/item/(\d+)', None),
+    (r'https?://a\.com  # host', 'a.com'),
+    ('https?://(?:b\\.)?  # optional\n  a\\.com/(\\d+)', 'a.com'),
+])
+def test_url_host_suffix(pattern, host):
+    assert url_host_suffix(pattern) == host
+
+@pytest.mark.parametrize(('url', 'host'), [
+    ('https://Example.COM/a/b', 'example.com'),
+    ('https://user:pw@example.com:8080/a', 'example.com'),
+    ('http://example.com?q=1', 'example.com'),
+    ('http://[::1]/a', '[::1]'),
+    ('example.com/a', ''),
+])
+def test_url_host(url, host):
+    assert url_host(url) == host
+
+def test_combine_url_patterns():
+    patterns = site_url_patterns([
+        r'https?://example\.com/i/(\d+)',
+        [r'https?://example\.com/([^/]*)/s/(\d+)', r'\1,\g<2>'],
+        [r'https?://example\.com/x(\d)(\d)', r'\2\1'],
+    ])
+    match = combine_url_patterns(patterns)
+    for url in ('https://example.com/i/12', 'http://example.com/u/s/34',
+                'https://example.com/x56', 'https://example.com/x567',
+                'https://example.com/y'):
+        assert match(url) == match_url(patterns, url)
+    assert match('https://example.com/u/s/34') == 'u,34'
+    assert match('https://example.com/x56') == '65'
+
+def test_combine_url_patterns_verbose_comments():
+    patterns = site_url_patterns([
+        r'https://a\.com/p/(\d+)  # post id',
+        [r'https://a\.com/u/(\w+)  # user', r'u\1'],
+    ])
+    match = combine_url_patterns(patterns)
+    assert match('https://a.com/p/12') == '12'
+    assert match('https://a.com/u/me') == 'ume'
+    assert match('https://a.com/x/12') == ''
+    sites = {
+        'a': site_class('A', host='a.com', path='{x}',
+                        url=[r'https://a\.com/p/(\d+)  # post id',
+                             r'https://a\.com/q/(\d+)  # query id']),
+    }
+    k, v = SiteMatcher(sites).match('https://a.com/q/34')
+    assert (k, str(v)) == ('a', '34')
+
+def test_combine_url_patterns_not_combinable():
+    patterns = site_url_patterns([r'https?://(a)\1\.com/(\d+)',
+                                  r'https?://b\.com/(\d+)'])
+    match = combine_url_patterns(patterns)
+    assert match('https://aa.com/1') == 'a'
+    assert match('https://b.com/2') == '2'
+
+def test_site_matcher_alternation():
+    sites = {
+        'alt': site_class('Alt', host='a.com', path='{x}',
+                          url=[[r'https://a\.com/(\d+)|https://b\.com/(\d+)',
+                                r'\1\2']]),
+        'class': site_class('Class', host='c.com', path='{x}',
+                            url=[r'https://c\.com/[#](\d+)  # hash'
+                                 '\n | https://d\\.com/(\\d+)']),
+        'group': site_class('Group', host='e.com', path='{x}',
+                            url=[r'https://(?:e\.com|f\.com)/(\d+)']),
+        'plain': site_class('Plain', host='g.com', path='{x}',
+                            url=[r'https://g\.com/(?:p|q)/(\d+)']),
+    }
+    matcher = SiteMatcher(sites)
+    for url in ('https://a.com/1', 'https://b.com/7', 'https://c.com/#2',
+                'https://d.com/3', 'https://e.com/4', 'https://f.com/5',
+                'https://g.com/q/6', 'https://h.com/8'):
+        expect = next(((k, scls.match_url(url)) for k, scls in sites.items()
+                       if scls.match_url(url)), (None, None))
+        k, v = matcher.match(url)
+        assert (k, v if v is None else str(v)) == expect, url
+    assert matcher.match('https://b.com/7')[0] == 'alt'
+
+def test_site_matcher():
+    sites = {
+        'any': site_class('Any', host='example.com', path='{x}',
+                          url=[r'https?://[a-z.]+/any/(\d+)']),
+        'ex': site_class('Ex', host='example.com', path='{x}',
+                         url=[r'https?://(?:www\.)?example\.com/\w+/(\d+)']),
+        'sub': site_class('Sub', host='a.example.com', path='{x}',
+                          url=[r'https?://a\.example\.com/(\d+)']),
+        'none': site_class('None', host='example.com', path='{x}'),
+    }
+    matcher = SiteMatcher(sites)
+
+    def reference(url):
+        for k, scls in sites.items():
+            if (v := scls.match_url(url)):
+                return k, str(v)
+        return None, None
+
+    urls = [
+        'https://example.com/any/1', 'https://www.example.com/any/2',
+        'https://www.example.com/p/3', 'https://a.example.com/4',
+        'https://b.example.com/p/5', 'https://other.org/p/6',
+        'https://EXAMPLE.com/p/7', 'not a url',
+    ]
+    got = [(k, v if v is None else str(v)) for k, v in matcher.match_urls(urls)]
+    assert got == [reference(url) for url in urls]
+    assert got[0] == ('any', '1')
+    assert got[2] == ('ex', '3')
+    assert type(matcher.match(urls[3])[1]).__name__ == 'Sub'
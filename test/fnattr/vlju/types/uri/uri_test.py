@@ -10,7 +10,7 @@ import pytest
 
 from fnattr.util.pytestutil import im2p, it2p
 from fnattr.vlju import Vlju
-from fnattr.vlju.types.uri import URI, Authority
+from fnattr.vlju.types.uri import URI, Authority, auth
 from fnattr.vlju.types.url import URL
 
 # fmt: off
@@ -46,6 +46,23 @@ def test_authority_eq(host, port, user, pw, auth):
     assert b == a
     assert a != c
     assert c != a
+    assert hash(a) == hash(b)
+
+def test_authority_immutable():
+    a = Authority('example.com')
+    with pytest.raises(AttributeError, match='read-only'):
+        a.host = 'example.org'
+
+def test_authority_shared():
+    assert auth('example.com') is auth('example.com')
+    assert auth('example.com') == Authority('example.com')
+    a = Authority('example.com')
+    assert auth(a) is a
+    assert auth(None) is None
+    u1 = URI('https://example.com/one')
+    u2 = URI('https://example.com/two')
+    assert u1.authority() is u2.authority()
+    assert not hasattr(u1, '__dict__')
 
 @pytest.mark.parametrize(*it2p(AUTHORITY_CASES, ['auth']))
 def test_authority_wrap(auth):
@@ -190,6 +207,8 @@ def test_uri_eq(cls, inp):
     assert u1 == u2
     assert u1 != u3
     assert u1 != v
+    assert hash(u1) == hash(u2)
+    assert len({u1, u2, u3}) == 2
 
 @pytest.mark.parametrize('cls', [URI, URL])
 @pytest.mark.parametrize(*im2p(URI_CASES, ['inp']))
@@ -199,6 +218,20 @@ def test_uri_copy(cls, inp):
     assert u1 is not u2
     assert u1 == u2
 
+def test_uri_string_cached():
+    u = URI('https://user@example.com/a path?q=1#f')
+    s = u.uri()
+    assert u.uri() is s
+    assert str(u) is s
+    assert u.lv() is s
+    assert u.uri('/other') == 'https://user@example.com/other?q=1#f'
+    assert u.uri() is s
+    with pytest.raises(AttributeError, match='read-only'):
+        u._uri = 'x'    # noqa: SLF001
+    a = u.authority()
+    assert a is not None
+    assert str(a) is str(a)
+
 def test_uri_bad_cast():
     a = URI('file:///etc/passwd')
     with pytest.raises(TypeError):
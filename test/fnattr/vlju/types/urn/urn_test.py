@@ -27,6 +27,8 @@ def test_urn():
     u4 = copy.copy(u3)
     assert u4 is not u3
     assert u4 == u3
+    assert hash(u4) == hash(u3)
+    assert len({u1, u3, u4}) == 2
     assert str(u4) == 'urn:kind:v/%3F/a/%23/l/(u)/e?+r?=q'
 
     v = Vlju('v')
@@ -28,6 +28,24 @@ def test_vlju_eq():
     assert w == v
     assert w != 'one'
 
+def test_vlju_hash():
+    assert hash(Vlju('one')) == hash(Vlju('one'))
+    assert len({Vlju('one'), Vlju('one'), Vlju('two')}) == 2
+
+def test_vlju_immutable():
+    v = Vlju('one')
+    with pytest.raises(AttributeError, match='read-only'):
+        v._value = 'two'    # noqa: SLF001
+    with pytest.raises(AttributeError, match='read-only'):
+        del v._value        # noqa: SLF001
+    assert str(v) == 'one'
+
+def test_vlju_slots():
+    v = Vlju('one')
+    assert not hasattr(v, '__dict__')
+    hash(v)
+    assert not hasattr(v, '__dict__')
+
 def test_vlju_repr():
     v = Vlju('one')
     assert repr(v) == "Vlju('one')"
@@ -16,7 +16,13 @@ from fnattr.util.error import Error
 from fnattr.util.registry import Registry
 from fnattr.vlju.testutil import CastParams
 from fnattr.vlju.types.all import ISBN, URL, File
+from fnattr.vlju.types.site import site_class
 from fnattr.vljum.m import M, V
+from fnattr.vljumap.factory import (
+    InterningFactory,
+    LazyFactory,
+    LooseMappedFactory,
+)
 
 class TstVlju(V):
     """Vlju subclass for testing."""
@@ -62,6 +68,64 @@ def test_configure_sites():
     assert k is None
     assert v is None
 
+    r = N.match_urls(['http://example.com/a/1/b', 'http://example.com/a/'])
+    assert [(k, str(v)) for k, v in r] == [('test', '1'), (None, 'None')]
+
+    N.configure_sites({
+        'test2': {
+            'name': 'SiteTest2',
+            'host': 'example.org',
+            'path': 'c/{x}',
+            'url': [r'https?://example\.org/c/(\d+)'],
+        },
+    })
+    k, v = N.from_site_url('https://example.org/c/5')
+    assert k == 'test2'
+    assert str(v) == '5'
+
+def test_configure_sites_clears_interned():
+
+    class N(M):
+        strict_factory = deepcopy(M.strict_factory)
+        loose_factory = LooseMappedFactory(M.loose_factory.kmap)
+        interned_factory = InterningFactory(loose_factory)
+        lazy_factory = LazyFactory(loose_factory)
+        site_classes: dict = {}
+
+    _, old = N.interned_factory('tsite', '123')
+    assert type(old) is V
+    N.configure_sites({
+        'tsite': {
+            'name': 'SiteTst',
+            'host': 'example.net',
+            'path': 'a/{x}',
+        },
+    })
+    k, v = N.interned_factory('tsite', '123')
+    assert k == 'tsite'
+    assert type(v).__name__ == 'SiteTst'
+    assert v is not old
+    assert 'tsite' not in M.strict_factory.kmap
+    assert 'tsite' not in M.loose_factory.kmap
+
+def test_site_matcher_follows_site_classes():
+
+    class N(M):
+        site_classes: dict = {}
+
+    url = 'http://example.net/a/1'
+    assert N.from_site_url(url) == (None, None)
+    N.site_classes['tsite'] = site_class(
+        'SiteTst',
+        'example.net',
+        'a/{x}',
+        url=[r'https?://example\.net/a/(\d+)'])
+    k, v = N.from_site_url(url)
+    assert k == 'tsite'
+    assert str(v) == '1'
+    N.site_classes.clear()
+    assert N.from_site_url(url) == (None, None)
+
 def test_m_construct_vljumap():
     m = M().add('key', 'value').add('key', 'two')
     mm = M(m)
@@ -133,6 +197,14 @@ def test_m_extract():
     assert str(m['key'][0]) == 'value'
     assert str(m['isbn'][0]) == '9781234567897'
 
+def test_m_extract_independent():
+    m = M().decode('[a=A; a=B; isbn=1234567890]')
+    e = m.extract('a')
+    e['a'].pop()
+    e.add('a', 'C')
+    assert [str(v) for v in m['a']] == ['A', 'B']
+    assert [str(v) for v in e['a']] == ['A', 'C']
+
 def test_m_file():
     p = '/blah/Title [isbn=1234567890].pdf'
     m = M().file(p)
@@ -273,3 +273,65 @@ def test_runner_help_unknown_command(capsys):
     r.runs('help asdfjkl')
     captured = capsys.readouterr()
     assert 'COMMANDS' in captured.out
+
+def test_run_batch(caplog):
+    out = fnattr.util.pytestutil.stringio()
+    n = fnattr.vljum.runner.run_batch(['add', 'x', '1'],
+                                      ['a.pdf', 'b [y=2].pdf'],
+                                      out)
+    assert n == 0
+    assert out.getvalue() == 'a [x=1].pdf\nb [y=2; x=1].pdf\n'
+    assert caplog.text == ''
+
+def test_run_batch_failure(caplog):
+    out = fnattr.util.pytestutil.stringio()
+    n = fnattr.vljum.runner.run_batch(['strict', 'add', 'isbn', '1'],
+                                      ['a.pdf', 'b [x=1].pdf'],
+                                      out)
+    assert n == 2
+    assert out.getvalue() == ''
+    assert 'a.pdf: isbn 1' in caplog.text
+    assert 'b [x=1].pdf: isbn 1' in caplog.text
+
+def test_run_batch_compile_error(caplog):
+    out = fnattr.util.pytestutil.stringio()
+    with pytest.raises(Error, match='encoder: expected one'):
+        fnattr.vljum.runner.run_batch(['encoder', 'lalala'],
+                                      unreachable_files(),
+                                      out)
+    assert out.getvalue() == ''
+
+def unreachable_files() -> Iterable[str]:
+    raise AssertionError
+    yield ''    # pragma: no cover
+
+def test_runner_compile():
+    program = fnattr.vljum.runner.Runner().compile(['add', 'x', '1', 'v2'])
+    assert [(op.name, op.args) for op in program] == [('add', ('x', '1')),
+                                                      ('v2', ())]
+    for pairs, expect in ((MK_IN[: 1], '{x=2;x=1}'), ([], '{x=1}')):
+        r = mk(pairs)
+        r.execute(program)
+        assert r.m.encode() == expect
+
+def test_runner_compile_error_before_execution():
+    r = mk(MK_IN)
+    with pytest.raises(Error, match='set: expected value'):
+        r.runs('delete x set y')
+    assert r.m.encode() == MK_V3
+
+def test_runner_command_table_cached():
+    r1 = fnattr.vljum.runner.Runner()
+    r2 = fnattr.vljum.runner.Runner()
+    assert r1.command_table() is r2.command_table()
+    assert r1.commands['add'] is fnattr.vljum.runner.Runner.command_add
+
+def test_runner_subclass_command_table():
+
+    class Sub(fnattr.vljum.runner.Runner):
+
+        def command_hello(self, _: str) -> None:
+            self.write('hello')
+
+    assert 'hello' in Sub.command_table()
+    assert 'hello' not in fnattr.vljum.runner.Runner.command_table()
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: MIT
+"""Test VljuBatch."""
+
+from pathlib import Path
+
+from fnattr.vlju import Vlju
+from fnattr.vlju.types.all import VLJU_TYPES
+from fnattr.vlju.types.doi import DOI
+from fnattr.vlju.types.ean.isbn import ISBN
+from fnattr.vlju.types.site import site_class
+from fnattr.vljumap import VljuMap, enc
+from fnattr.vljumap.batch import VljuBatch, typed_factory
+from fnattr.vljumap.factory import (
+    LazyFactory,
+    LooseMappedFactory,
+    MappedFactory,
+    default_factory,
+)
+
+FACTORY = MappedFactory({'isbn': ISBN, 'doi': DOI})
+
+NAMES = [
+    'Title [a=Alice; isbn=1234567890]',
+    '1. Other - Sub [a=Bob; a=Alice; doi=10.1234/abc]',
+    'Plain',
+    'Again [a=Bob; isbn=9781234567897; isbn=1234567890]',
+]
+
+def test_batch_roundtrip():
+    b = VljuBatch.from_names(NAMES, factory=FACTORY)
+    assert b.nfiles == len(NAMES)
+    assert b.names == NAMES
+    for i, s in enumerate(NAMES):
+        expect = enc.v3.decode(VljuMap(), s, FACTORY)
+        assert b.to_map(i, FACTORY) == expect
+    maps = list(b.to_maps(FACTORY))
+    assert maps[2] == VljuMap().add('title', Vlju('Plain'))
+
+def test_batch_shared_strings():
+    b = VljuBatch.from_names(NAMES, factory=FACTORY)
+    assert b.keys == ['title', 'a', 'isbn', 'n', 'doi']
+    assert b.values.count('Alice') == 1
+    assert b.values.count('9781234567897') == 1
+    # Duplicate values within a file are dropped, as in a VljuMap.
+    assert len(list(b.pairs(3))) == 3
+
+def test_batch_typed():
+    b = VljuBatch.from_names(NAMES, factory=FACTORY)
+    vc = b.value_code('9781234567897')
+    assert vc is not None
+    assert b.isbn[vc] == 9781234567897
+    assert b.doi_prefix[vc] == -1
+    vc = b.value_code('10.1234,abc')
+    assert vc is not None
+    assert b.prefixes[b.doi_prefix[vc]] == '10.1234'
+    assert b.isbn[b.value_code('Alice')] == -1
+
+    u = VljuBatch.from_names(NAMES, factory=FACTORY, typed=False)
+    assert len(u.isbn) == 0
+    assert u.value == b.value
+
+def test_batch_default_factory():
+    b = VljuBatch.from_names(NAMES)
+    assert b.factory is typed_factory()
+    assert b.isbn[b.value_code('9781234567897')] == 9781234567897
+    assert b.prefixes == ['10.1234']
+    assert b.to_map(1) == enc.v3.decode(VljuMap(), NAMES[1], typed_factory())
+    u = VljuBatch.from_names(NAMES, typed=False)
+    assert u.factory is default_factory
+    assert u.to_map(1) == enc.v3.decode(VljuMap(), NAMES[1], default_factory)
+
+def test_batch_site_factory():
+    scls = site_class('SiteTst', 'example.net', 'a/{x}')
+    names = ['Title [tsite=123]']
+    b = VljuBatch.from_names(names)
+    assert type(b.to_map(0)['tsite'][0]) is Vlju
+    f = LooseMappedFactory(VLJU_TYPES).setitem('tsite', scls)
+    b = VljuBatch.from_names(names, factory=f)
+    assert type(b.to_map(0)['tsite'][0]) is scls
+
+def test_batch_lazy():
+    b = VljuBatch.from_names(NAMES, factory=FACTORY)
+    c = VljuBatch.from_names(NAMES, factory=LazyFactory(FACTORY))
+    assert c.values == b.values
+    assert c.isbn == b.isbn
+    assert c.doi_prefix == b.doi_prefix
+
+def test_batch_query():
+    b = VljuBatch.from_names(NAMES, factory=FACTORY)
+    assert b.files('a') == [0, 1, 3]
+    assert b.files('a', 'Bob') == [1, 3]
+    assert b.files('a', 'Carol') == []
+    assert b.files('lccn') == []
+    assert [b.file[i] for i in b.where('isbn')] == [0, 3]
+    assert b.group('a') == {'Alice': [0, 1], 'Bob': [1, 3]}
+    assert b.group('isbn') == {'9781234567897': [0, 3]}
+    assert b.count() == {'title': 5, 'a': 4, 'isbn': 2, 'n': 1, 'doi': 1}
+    for k in b.keys:
+        assert b.where(k) == [i for i in range(len(b))
+                              if b.keys[b.key[i]] == k]
+
+def test_batch_add_map_and_file():
+    b = VljuBatch(keep_names=False)
+    m = enc.v3.decode(VljuMap(), NAMES[1], typed_factory())
+    assert b.add_map(m) == 0
+    assert b.add_file(Path('/dir') / f'{NAMES[0]}.pdf') == 1
+    assert b.names is None
+    assert b.to_map(0) == m
+    assert dict(b.pairs(1))['isbn'] == '9781234567897'
+    assert len(b) == 9
@@ -2,11 +2,17 @@
 """Test encoding and decoding VljuMap."""
 
 import pathlib
+import random
+import timeit
+import warnings
 
 import pytest
 
+from fnattr.extra import bench
+
 from fnattr.vlju import Vlju
 from fnattr.vlju.types.doi import DOI
+from fnattr.vljum.m import M
 from fnattr.vljumap import VljuMap, enc
 
 class TstEncVlju(Vlju):
@@ -196,6 +202,25 @@ def test_encode(m, v, e):
     if v in enc.encoder:
         assert enc.encoder[v].encode(m, None) == e
 
+def test_encode_many():
+    maps = [d['MAP'] for d in CASES.values()]
+    for e in enc.encoder.values():
+        assert list(e.encode_many(maps)) == [e.encode(m, None) for m in maps]
+        assert list(e.encode_many(maps, 'long')) == [
+            e.encode(m, 'long') for m in maps
+        ]
+
+CASES_KEY_DUPLICATE = [('n', ''), ('title', 'A - B'), ('a', 'x'), ('a', 'x')]
+
+def test_v3_encode_matches_reference():
+    maps = [VljuMap().add_pairs(CASES_KEY_DUPLICATE)] + [
+        M().decode(s) for s in bench.corpus(500)
+    ]
+    for config in (enc.V3_CONFIG, enc.V2_CONFIG, enc.WIN_CONFIG):
+        for m in maps:
+            assert enc._v3_enc(config, m,
+                               None) == bench.reference_v3_enc(config, m, None)
+
 CASES_MVE_DECODE = filter(lambda t: t[1] not in ('sfc', 'sh', 'v0', 'value'),
                           CASES_MVE_ENCODE)
 
@@ -221,6 +246,86 @@ def test_v3_decode_missing_close():
 def test_v3_decode_empty_key():
     assert enc.v3.decode(VljuMap(), '[=1]', TstEncVlju.factory) == VljuMap()
 
+def v3_dec_result(f, config, s):
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        try:
+            pairs = list(f(config, s))
+        except IndexError:
+            pairs = None
+    return pairs, [str(i.message) for i in w]
+
+V3_FUZZ_ALPHABET = ('1', '2', 'a', 'Z', 'é', ' ', '  ', '.', '-', ' - ', '[',
+                    ']', '{', '}', ';', '; ', '=', '%', '%41', '%3B', ',')
+
+@pytest.mark.parametrize('config',
+                         [enc.V3_CONFIG, enc.V2_CONFIG, enc.WIN_CONFIG])
+def test_v3_decode_matches_reference(config):
+    rng = random.Random(3)
+    strings = bench.corpus(500) + [
+        ''.join(rng.choices(V3_FUZZ_ALPHABET, k=rng.randint(0, 12)))
+        for _ in range(10_000)
+    ]
+    for s in strings:
+        expect, expect_warnings = v3_dec_result(bench.reference_v3_dec_iter,
+                                                config, s)
+        if expect is None:
+            # The reference decoder fails on some sequence-only strings.
+            continue
+        assert v3_dec_result(enc._v3_dec_iter, config,
+                             s) == (expect, expect_warnings), s
+
+@pytest.mark.parametrize(('s', 'expect'), [
+    ('1.', [('n', '1')]),
+    ('1.2.', [('n', '1'), ('n', '2')]),
+    ('1.a.', [('title', '1.a.')]),
+])
+def test_v3_decode_sequence_only(s, expect):
+    assert list(enc._v3_dec_iter(enc.V3_CONFIG, s)) == expect
+
+TAIL_FUZZ_ALPHABET = ('1', '2', '9', '0', 'X', 'x', '٣', '_', 'a', ' ', '\n',
+                      '-', '=', 'th', ' edition', '1999', 'lccn=', '0123456789',
+                      '9780123456786', ' by ')
+
+def tail_fuzz_strings(n):
+    rng = random.Random(5)
+    for _ in range(n):
+        yield ''.join(rng.choices(TAIL_FUZZ_ALPHABET, k=rng.randint(0, 10)))
+
+def result_or_exception(f, *args):
+    try:
+        return f(*args)
+    except Exception as e:  # noqa: blind-except
+        return type(e)
+
+def test_sfc_decode_tail_matches_reference():
+    for s in tail_fuzz_strings(20_000):
+        assert result_or_exception(
+            enc._sfc_dec_tail,
+            s) == result_or_exception(bench.reference_sfc_dec_tail, s), s
+
+def test_v0_decode_tail_matches_reference():
+    for s in tail_fuzz_strings(20_000):
+        assert enc._v0_dec_tail(s) == bench.reference_v0_dec_tail(s), s
+
+def best_time(f, *args):
+    return min(timeit.repeat(lambda: f(*args), number=1, repeat=5))
+
+def test_sfc_decode_tail_linear():
+    short = bench.sfc_adversarial(1000)
+    long = bench.sfc_adversarial(16_000)
+    assert len(enc._sfc_dec_tail(long)[0]) == 16_000
+    # Linear time would give a ratio of 16; quadratic, 256.
+    assert best_time(enc._sfc_dec_tail, long) < 64 * best_time(
+        enc._sfc_dec_tail, short)
+
+def test_v0_decode_tail_linear():
+    short = 'x ' + 'alccn=' * 1000
+    long = 'x ' + 'alccn=' * 16_000
+    assert enc._v0_dec_tail(long) is None
+    assert best_time(enc._v0_dec_tail, long) < 64 * best_time(
+        enc._v0_dec_tail, short)
+
 @pytest.mark.parametrize(('e', 'config'),
                          [
                              (enc.v3, enc.V3_CONFIG),
@@ -264,6 +369,13 @@ def test_sfc_decode():
                           TstEncVlju.factory) == CASES['D']['MAP'].submap(
                               ['title', 'a', 'isbn', 'edition', 'date'])
 
+def test_sfc_decode_isbn10_tail():
+    m = enc.sfc.decode(VljuMap(), 'Title by Author 080442957X',
+                       TstEncVlju.factory)
+    assert sorted(m.keys()) == ['a', 'isbn', 'title']
+    assert str(m['a'][0]) == 'Author'
+    assert str(m['isbn'][0]) == '080442957X'
+
 def test_json_encode():
     assert enc.json.encode(CASES['A']['MAP'], None) == CASES['A']['json']
     assert enc.json.encode(CASES['B']['MAP'], None) == CASES['B']['json']
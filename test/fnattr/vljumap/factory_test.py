@@ -1,19 +1,29 @@
 # SPDX-License-Identifier: MIT
 """Test VljuFactory."""
 
+import gc
+
 import pytest
 
 from fnattr.util.pytestutil import it2p
 from fnattr.vlju import Vlju
+from fnattr.vlju.types.doi import DOI
 from fnattr.vlju.types.ean import EAN13
 from fnattr.vlju.types.ean.isbn import ISBN
 from fnattr.vlju.types.ean.ismn import ISMN
 from fnattr.vlju.types.ean.issn import ISSN
+from fnattr.vlju.types.file import File
+from fnattr.vlju.types.uri import URI
+from fnattr.vlju.types.urn import URN
 from fnattr.vljumap.factory import (
     FactoryError,
+    InterningFactory,
+    LazyFactory,
+    LazyVlju,
     LooseMappedFactory,
     MappedFactory,
 )
+from fnattr.vljumap import VljuMap, enc
 
 # fmt: off
 CASES = [
@@ -57,3 +67,176 @@ def test_loose_mapped_factory(loose_factory):
     _, v = loose_factory('isbn', '123')
     assert type(v) == Vlju  # pylint: disable=unidiomatic-typecheck
     assert str(v) == '123'
+
+def test_loose_mapped_factory_fallbacks(loose_factory):
+    _, a = loose_factory('isbn', '123')
+    _, b = loose_factory('isbn', '123')
+    _, c = loose_factory('isbn', '9780804429573')
+    _, d = loose_factory('isbn', '9780804429573')
+    _ = loose_factory('ismn', 'M-1')
+    _ = loose_factory('other', 'thing')
+    assert a is b
+    assert c is d
+    assert type(c) == ISBN  # pylint: disable=unidiomatic-typecheck
+    assert loose_factory.fallbacks == {'isbn': 2, 'ismn': 1}
+    info = loose_factory.cache_info()
+    assert (info.hits, info.misses) == (2, 3)
+    loose_factory.clear()
+    assert not loose_factory.fallbacks
+    assert loose_factory.cache_info().currsize == 0
+
+def test_loose_mapped_factory_setitem(loose_factory):
+    _, v = loose_factory('isbn', '9780804429573')
+    assert type(v) == ISBN  # pylint: disable=unidiomatic-typecheck
+    loose_factory.setitem('isbn', EAN13)
+    _, v = loose_factory('isbn', '9780804429573')
+    assert type(v) == EAN13  # pylint: disable=unidiomatic-typecheck
+
+# fmt: off
+TRY_PARSE_CASES = [
+    ('cls',     'good',                 'bad'),
+    (EAN13,     '4534530128942',        '45345301289'),
+    (ISBN,      '0-8044-2957-X',        '9790692006282'),
+    (ISMN,      'M-692-00628-2',        '9780804429573'),
+    (ISSN,      '1351-5381',            '1351-538'),
+    (DOI,       'doi:10.1234/abc',      '10..1234/abc'),
+    (Vlju,      'anything',             1),
+]
+# fmt: on
+
+@pytest.mark.parametrize(*it2p(TRY_PARSE_CASES))
+def test_try_parse(cls, good, bad):
+    assert cls.try_parse(good) == cls(good)
+    assert cls.try_parse(bad) is None
+    with pytest.raises((ValueError, TypeError)):
+        _ = cls(bad)
+
+def test_interning_factory(factory):
+    f = InterningFactory(factory)
+    k1, v1 = f('isbn', '9780804429573')
+    k2, v2 = f(''.join(['is', 'bn']), '9780804429573')
+    assert k1 is k2
+    assert v1 is v2
+    assert type(v1) == ISBN     # pylint: disable=unidiomatic-typecheck
+    _, v3 = f('ean13', '9780804429573')
+    assert v3 is not v1
+    stats = f.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+    assert stats.hit_rate() == 1 / 3
+    f.clear()
+    assert f.stats() == (0, 0, 0)
+    assert f.stats().hit_rate() == 0.0
+
+def test_interning_factory_weak(factory):
+    f = InterningFactory(factory)
+    _, v = f('other', 'thing')
+    assert f.stats().size == 1
+    del v
+    gc.collect()
+    assert f.stats().size == 0
+    f('other', 'thing')
+    assert f.stats().misses == 2
+
+def test_interning_factory_maxsize(factory):
+    f = InterningFactory(factory, maxsize=2)
+    held = [f('k', str(i))[1] for i in range(4)]
+    assert f.stats().size == 2
+    assert f('k', '0')[1] is held[0]
+    assert f('k', '3')[1] is not held[3]
+
+def test_interning_factory_error():
+    f = InterningFactory(MappedFactory({'isbn': ISBN}))
+    for _ in range(2):
+        with pytest.raises(FactoryError):
+            f('isbn', '1')
+    assert f.stats() == (0, 2, 0)
+
+def test_lazy_factory(loose_factory):
+    f = LazyFactory(loose_factory)
+    _, v = f('isbn', '080442957X')
+    assert isinstance(v, LazyVlju)
+    assert not v.is_typed()
+    assert v.raw() == '080442957X'
+    assert str(v) == '9780804429573'
+    assert v.is_typed()
+    assert type(v.typed()) == ISBN  # pylint: disable=unidiomatic-typecheck
+    assert v.isbn10() == '080442957X'
+    assert int(v) == 9780804429573
+    assert v.lv() == 'urn:isbn:9780804429573'
+    assert v.get('repr') == repr(ISBN('9780804429573'))
+    _, u = f('other', 'thing')
+    assert type(u) == Vlju  # pylint: disable=unidiomatic-typecheck
+    assert u.typed() is u
+
+def test_lazy_factory_reuses_typed(loose_factory):
+    f = LazyFactory(loose_factory, maxsize=1)
+    _, v = f('isbn', '080442957X')
+    t = v.typed()
+    assert f('isbn', '080442957X')[1] is t
+    _, w = f('isbn', '9780804429580')
+    _ = w.typed()
+    assert isinstance(f('isbn', '9780804429580')[1], LazyVlju)
+    f.clear()
+    assert isinstance(f('isbn', '080442957X')[1], LazyVlju)
+
+def test_lazy_factory_invalid(loose_factory):
+    f = LazyFactory(loose_factory)
+    _, v = f('isbn', '123')
+    assert str(v) == '123'
+    assert type(v.typed()) == Vlju  # pylint: disable=unidiomatic-typecheck
+    with pytest.raises(AttributeError):
+        _ = v.isbn10()
+    with pytest.raises(FactoryError):
+        _ = str(LazyFactory(MappedFactory({'isbn': ISBN}))('isbn', '123')[1])
+
+def test_lazy_factory_eq(loose_factory):
+    f = LazyFactory(loose_factory)
+    _, a = f('isbn', '080442957X')
+    _, b = f('isbn', '080442957X')
+    assert a == b
+    assert not a.is_typed()
+    _, c = f('isbn', '9780804429573')
+    assert a == c
+    assert c == ISBN('9780804429573')
+    assert hash(a) == hash(c) == hash(ISBN('9780804429573'))
+    _, d = f('isbn', '9780804429580')
+    assert a != d
+
+@pytest.mark.parametrize(('k', 'cls', 's'), [
+    ('isbn', ISBN, '080442957X'),
+    ('doi', DOI, '10.1234/abc'),
+    ('uri', URI, 'https://example.com/a'),
+    ('urn', URN, 'urn:x:y'),
+    ('file', File, '/a/b'),
+])
+def test_lazy_factory_eq_symmetric(k, cls, s):
+    f = LazyFactory(MappedFactory({k: cls}))
+    _, lazy = f(k, s)
+    _, typed = f.factory(k, s)
+    assert typed == lazy
+    assert lazy == typed
+    assert not typed != lazy    # noqa: SIM202
+    assert len({typed, lazy}) == len({lazy, typed}) == 1
+    for first, second in ((typed, lazy), (lazy, typed)):
+        m = VljuMap()
+        m.add(k, first)
+        m.add(k, second)
+        assert m[k] == [first]
+
+ROUNDTRIP = [
+    'Title [isbn=080442957X; a=Someone]',
+    'Paper [doi=10.1234/ABC; doi=10.1234/abc; lccn=89-456]',
+    'Odd [isbn=123; ismn=979-0-692-00628-2; issn=1351-5381]',
+    '1. Plain',
+]
+
+@pytest.mark.parametrize('mode', ['short', 'long', 'repr'])
+def test_lazy_factory_roundtrip(loose_factory, mode):
+    loose_factory.setitem('doi', DOI)
+    lazy = LazyFactory(loose_factory)
+    for s in ROUNDTRIP:
+        m = enc.v3.decode(VljuMap(), s, loose_factory)
+        n = enc.v3.decode(VljuMap(), s, lazy)
+        assert enc.v3.encode(n, mode) == enc.v3.encode(m, mode)
+        assert enc.json.encode(n, mode) == enc.json.encode(m, mode)
+        assert n == m
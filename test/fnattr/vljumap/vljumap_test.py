@@ -15,6 +15,12 @@ CASES_KEY_VALUE = [(k, v) for k, vs in CASES_KEY_LIST.items() for v in vs]
 
 VX = Vlju('X')
 
+class TstVljuX(Vlju):
+    """Vlju that always converts to the string ‘X’."""
+
+    def __str__(self) -> str:
+        return 'X'
+
 def vx_factory(k: str, _: str) -> tuple[str, Vlju]:
     return (k, VX)
 
@@ -50,3 +56,21 @@ def test_vljumap_to_strings():
     for k, v in n.to_strings().pairs():
         assert k in CASES_KEY_LIST
         assert v in CASES_KEY_LIST[k]
+
+def test_vljumap_to_strings_unique():
+    n = VljuMap().add('a', Vlju('x')).add('a', VX).add('b', VX)
+    n.add('a', TstVljuX('y'))
+    n.add('c', VX).remove('c', VX)
+    assert n.to_strings().data == {'a': ['x', 'X'], 'b': ['X']}
+
+def test_vljumap_string_lists():
+    n = VljuMap().add('a', Vlju('x')).add('a', VX).add('b', VX)
+    n.add('a', TstVljuX('y'))
+    n.add('c', VX).remove('c', VX)
+    assert list(n.string_lists()) == [('a', ['x', 'X']), ('b', ['X'])]
+
+def test_vljumap_strings():
+    n = VljuMap().add('a', Vlju('x')).add('a', VX).add('a', TstVljuX('y'))
+    assert n.strings('a') == ['x', 'X']
+    assert n.strings('b') == []
+    assert 'b' not in n.keys()